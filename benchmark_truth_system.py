@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+Benchmarks do Sistema de Verificação de Veracidade.
+
+Uso:
+    python benchmark_truth_system.py lsh --evidences 20000 --bands 48 --rows 3
+    python benchmark_truth_system.py suite --sizes 1000,100000,1000000 --output resultados.json
+    python benchmark_truth_system.py memory --evidences 20000
+    python benchmark_truth_system.py tokenizer --documents 20000
+    python benchmark_truth_system.py snapshot --evidences 100000
+    python benchmark_truth_system.py pruning --evidences 50000
+    python benchmark_truth_system.py budget --evidences 50000 --resident 5000
+    python benchmark_truth_system.py early-exit --evidences 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from truth_verification_system import (
+    AuditLogger,
+    CompactEvidenceCorpus,
+    EvidenceCorpus,
+    EvidenceType,
+    IngestionEngine,
+    MemoryBudget,
+    MinHashLSH,
+    PortugueseTokenizer,
+    SimpleTokenizer,
+    TruthSeeker,
+    TruthVerificationSystem,
+    VerificationResult,
+)
+
+
+# ============================================================================
+# GERADOR SINTÉTICO (CENÁRIO AMPARO DIGITAL)
+# ============================================================================
+
+PROJECTS = [
+    "Amparo Digital", "Conecta Cidadão", "Saúde em Rede", "Escola Sem Papel",
+    "Cidade Inteligente", "Gestão Transparente", "Arquivo Vivo", "Atende Mais",
+]
+
+# (termo no texto, chave na API, valor de referência em %)
+METRICS = [
+    ("redução no consumo de papel", "papel_reduzido_percentual", 70.0),
+    ("processos administrativos digitalizados", "processos_digitalizados_percentual", 85.0),
+    ("atendimentos concluídos no prazo", "atendimentos_no_prazo_percentual", 92.0),
+    ("economia com material de escritório", "economia_material_percentual", 35.0),
+]
+
+SENDERS = ["joao.silva", "maria.souza", "ana.lima", "carlos.pereira", "fernanda.costa"]
+
+
+def generate_amparo_corpus(count: int, seed: int = 42) -> Iterator[Tuple[str, EvidenceType, Dict[str, Any]]]:
+    """
+    Gera (conteúdo, tipo, metadados) de forma determinística: ~50% emails,
+    ~30% anexos (atas/relatórios) e ~20% respostas JSON de API, com valores
+    espalhados em torno da referência de cada métrica.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        project = rng.choice(PROJECTS)
+        term, api_key, reference = rng.choice(METRICS)
+        value = round(min(100.0, max(0.0, rng.gauss(reference, 4.0))), 1)
+        quarter = f"{rng.randint(2021, 2025)}-Q{rng.randint(1, 4)}"
+        kind = rng.random()
+        if kind < 0.5:
+            sender = rng.choice(SENDERS)
+            yield (
+                f"Prezados, compartilho os resultados do projeto {project} em {quarter}. "
+                f"Registramos {term} de aproximadamente {value}%. A equipe está de parabéns!",
+                EvidenceType.EMAIL,
+                {"sender": f"{sender}@{project.lower().replace(' ', '')}.org",
+                 "subject": f"Resultados {quarter} - {project}", "seq": i},
+            )
+        elif kind < 0.8:
+            yield (
+                f"ATA DE REUNIÃO - COMITÊ DE ACOMPANHAMENTO. Pauta: avaliação do {project}. "
+                f"Foi apresentado relatório indicando {term} de {value}% no período {quarter}.",
+                EvidenceType.ATTACHMENT,
+                {"file_type": rng.choice(["PDF", "DOCX"]), "pages": rng.randint(1, 20), "seq": i},
+            )
+        else:
+            yield (
+                json.dumps({"project": project, "period": quarter, "metrics": {api_key: value}},
+                           ensure_ascii=False),
+                EvidenceType.EXTERNAL_API,
+                {"api_endpoint": "finance.api/reports", "confidence": round(rng.uniform(0.5, 1.0), 2), "seq": i},
+            )
+
+
+def generate_claims(count: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """Claims (tipo, texto) numéricas e textuais alternadas, sobre o mesmo vocabulário."""
+    rng = random.Random(seed + 1)
+    claims = []
+    for i in range(count):
+        project = rng.choice(PROJECTS)
+        term, _, reference = rng.choice(METRICS)
+        if i % 2 == 0:
+            value = round(reference + rng.uniform(-8.0, 8.0))
+            claims.append(("numeric", f"O projeto {project} alcançou {term} de {value}%"))
+        else:
+            claims.append(("textual", f"O projeto {project} apresentou {term} segundo a equipe"))
+    return claims
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def _synthetic_texts(count: int, seed: int) -> List[str]:
+    """Textos curtos sobre um vocabulário com frequência tipo Zipf."""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = [
+        "termo" + letters[i // 676] + letters[i // 26 % 26] + letters[i % 26]
+        for i in range(5000)
+    ]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return [
+        " ".join(rng.choices(vocabulary, weights=weights, k=rng.randint(4, 12)))
+        for _ in range(count)
+    ]
+
+
+def benchmark_lsh_recall(
+    evidences: int = 20000,
+    claims: int = 200,
+    bands: int = 48,
+    rows: int = 3,
+    seed: int = 7
+) -> Dict[str, Any]:
+    """
+    Mede o recall do MinHash/LSH contra o scorer exato.
+
+    Recall = fração das evidências de suporte (Jaccard > 0.3) do scorer
+    exato que também aparecem como suporte no modo aproximado.
+    """
+    rng = random.Random(seed)
+    texts = _synthetic_texts(evidences, seed)
+    system = TruthVerificationSystem()
+    lsh = MinHashLSH(bands=bands, rows=rows)
+    for text in texts:
+        evidence_id = system.add_text_evidence(text, EvidenceType.EMAIL)
+        lsh.add(evidence_id, system.evidences[evidence_id].features.keywords)
+
+    # Claims derivadas de evidências existentes, com parte das palavras trocada
+    claim_texts = []
+    for text in rng.sample(texts, claims):
+        words = text.split()
+        keep = words[:max(2, len(words) * 2 // 3)]
+        claim_texts.append(" ".join(keep + rng.sample(texts, 1)[0].split()[:2]))
+
+    seeker = system.truth_seeker
+    exact_supporting = approx_supporting = found = 0
+    exact_candidates = approx_candidates = 0
+    exact_seconds = approx_seconds = 0.0
+    verdicts_equal = 0
+    for claim in claim_texts:
+        keywords = seeker._extract_keywords(claim)
+        exact_candidates += len(system.index.candidates(keywords))
+        approx_candidates += len(lsh.candidates(keywords))
+
+        start = time.perf_counter()
+        exact = seeker.evaluate_claim(claim, system.evidences, index=system.index)
+        exact_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        approx = seeker.evaluate_claim(claim, system.evidences, index=system.index, retriever=lsh)
+        approx_seconds += time.perf_counter() - start
+
+        exact_ids = set(exact.supporting_evidences)
+        exact_supporting += len(exact_ids)
+        approx_supporting += len(approx.supporting_evidences)
+        found += len(exact_ids & set(approx.supporting_evidences))
+        verdicts_equal += exact.status == approx.status
+    system.close()
+
+    return {
+        "benchmark": "lsh_recall",
+        "evidences": evidences,
+        "claims": claims,
+        "bands": bands,
+        "rows": rows,
+        "lsh_threshold": round(lsh.threshold, 4),
+        "recall": found / exact_supporting if exact_supporting else 1.0,
+        "verdict_agreement": verdicts_equal / claims,
+        "avg_candidates_exact": exact_candidates / claims,
+        "avg_candidates_lsh": approx_candidates / claims,
+        "avg_ms_exact": exact_seconds / claims * 1000,
+        "avg_ms_lsh": approx_seconds / claims * 1000,
+        "supporting_exact": exact_supporting,
+        "supporting_lsh": approx_supporting,
+    }
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Percentil por posição mais próxima (nearest-rank)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    samples_ms = sorted(samples_ms)
+    return {
+        "count": len(samples_ms),
+        "p50_ms": round(_percentile(samples_ms, 50), 4),
+        "p99_ms": round(_percentile(samples_ms, 99), 4),
+        "max_ms": round(samples_ms[-1], 4) if samples_ms else 0.0,
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 4) if samples_ms else 0.0,
+    }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pico de memória residente do processo (ru_maxrss: KB no Linux, bytes no macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+def benchmark_audit_writes(
+    rows: int = 2000,
+    results: Optional[List[VerificationResult]] = None
+) -> Dict[str, float]:
+    """
+    Custo por linha de log_verification: síncrono em memória vs buffer em
+    arquivo. `results` são registrados em rodízio (o custo depende do
+    tamanho dos traces); por padrão, uma claim contra 20 evidências.
+    """
+    if not results:
+        system = TruthVerificationSystem()
+        for content, source_type, metadata in generate_amparo_corpus(20):
+            system.add_text_evidence(content, source_type, metadata)
+        results = [system.truth_seeker.evaluate_claim(
+            generate_claims(1)[0][1], system.evidences, index=system.index
+        )]
+        system.close()
+
+    costs = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, logger in (
+            ("sync_memory", AuditLogger(":memory:")),
+            ("sync_file", AuditLogger(os.path.join(tmp, "sync.db"))),
+            ("buffered_file", AuditLogger(os.path.join(tmp, "buffered.db"), buffered=True)),
+        ):
+            start = time.perf_counter()
+            for i in range(rows):
+                result = results[i % len(results)]
+                logger.log_verification(result.claim_checked, result)
+            logger.close()
+            costs[f"{label}_us_per_row"] = round((time.perf_counter() - start) / rows * 1e6, 3)
+    return costs
+
+
+def _legacy_extract_keywords(text: str) -> List[str]:
+    """Cópia da extração de palavras-chave anterior ao subsistema de tokenização."""
+    cleaned = re.sub(r'[^\w\s]', ' ', text.lower())
+    words = cleaned.split()
+    stopwords = {'o', 'a', 'de', 'em', 'para', 'com', 'por', 'que', 'e', 'do', 'da'}
+    return [w for w in words if w not in stopwords and len(w) > 3]
+
+
+def benchmark_tokenizers(documents: int = 20000, seed: int = 42, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Vazão de tokenização em tokens/s (tokens = palavras de entrada separadas
+    por espaço, iguais para todos), melhor de `repeat` rodadas.
+    """
+    texts = [content for content, _, _ in generate_amparo_corpus(documents, seed)]
+    input_tokens = sum(len(text.split()) for text in texts)
+    simple = SimpleTokenizer()
+    portuguese = PortugueseTokenizer()
+    candidates = {
+        "legacy_function": lambda: [_legacy_extract_keywords(text) for text in texts],
+        "simple": lambda: [simple.tokenize(text) for text in texts],
+        "portuguese": lambda: [portuguese.tokenize(text) for text in texts],
+        "portuguese_batch": lambda: portuguese.tokenize_many(texts),
+    }
+    report: Dict[str, Any] = {"benchmark": "tokenizer", "documents": documents, "input_tokens": input_tokens}
+    for label, run in candidates.items():
+        best = min(_timed(run) for _ in range(repeat))
+        report[f"{label}_tokens_per_second"] = round(input_tokens / best)
+    report["simple_matches_legacy"] = all(
+        simple.tokenize(text) == _legacy_extract_keywords(text) for text in texts
+    )
+    return report
+
+
+def _timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def benchmark_memory(evidences: int = 20000, seed: int = 42) -> Dict[str, Any]:
+    """
+    Bytes por evidência retidos pelo corpus (tracemalloc), por representação:
+    dataclass Evidence num dict, CompactEvidenceCorpus e compacto com zlib.
+    Índices e auditoria ficam de fora (são iguais nas três).
+    """
+    engine = IngestionEngine(None, feature_extractor=TruthSeeker(None).extract_features)
+    report: Dict[str, Any] = {"benchmark": "memory", "evidences": evidences}
+    for label, factory in (
+        ("dataclass", EvidenceCorpus),
+        ("compact", CompactEvidenceCorpus),
+        ("compact_zlib", lambda: CompactEvidenceCorpus(compress_content=True)),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        corpus = factory()
+        for content, source_type, metadata in generate_amparo_corpus(evidences, seed):
+            evidence = engine._build_evidence(content, source_type, metadata)
+            corpus[evidence.id] = evidence
+        del evidence
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        report[f"{label}_bytes_per_evidence"] = round(retained / evidences, 1)
+        del corpus
+    return report
+
+
+def benchmark_scale(evidences: int, claims: int = 200, seed: int = 42) -> Dict[str, Any]:
+    """
+    Ingestão, latência de verify(), custo da auditoria (com os resultados
+    deste corpus) e pico de RSS para um tamanho de corpus.
+    """
+    system = TruthVerificationSystem()
+    ingest_seconds = 0.0
+    for content, source_type, metadata in generate_amparo_corpus(evidences, seed):
+        start = time.perf_counter()
+        system.add_text_evidence(content, source_type, metadata)
+        ingest_seconds += time.perf_counter() - start
+
+    latencies: Dict[str, List[float]] = {"numeric": [], "textual": []}
+    statuses: Dict[str, int] = {}
+    results = []
+    for kind, claim in generate_claims(claims, seed):
+        start = time.perf_counter()
+        result = system.verify(claim)
+        latencies[kind].append((time.perf_counter() - start) * 1000)
+        statuses[result.status.value] = statuses.get(result.status.value, 0) + 1
+        results.append(result)
+    system.close()
+
+    return {
+        "evidences": evidences,
+        "claims": claims,
+        "ingest_seconds": round(ingest_seconds, 3),
+        "ingest_per_second": round(evidences / ingest_seconds, 1) if ingest_seconds else None,
+        "verify_numeric": _latency_summary(latencies["numeric"]),
+        "verify_textual": _latency_summary(latencies["textual"]),
+        "verdicts": statuses,
+        "audit_write": benchmark_audit_writes(results=results),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _snapshot_worker(path: str, claims: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Simula um processo novo: abre o snapshot e responde às claims."""
+    start = time.perf_counter()
+    system = TruthVerificationSystem.from_snapshot(path, collect_metrics=False)
+    opened = time.perf_counter()
+    latencies = []
+    for _, claim in claims:
+        claim_start = time.perf_counter()
+        system.verify(claim)
+        latencies.append((time.perf_counter() - claim_start) * 1000)
+    system.close()
+    return {
+        "open_seconds": round(opened - start, 6),
+        "first_claim_seconds": round(opened - start + latencies[0] / 1000, 6),
+        "verify": _latency_summary(latencies),
+    }
+
+
+def benchmark_snapshot(evidences: int = 100000, claims: int = 200, seed: int = 42) -> Dict[str, Any]:
+    """
+    Exportação do snapshot, tamanho do arquivo e tempo até um processo novo
+    (spawn) responder à primeira claim, comparado à importação completa.
+    """
+    system = TruthVerificationSystem(collect_metrics=False)
+    for content, source_type, metadata in generate_amparo_corpus(evidences, seed):
+        system.add_text_evidence(content, source_type, metadata)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.snapshot")
+        export_seconds = _timed(lambda: system.export_snapshot(path))
+        system.close()
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            worker = pool.submit(_snapshot_worker, path, generate_claims(claims, seed)).result()
+        imported = TruthVerificationSystem(collect_metrics=False)
+        import_seconds = _timed(lambda: imported.import_snapshot(path))
+        imported.close()
+        size = os.path.getsize(path)
+    return {
+        "benchmark": "snapshot",
+        "evidences": evidences,
+        "export_seconds": round(export_seconds, 3),
+        "file_bytes": size,
+        "bytes_per_evidence": round(size / evidences, 1),
+        "worker": worker,
+        "import_seconds": round(import_seconds, 3),
+    }
+
+
+def _pruning_run(seeker: TruthSeeker, system: TruthVerificationSystem, claims: List[str], pruned: bool):
+    """Latências (ms) e resultados de evaluate_claim com ou sem threshold_pruning."""
+    latencies, results = [], []
+    for claim in claims:
+        start = time.perf_counter()
+        results.append(seeker.evaluate_claim(
+            claim, system.evidences, index=system.index, threshold_pruning=pruned
+        ))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, results
+
+
+def benchmark_pruning(evidences: int = 50000, claims: int = 200, seed: int = 42) -> Dict[str, Any]:
+    """
+    Latência das claims textuais com o índice invertido, com e sem os filtros
+    de tamanho/prefixo, no corpus AMPARO e no sintético (Zipf); confere que
+    veredito, confiança, evidências de suporte e conclusão são idênticos.
+    """
+    rng = random.Random(seed)
+    synthetic = _synthetic_texts(evidences, seed)
+    datasets = {
+        "amparo": (
+            list(generate_amparo_corpus(evidences, seed)),
+            [claim for kind, claim in generate_claims(claims * 2, seed) if kind == "textual"][:claims],
+        ),
+        "synthetic": (
+            [(text, EvidenceType.EXTERNAL_API, {}) for text in synthetic],
+            [" ".join(rng.sample(text.split(), min(3, len(text.split())))) for text in rng.sample(synthetic, claims)],
+        ),
+    }
+    report: Dict[str, Any] = {"benchmark": "pruning", "evidences": evidences}
+    for name, (corpus, claim_texts) in datasets.items():
+        system = TruthVerificationSystem(collect_metrics=False)
+        for content, source_type, metadata in corpus:
+            system.add_text_evidence(content, source_type, metadata)
+        seeker = system.truth_seeker
+        plain_ms, plain = _pruning_run(seeker, system, claim_texts, False)
+        pruned_ms, pruned = _pruning_run(seeker, system, claim_texts, True)
+        mismatches = sum(
+            (a.status, a.confidence_score, a.supporting_evidences, a.trace.conclusion)
+            != (b.status, b.confidence_score, b.supporting_evidences, b.trace.conclusion)
+            for a, b in zip(plain, pruned)
+        )
+        report[name] = {
+            "claims": len(claim_texts),
+            "plain": _latency_summary(plain_ms),
+            "pruned": _latency_summary(pruned_ms),
+            "aggregated_claims": sum(len(r.trace.entries) < len(p.trace.entries) for p, r in zip(plain, pruned)),
+            "mismatches": mismatches,
+        }
+        system.close()
+    return report
+
+
+def benchmark_budget(
+    evidences: int = 50000,
+    resident: int = 5000,
+    claims: int = 100,
+    seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Memória retida (tracemalloc) e latência de verify() com o corpus inteiro
+    em memória e com MemoryBudget(max_evidences=resident), com e sem
+    threshold_pruning (claims textuais pontuadas só pelo índice, sem
+    recarregar evidências do disco). Confere que os veredictos coincidem.
+    """
+    corpus = list(generate_amparo_corpus(evidences, seed))
+    claim_list = generate_claims(claims, seed)
+    report: Dict[str, Any] = {"benchmark": "budget", "evidences": evidences, "resident": resident}
+    baseline_results: List[Tuple[Any, ...]] = []
+    for label, options in (
+        ("unbounded", {}),
+        ("budget", {"memory_budget": MemoryBudget(max_evidences=resident)}),
+        ("budget_pruning", {"memory_budget": MemoryBudget(max_evidences=resident), "threshold_pruning": True}),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        system = TruthVerificationSystem(collect_metrics=False, **options)
+        for content, source_type, metadata in corpus:
+            system.add_text_evidence(content, source_type, dict(metadata))
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        latencies: Dict[str, List[float]] = {"numeric": [], "textual": []}
+        results = []
+        for kind, claim in claim_list:
+            start = time.perf_counter()
+            result = system.verify(claim)
+            latencies[kind].append((time.perf_counter() - start) * 1000)
+            positions = [system.index.position(eid) for eid in result.supporting_evidences]
+            results.append((result.status, result.confidence_score, positions, result.trace.conclusion))
+        if not baseline_results:
+            baseline_results = results
+        report[label] = {
+            "retained_mb": round(retained / 2 ** 20, 1),
+            "verify_numeric": _latency_summary(latencies["numeric"]),
+            "verify_textual": _latency_summary(latencies["textual"]),
+            "corpus": system.get_corpus_stats(),
+            "mismatches": sum(a != b for a, b in zip(baseline_results, results)),
+        }
+        system.close()
+    return report
+
+
+def benchmark_early_exit(evidences: int = 50000, claims: int = 200, seed: int = 42) -> Dict[str, Any]:
+    """
+    Latência de verify() para claims numéricas com varredura completa e com
+    fast_verdict ("confidence" e "recency"). Confere que status e confiança
+    coincidem e que as concordantes do modo rápido estão entre as completas.
+    """
+    corpus = list(generate_amparo_corpus(evidences, seed))
+    claim_list = [claim for kind, claim in generate_claims(claims * 2, seed) if kind == "numeric"][:claims]
+    report: Dict[str, Any] = {"benchmark": "early_exit", "evidences": evidences, "claims": len(claim_list)}
+    baseline: List[Tuple[Any, ...]] = []
+    for mode in (None, "confidence", "recency"):
+        system = TruthVerificationSystem(collect_metrics=False, fast_verdict=mode)
+        for content, source_type, metadata in corpus:
+            system.add_text_evidence(content, source_type, dict(metadata))
+        latencies, outcomes = [], []
+        early = 0
+        for claim in claim_list:
+            start = time.perf_counter()
+            result = system.verify(claim)
+            latencies.append((time.perf_counter() - start) * 1000)
+            early += result.early_terminated
+            positions = {system.index.position(eid) for eid in result.supporting_evidences}
+            outcomes.append((result.status, result.confidence_score, positions))
+        if mode is None:
+            baseline = outcomes
+        report[mode or "full_scan"] = {
+            "verify": _latency_summary(latencies),
+            "early_terminated": early,
+            "mismatches": sum(
+                (a[0], a[1]) != (b[0], b[1]) or not b[2] <= a[2] for a, b in zip(baseline, outcomes)
+            ),
+        }
+        system.close()
+    return report
+
+
+def run_suite(
+    sizes: Sequence[int] = (1000, 100000, 1000000),
+    claims: int = 200,
+    seed: int = 42,
+    isolate: bool = True,
+    memory_sample: int = 20000
+) -> Dict[str, Any]:
+    """
+    Executa benchmark_scale para cada tamanho. Com isolate=True cada tamanho
+    roda num processo novo (spawn), para que o pico de RSS seja só dele.
+    A memória por evidência é medida numa amostra de `memory_sample`.
+    """
+    results = []
+    for size in sizes:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                results.append(pool.submit(benchmark_scale, size, claims, seed).result())
+        else:
+            results.append(benchmark_scale(size, claims, seed))
+    return {
+        "benchmark": "suite",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+        "memory": benchmark_memory(memory_sample, seed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lsh = commands.add_parser("lsh", help="recall do MinHash/LSH contra o scorer exato")
+    lsh.add_argument("--evidences", type=int, default=20000)
+    lsh.add_argument("--claims", type=int, default=200)
+    lsh.add_argument("--bands", type=int, default=48)
+    lsh.add_argument("--rows", type=int, default=3)
+    lsh.add_argument("--seed", type=int, default=7)
+
+    suite = commands.add_parser("suite", help="ingestão, latência p50/p99, auditoria e RSS por tamanho")
+    suite.add_argument("--sizes", default="1000,100000,1000000",
+                       help="tamanhos de corpus separados por vírgula")
+    suite.add_argument("--claims", type=int, default=200)
+    suite.add_argument("--seed", type=int, default=42)
+    suite.add_argument("--memory-sample", type=int, default=20000,
+                       help="evidências usadas na medição de memória por evidência")
+    suite.add_argument("--output", help="arquivo JSON de saída (padrão: stdout)")
+
+    tokenizer = commands.add_parser("tokenizer", help="tokens/s dos tokenizadores contra a função original")
+    tokenizer.add_argument("--documents", type=int, default=20000)
+    tokenizer.add_argument("--seed", type=int, default=42)
+
+    memory = commands.add_parser("memory", help="bytes por evidência por representação do corpus")
+    memory.add_argument("--evidences", type=int, default=20000)
+    memory.add_argument("--seed", type=int, default=42)
+
+    snapshot = commands.add_parser("snapshot", help="exportação e abertura do snapshot mapeado em memória")
+    snapshot.add_argument("--evidences", type=int, default=100000)
+    snapshot.add_argument("--claims", type=int, default=200)
+    snapshot.add_argument("--seed", type=int, default=42)
+
+    pruning = commands.add_parser("pruning", help="claims textuais com e sem filtros de tamanho/prefixo")
+    pruning.add_argument("--evidences", type=int, default=50000)
+    pruning.add_argument("--claims", type=int, default=200)
+    pruning.add_argument("--seed", type=int, default=42)
+
+    budget = commands.add_parser("budget", help="memória e latência com orçamento de evidências residentes")
+    budget.add_argument("--evidences", type=int, default=50000)
+    budget.add_argument("--resident", type=int, default=5000)
+    budget.add_argument("--claims", type=int, default=100)
+    budget.add_argument("--seed", type=int, default=42)
+
+    early_exit = commands.add_parser("early-exit", help="claims numéricas com e sem parada antecipada")
+    early_exit.add_argument("--evidences", type=int, default=50000)
+    early_exit.add_argument("--claims", type=int, default=200)
+    early_exit.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+    if args.command == "lsh":
+        report = benchmark_lsh_recall(args.evidences, args.claims, args.bands, args.rows, args.seed)
+    elif args.command == "suite":
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+        report = run_suite(sizes, args.claims, args.seed, memory_sample=args.memory_sample)
+    elif args.command == "tokenizer":
+        report = benchmark_tokenizers(args.documents, args.seed)
+    elif args.command == "memory":
+        report = benchmark_memory(args.evidences, args.seed)
+    elif args.command == "snapshot":
+        report = benchmark_snapshot(args.evidences, args.claims, args.seed)
+    elif args.command == "pruning":
+        report = benchmark_pruning(args.evidences, args.claims, args.seed)
+    elif args.command == "budget":
+        report = benchmark_budget(args.evidences, args.resident, args.claims, args.seed)
+    elif args.command == "early-exit":
+        report = benchmark_early_exit(args.evidences, args.claims, args.seed)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if getattr(args, "output", None):
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
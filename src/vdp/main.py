@@ -1,8 +1,30 @@
+import argparse
+import asyncio
+import logging
 import sys
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="vdp")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="inicia o serviço HTTP/JSON de verificação")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--db-path", default=":memory:")
+    serve.add_argument("--queue-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
     print("🚀 VDP System: Online e Operante!")
     print(f"🐍 Rodando no Python: {sys.version}")
 
+    if args.command == "serve":
+        # Módulo da raiz, instalado junto com o pacote (console script `vdp`, ver pyproject.toml)
+        from truth_verification_service import run_service
+
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+        try:
+            asyncio.run(run_service(args.host, args.port, args.db_path, args.queue_size))
+        except KeyboardInterrupt:
+            pass
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
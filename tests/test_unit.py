@@ -0,0 +1,1034 @@
+"""
+Testes unitários do Sistema de Verificação de Veracidade.
+"""
+
+import asyncio
+import json
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict, replace
+
+import pytest
+
+from truth_verification_system import (
+    TruthVerificationSystem,
+    AuditLogger,
+    Evidence,
+    EvidenceType,
+    ValidationStatus,
+    VectorScorer,
+    TraceVerbosity,
+    ShardedVerificationSystem,
+    ShardUnavailable,
+    PortugueseTokenizer,
+    SimpleTokenizer,
+    MemoryBudget,
+    TruthSeeker,
+    VerificationResult,
+)
+from truth_verification_service import VerificationService
+from benchmark_truth_system import generate_amparo_corpus, run_suite
+
+
+AMPARO_EVIDENCES = [
+    ("Conseguimos digitalizar 85% dos processos e reduzimos o consumo de papel "
+     "em aproximadamente 70% no projeto Amparo Digital.",
+     EvidenceType.EMAIL, {"sender": "joao.silva@amparodigital.org"}),
+    ('{"project": "Amparo Digital", "papel_reduzido_percentual": 71.2}',
+     EvidenceType.EXTERNAL_API, {"confidence": 0.95}),
+    ("O projeto Amparo Digital alcançou uma redução de 70% no consumo de papel.",
+     EvidenceType.ATTACHMENT, {"file_type": "PDF"}),
+    ("Alguns departamentos ainda reportam uso elevado de papel.",
+     EvidenceType.EMAIL, {"confidence": 0.3}),
+    ("Planilha de horas da equipe de infraestrutura sem relação com o tema.",
+     EvidenceType.ATTACHMENT, {}),
+]
+
+
+def build_system(**kwargs) -> TruthVerificationSystem:
+    system = TruthVerificationSystem(**kwargs)
+    for content, source_type, metadata in AMPARO_EVIDENCES:
+        system.add_text_evidence(content, source_type, dict(metadata))
+    return system
+
+
+def test_indexed_verify_matches_full_scan():
+    system = build_system()
+    claims = [
+        "O projeto Amparo Digital reduziu o papel em 70%",
+        "Amparo Digital reduziu consumo de papel",
+        "departamentos reportam uso elevado de papel",
+        "Nenhuma palavra relacionada aqui",
+    ]
+    for claim in claims:
+        indexed = system.verify(claim)
+        full = system.truth_seeker.verify_claim(claim, list(system.evidences.values()))
+        assert indexed.status == full.status
+        assert indexed.confidence_score == full.confidence_score
+        assert indexed.supporting_evidences == full.supporting_evidences
+    system.close()
+
+
+def test_index_returns_only_sharing_candidates():
+    system = build_system()
+    candidates = system.index.candidates(["infraestrutura"])
+    assert len(candidates) == 1
+    assert "infraestrutura" in system.evidences[candidates[0]].content
+    system.close()
+
+
+def test_features_precomputed_on_ingest_and_on_add_evidence():
+    system = build_system()
+    for evidence in system.evidences.values():
+        assert evidence.features is not None
+    assert next(iter(system.evidences.values())).features.numeric_facts == (("percentage", 85.0), ("percentage", 70.0))
+
+    raw = Evidence(
+        id="manual0001",
+        content="Relatório confirma redução de 70% no papel",
+        source_type=EvidenceType.ATTACHMENT,
+        timestamp=0.0,
+        metadata={},
+    )
+    system.add_evidence(raw)
+    assert raw.features.numeric_facts == (("percentage", 70.0),)
+    assert "redução" in raw.features.keywords
+
+    # metadata inválido é recusado antes de alterar corpus, índice ou auditoria
+    version, logs = system.corpus_version, len(system.get_audit_logs(limit=100))
+    with pytest.raises(TypeError):
+        system.add_evidence(replace(raw, id="manual0002", metadata=[1, 2], features=None))
+    with pytest.raises(TypeError):
+        system.add_text_evidence("Relatório confirma redução de 70%", EvidenceType.EMAIL, [1, 2])
+    assert "manual0002" not in system.evidences and "manual0002" not in system.index.numeric_range(70, 70)
+    assert system.corpus_version == version and len(system.get_audit_logs(limit=100)) == logs
+    system.close()
+
+
+def test_buffered_audit_logger_flushes_in_batches(tmp_path):
+    logger = AuditLogger(str(tmp_path / "audit.db"), buffered=True, flush_size=3, flush_interval=3600)
+    assert logger.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def count() -> int:
+        return logger.conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+
+    evidence = Evidence("abc", "texto", EvidenceType.EMAIL, 0.0, {})
+    logger.log_ingestion(evidence)
+    logger.log_ingestion(evidence)
+    assert count() == 0
+    logger.log_ingestion(evidence)
+    assert count() == 3
+    logger.log_ingestion(evidence)
+    assert logger.flush() == 1
+    assert count() == 4
+    logger.log_ingestion(evidence)
+    logger.close()
+
+    reopened = AuditLogger(str(tmp_path / "audit.db"))
+    assert len(reopened.get_logs()) == 5
+    reopened.close()
+
+    # Sem novos registros, a thread temporizadora grava após flush_interval
+    timed = AuditLogger(str(tmp_path / "timed.db"), buffered=True, flush_size=100, flush_interval=0.05)
+    timed.log_ingestion(evidence)
+    reader = sqlite3.connect(str(tmp_path / "timed.db"))
+    deadline = time.monotonic() + 5
+    while reader.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert timed.flush() == 0
+    reader.close()
+    timed.close()
+
+
+def test_verify_many_preserves_order_and_logs_in_bulk():
+    system = build_system()
+    claims = [
+        "O projeto Amparo Digital reduziu o papel em 70%",
+        "departamentos reportam uso elevado de papel",
+        "Economia de 45%",
+        "Nenhuma palavra relacionada aqui",
+    ]
+    parallel = system.verify_many(claims, workers=2, chunksize=1)
+    for claim, result in zip(claims, parallel):
+        sequential = system.truth_seeker.evaluate_claim(claim, system.evidences, index=system.index)
+        assert result.claim_checked == claim
+        assert result.status == sequential.status
+        assert result.supporting_evidences == sequential.supporting_evidences
+    logs = system.get_audit_logs(limit=1000)
+    assert sum(1 for log in logs if log["event_type"] == "VERIFICATION") == len(claims)
+    system.close()
+
+
+def test_json_stream_ingestion_ndjson_and_array(tmp_path):
+    records = [{"content": {"papel_reduzido_percentual": 70 + i}, "metadata": {"row": i}} for i in range(7)]
+    ndjson = tmp_path / "export.ndjson"
+    ndjson.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+    array = tmp_path / "export.json"
+    array.write_text(json.dumps(records), encoding="utf-8")
+
+    system = TruthVerificationSystem()
+    assert system.add_json_stream(ndjson, batch_size=3) == 7
+    stats = system.ingestion_engine.stream_stats
+    assert stats.records == 7 and stats.records_per_second > 0
+
+    engine = system.ingestion_engine
+    streamed = [e.content for e in engine.iter_json_stream(array, chunk_size=5)]
+    assert streamed == [e.content for e in engine.ingest_json(json.dumps(records))]
+
+    ingestions = [log for log in system.get_audit_logs(limit=100) if log["event_type"] == "INGESTION"]
+    assert len(ingestions) == 7 + 7 + 7
+
+    # Um elemento inválido é contado e pulado; o restante do array continua
+    tricky = [{"content": 'texto com , ] } e \\" dentro', "metadata": {"row": i}} for i in range(1000)]
+    body = ",".join(json.dumps(r) for r in tricky)
+    broken = tmp_path / "broken.json"
+    broken.write_text("[" + body.replace(json.dumps(tricky[3]), "{bad}", 1) + "]", encoding="utf-8")
+    rows = [e.metadata["row"] for e in engine.iter_json_stream(broken, chunk_size=7)]
+    assert rows == [i for i in range(1000) if i != 3]
+    assert engine.stream_stats.errors == 1
+    system.close()
+
+
+def test_content_addressed_ids_deduplicate_reingestion():
+    system = TruthVerificationSystem(
+        content_addressed_ids=True, id_metadata_keys=["sender"], duplicate_policy="merge"
+    )
+    first = system.add_text_evidence("Redução de 70%", EvidenceType.EMAIL, {"sender": "a@x.org"})
+    again = system.add_text_evidence("Redução de 70%", EvidenceType.EMAIL, {"sender": "a@x.org", "sync": 2})
+    other = system.add_text_evidence("Redução de 70%", EvidenceType.EMAIL, {"sender": "b@x.org"})
+
+    assert first == again != other
+    assert len(system.evidences) == 2
+    assert system.duplicates_dropped == 1
+    assert system.evidences[first].metadata == {"sender": "a@x.org", "sync": 2}
+    system.close()
+
+
+def test_persistent_store_warm_start(tmp_path):
+    db_path = str(tmp_path / "vdp.db")
+    system = build_system(db_path=db_path, persist_evidence=True)
+    claims = ["O projeto Amparo Digital reduziu o papel em 70%", "departamentos reportam uso elevado de papel"]
+    expected = [system.verify(claim) for claim in claims]
+    ids = list(system.evidences)
+    system.close()
+
+    reopened = TruthVerificationSystem(db_path=db_path, persist_evidence=True)
+    assert len(reopened.evidences) == len(AMPARO_EVIDENCES)
+    assert not reopened.evidences.hot
+    assert list(reopened.evidences) == ids
+    for claim, before in zip(claims, expected):
+        after = reopened.verify(claim)
+        assert (after.status, after.confidence_score, after.supporting_evidences) == \
+            (before.status, before.confidence_score, before.supporting_evidences)
+    assert reopened.evidences[ids[0]].features.numeric_facts == (("percentage", 85.0), ("percentage", 70.0))
+
+    # Cache quente limitado (LRU) e um único commit por inserção
+    reopened.evidences.hot_cache_size = 2
+    reopened.evidences.get_many(ids)
+    assert list(reopened.evidences.hot) == ids[-2:]
+    reopened.evidences[ids[0]]
+    assert list(reopened.evidences.hot) == [ids[-1], ids[0]]
+    statements = []
+    reopened.store.conn.set_trace_callback(statements.append)
+    reopened.add_text_evidence("Nova auditoria confirma 70% menos papel.", EvidenceType.ATTACHMENT)
+    reopened.store.conn.set_trace_callback(None)
+    assert [sql for sql in statements if sql.strip() == "COMMIT"] == ["COMMIT"] * 2  # auditoria + evidência
+    reopened.close()
+
+
+def test_buffered_audit_timer_shares_connection_with_store(tmp_path):
+    db_path = str(tmp_path / "vdp.db")
+    system = build_system(db_path=db_path, persist_evidence=True, buffered_audit=True)
+    system.audit_logger.flush_interval = 0.01
+    reader = sqlite3.connect(db_path)
+
+    def committed(table: str) -> int:
+        return reader.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def wait_for(table: str, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while committed(table) < count:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    wait_for("audit_log", 5)  # A thread temporizadora já está gravando
+    # Durante uma transação do store, o timer não grava (nem a evidência sem os termos)
+    extra = Evidence("manual0001", "Relatório confirma redução de 70% no papel", EvidenceType.ATTACHMENT, 0.0, {})
+    extra.features = system.truth_seeker.extract_features(extra.content)
+    with system.store.transaction():
+        system.store.save(extra)
+        system.audit_logger.log_ingestion(extra)
+        time.sleep(0.2)
+        assert committed("evidence") == 5 and committed("audit_log") == 5
+        system.store.add(extra.id, extra.features.keywords, extra.features.numeric_facts)
+    wait_for("audit_log", 6)
+    assert committed("evidence") == 6
+    assert reader.execute("SELECT COUNT(DISTINCT seq) FROM evidence_terms").fetchone()[0] == 6
+
+    for i in range(300):
+        system.add_text_evidence(f"Relatório {i} sobre redução de {i % 90}% no papel", EvidenceType.EMAIL)
+    system.close()  # Sem falhas da thread temporizadora a relançar
+    assert (committed("evidence"), committed("audit_log")) == (306, 306)
+    reader.close()
+
+
+def test_numeric_index_matches_any_fact_in_range():
+    system = build_system()
+    email_id = next(iter(system.evidences))
+    assert system.index.numeric_range(66.5, 73.5) == system.index.numeric_range(66.5, 73.5, ["percentage", "number"])
+    assert email_id in system.index.numeric_range(66.5, 73.5)
+    assert email_id not in system.index.numeric_range(40, 50)
+
+    result = system.verify("O projeto Amparo Digital reduziu o papel em 70%")
+    full = system.truth_seeker.evaluate_claim(result.claim_checked, list(system.evidences.values()))
+    assert email_id in result.supporting_evidences
+    assert result.supporting_evidences == full.supporting_evidences
+    assert result.status == full.status
+    system.close()
+
+
+def test_result_cache_hits_until_corpus_changes():
+    system = build_system(result_cache_size=2)
+    claim = "O projeto Amparo Digital reduziu o papel em 70%"
+    first = system.verify(claim)
+    expected = (list(first.supporting_evidences), first.reasoning_trace)
+    first.supporting_evidences.clear()  # O chamador altera a própria cópia, não o cache
+    first.trace.entries.clear()
+    second = system.verify("  o projeto amparo digital REDUZIU o papel em 70% ")
+    assert second.status == first.status
+    assert (second.supporting_evidences, second.reasoning_trace) == expected
+    assert system.get_cache_stats()["hits"] == 1
+
+    system.add_text_evidence("Outra medição: redução de 69% do papel", EvidenceType.ATTACHMENT)
+    third = system.verify(claim)
+    assert system.get_cache_stats()["misses"] == 2
+    assert len(third.supporting_evidences) == len(expected[0]) + 1
+
+    events = [log["event_type"] for log in system.get_audit_logs(limit=100)]
+    assert events.count("VERIFICATION") == 2
+    assert events.count("VERIFICATION_CACHED") == 1
+    system.close()
+
+
+def test_standing_claims_update_incrementally_and_emit_changes():
+    system = build_system()
+    numeric_claim = "O consumo de papel caiu 45%"
+    textual_claim = "departamentos reportam uso elevado de papel"
+    changes = []
+    initial = system.register_standing_claim(numeric_claim, on_change=changes.append)
+    system.register_standing_claim(textual_claim)
+    assert initial.status == ValidationStatus.VERIFIED_FALSE
+
+    system.add_text_evidence("Estimativa de redução de 45% no consumo", EvidenceType.EMAIL)
+    system.add_text_evidence("Auditoria confirma 46% de economia", EvidenceType.ATTACHMENT)
+    assert [(c.previous_status, c.result.status) for c in changes] == [
+        (ValidationStatus.VERIFIED_FALSE, ValidationStatus.INCONCLUSIVE),
+        (ValidationStatus.INCONCLUSIVE, ValidationStatus.VERIFIED_TRUE),
+    ]
+
+    for claim, standing in system.get_standing_results().items():
+        fresh = system.truth_seeker.evaluate_claim(claim, system.evidences, index=system.index)
+        assert (standing.status, standing.confidence_score, standing.supporting_evidences) == \
+            (fresh.status, fresh.confidence_score, fresh.supporting_evidences)
+
+    # O callback sai com a claim; registrar de novo não duplica nem ressuscita o antigo
+    claim, old, new = "O consumo de papel caiu 20%", [], []
+    system.register_standing_claim(claim, on_change=old.append)
+    system.unregister_standing_claim(claim)
+    system.register_standing_claim(claim, on_change=new.append)
+    system.register_standing_claim(claim, on_change=new.append)
+    system.add_text_evidence("Corte de 20% no papel", EvidenceType.EMAIL)
+    assert (len(old), len(new)) == (0, 1)
+
+    # Ler os resultados não publica o status novo: a mudança ainda é emitida
+    standing = system.standing_claims[claim]
+    assert standing.status == ValidationStatus.INCONCLUSIVE
+    standing.observe("externa", system.truth_seeker.extract_features("Estimativa de 20% de papel"))
+    assert system.get_standing_results()[claim].status == ValidationStatus.VERIFIED_TRUE
+    assert standing.status == ValidationStatus.INCONCLUSIVE
+    system.add_text_evidence("Outra estimativa: 20% de papel", EvidenceType.EMAIL)
+    assert [(c.previous_status, c.result.status) for c in new[1:]] == [
+        (ValidationStatus.INCONCLUSIVE, ValidationStatus.VERIFIED_TRUE)
+    ]
+    system.close()
+
+    # O limiar de relevância textual é o mesmo do TruthSeeker
+    system = build_system()
+    system.truth_seeker.TEXTUAL_MATCH_THRESHOLD = 0.1
+    claim = "Amparo Digital reduziu consumo de papel"
+    standing = system.register_standing_claim(claim)
+    fresh = system.verify(claim)
+    assert standing.supporting_evidences == fresh.supporting_evidences and len(fresh.supporting_evidences) == 3
+    system.close()
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_vector_scorer_matches_set_scoring(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    system = build_system()
+    scorer = VectorScorer(backend=backend)
+    for evidence_id, evidence in system.evidences.items():
+        scorer.add(evidence_id, evidence.features.keywords)
+    for claim in ["Amparo Digital reduziu consumo de papel", "departamentos reportam uso elevado de papel"]:
+        vectorized = system.truth_seeker.evaluate_claim(claim, system.evidences, scorer=scorer, index=system.index)
+        full = system.truth_seeker.evaluate_claim(claim, list(system.evidences.values()))
+        assert (vectorized.status, vectorized.confidence_score, vectorized.supporting_evidences) == \
+            (full.status, full.confidence_score, full.supporting_evidences)
+    system.close()
+
+
+def test_minhash_lsh_retrieves_near_duplicates():
+    system = build_system(approximate_retrieval=True)
+    claim = "Alguns departamentos ainda reportam uso elevado de papel"
+    target = next(eid for eid, ev in system.evidences.items() if ev.content.startswith("Alguns"))
+    assert system.lsh.candidates(system.truth_seeker._extract_keywords(claim)) == [target]
+    result = system.verify(claim)
+    assert result.supporting_evidences == [target]
+    assert result.reasoning_trace.startswith("[Recuperação aproximada")
+    system.close()
+
+
+@pytest.mark.parametrize("options", [{"vectorized_scoring": True}, {"approximate_retrieval": True}])
+def test_verify_many_uses_scorer_lsh_and_result_cache(options):
+    claims = [
+        "Alguns departamentos ainda reportam uso elevado de papel",
+        "Amparo Digital reduziu consumo de papel",
+        "O projeto Amparo Digital reduziu o papel em 70%",
+    ]
+    def summary(system, result):
+        contents = [system.evidences[eid].content for eid in result.supporting_evidences]
+        return result.status, result.confidence_score, contents, result.reasoning_trace.split("\n")[0]
+
+    reference = build_system(**options)
+    expected = [summary(reference, reference.verify(claim)) for claim in claims]
+    reference.close()
+    for workers in (1, 2):
+        system = build_system(result_cache_size=8, **options)
+        first = system.verify_many(claims, workers=workers, chunksize=1)
+        assert [summary(system, result) for result in first] == expected
+        first[0].supporting_evidences.clear()  # Cópias do chamador, não o cache
+        second = system.verify_many(claims, workers=workers, chunksize=1)
+        assert [summary(system, result) for result in second] == expected
+        assert system.get_cache_stats()["hits"] == len(claims)
+        system.close()
+
+
+def test_reasoning_trace_verbosity_and_compact_audit():
+    system = TruthVerificationSystem()
+    system.audit_logger.trace_top_k = 2
+    for i in range(6):
+        system.add_text_evidence(f"Relatório {i}: redução de papel de {68 + i}%", EvidenceType.ATTACHMENT)
+    result = system.verify("O projeto reduziu o papel em 70%")
+
+    assert [entry.matched for entry in result.trace.entries].count(True) == len(result.supporting_evidences)
+    full = result.reasoning_trace
+    top = result.render_trace("top_k", top_k=2)
+    summary = result.render_trace(TraceVerbosity.SUMMARY)
+    assert full.count("Evidência") == 6
+    assert top.count("Evidência") == 2 and "4 de 6 evidência(s)" in top
+    assert "Evidência" not in summary and "CONCLUSÃO" in summary
+    assert len(summary) < len(top) < len(full)
+
+    logged = [log for log in system.get_audit_logs() if log["event_type"] == "VERIFICATION"][0]
+    assert logged["reasoning"] == top
+
+    # Construção e serialização das versões anteriores: texto pronto, posicional
+    legacy = VerificationResult(result.claim_checked, result.status, result.confidence_score,
+                                result.supporting_evidences, full)
+    assert legacy == result and legacy.render_trace("summary") == full
+    assert asdict(result)["reasoning_trace"] == full
+    system.close()
+
+
+async def _http(port, method, path, payload=None, body=None, content_length=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    if body is None:
+        body = json.dumps(payload).encode() if payload is not None else b""
+    length = len(body) if content_length is None else content_length
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {length}\r\n\r\n".encode() + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, data = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+def test_service_ingests_verifies_coalesces_and_sheds_load():
+    async def scenario():
+        service = VerificationService(queue_size=1)
+        await service.start()
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            status, body = await _http(port, "POST", "/ingest", {"evidences": [
+                {"content": content, "source_type": source_type.value, "metadata": metadata}
+                for content, source_type, metadata in AMPARO_EVIDENCES
+            ]})
+            assert status == 200 and body["count"] == 5
+
+            claim = "O projeto Amparo Digital reduziu o uso de papel em 70%"
+            status, body = await _http(port, "POST", "/verify", {"claim": claim, "verbosity": "full"})
+            assert status == 200 and body["status"] == "verified_true"
+            assert body["reasoning_trace"].startswith("Verificando claim numérica")
+
+            # Erros do corpo e do cabeçalho têm mensagens próprias
+            status, body = await _http(port, "POST", "/verify", body=b'{"claim": "caf\xe9"}')
+            assert status == 400 and body["error"].startswith("JSON inválido")
+            for length in ("-5", "abc"):
+                status, body = await _http(port, "POST", "/verify", body=b"", content_length=length)
+                assert (status, body["error"]) == (400, "Content-Length inválido")
+            status, body = await _http(port, "POST", "/ingest", {"content": "Relatório", "metadata": [1, 2]})
+            assert status == 400 and "metadata" in body["error"]
+            assert (await _http(port, "GET", "/health"))[1]["evidences"] == 5
+
+            # Claims idênticas simultâneas (mesmo após normalização) geram um único cálculo
+            computations = service.stats["computations"]
+            claims = [claim.upper() if i % 2 else claim for i in range(8)]
+            results = await asyncio.gather(*[service.verify(text) for text in claims])
+            assert [result["claim_checked"] for result in results] == claims
+            assert len({json.dumps({**result, "claim_checked": ""}) for result in results}) == 1
+            assert service.stats["computations"] == computations + 1
+            assert service.stats["coalesced"] == 7
+
+            # Fila cheia: o despachante está parado, a segunda claim distinta é rejeitada
+            service._dispatcher.cancel()
+            pending = asyncio.ensure_future(service.verify("Claim um"))
+            await asyncio.sleep(0)
+            status, body = await _http(port, "POST", "/verify", {"claim": "Claim dois"})
+            assert status == 503 and service.stats["rejected"] == 1
+            # Leituras de estado não passam pela fila cheia
+            assert (await _http(port, "GET", "/health"))[1] == {"status": "ok", "evidences": 5}
+            status, body = await _http(port, "GET", "/stats")
+            assert status == 200 and body["rejected"] == 1 and body["queue_depth"] == 1
+            pending.cancel()
+
+            assert (await _http(port, "GET", "/nada"))[0] == 404
+            assert (await _http(port, "POST", "/verify", {"claim": ""}))[0] == 400
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+def test_benchmark_generator_is_deterministic_and_suite_reports():
+    first = list(generate_amparo_corpus(50, seed=3))
+    assert first == list(generate_amparo_corpus(50, seed=3))
+    assert {source_type for _, source_type, _ in first} == {
+        EvidenceType.EMAIL, EvidenceType.ATTACHMENT, EvidenceType.EXTERNAL_API
+    }
+
+    report = run_suite([200], claims=10, isolate=False, memory_sample=200)
+    scale = report["results"][0]
+    assert scale["evidences"] == 200 and scale["ingest_per_second"] > 0
+    assert scale["verify_numeric"]["count"] == scale["verify_textual"]["count"] == 5
+    assert scale["verify_numeric"]["p50_ms"] <= scale["verify_numeric"]["p99_ms"]
+    assert set(scale["audit_write"]) == {
+        "sync_memory_us_per_row", "sync_file_us_per_row", "buffered_file_us_per_row"
+    }
+    memory = report["memory"]
+    assert memory["compact_bytes_per_evidence"] < memory["dataclass_bytes_per_evidence"]
+    json.dumps(report)
+
+
+def test_metrics_per_stage_and_prometheus_dump():
+    system = build_system()
+    system.verify("O projeto Amparo Digital reduziu o uso de papel em 70%")
+    system.verify("Alguns departamentos ainda reportam uso elevado de papel")
+
+    metrics = system.get_metrics()
+    counters = metrics["counters"]
+    assert counters["evidences_added_total"] == 5
+    assert counters["claims_numeric_total"] == counters["claims_textual_total"] == 1
+    assert counters["audit_rows_written_total"] == 7  # 5 ingestões + 2 verificações
+    for stage in ("ingest.features", "ingest.index", "seeker.keywords", "seeker.numeric_scoring",
+                  "seeker.textual_scoring", "seeker.evaluate", "audit.insert"):
+        assert metrics["stages"][stage]["count"] >= 1
+    assert metrics["histograms"]["evidences_scanned_per_claim"]["count"] == 2
+    assert metrics["histograms"]["candidates_scored_per_claim"]["buckets"]["+Inf"] == 2
+
+    text = system.get_metrics_prometheus()
+    assert "# TYPE vdp_stage_duration_seconds histogram" in text
+    assert 'vdp_stage_duration_seconds_count{stage="seeker.evaluate"} 2' in text
+    assert "vdp_evidences_added_total 5" in text
+
+    # Varredura completa: todas são comparadas, só as com termos em comum pontuam
+    system.metrics.reset()
+    system.truth_seeker.evaluate_claim(
+        "Alguns departamentos ainda reportam uso elevado de papel", list(system.evidences.values())
+    )
+    counters = system.get_metrics()["counters"]
+    assert counters["evidences_scanned_total"] == 5
+    assert counters["candidates_scored_total"] == 3
+    system.close()
+
+    silent = build_system(collect_metrics=False)
+    silent.verify("O projeto Amparo Digital reduziu o uso de papel em 70%")
+    assert silent.metrics is None and silent.truth_seeker.metrics is None
+    assert silent.get_metrics() == {} and silent.get_metrics_prometheus() == ""
+    silent.close()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_compact_corpus_matches_dataclass_corpus(compress):
+    regular = build_system(content_addressed_ids=True)
+    compact = build_system(content_addressed_ids=True, compact_corpus=True, compress_content=compress)
+    for claim in ("O projeto Amparo Digital reduziu o uso de papel em 70%",
+                  "Alguns departamentos ainda reportam uso elevado de papel"):
+        expected, actual = regular.verify(claim), compact.verify(claim)
+        assert (actual.status, actual.confidence_score) == (expected.status, expected.confidence_score)
+        assert actual.reasoning_trace == expected.reasoning_trace
+
+    for evidence_id, evidence in regular.evidences.items():
+        record = compact.evidences[evidence_id]
+        expected = replace(evidence, timestamp=record.timestamp)
+        assert record.materialize() == expected
+        assert record.features == evidence.features
+        assert pickle.loads(pickle.dumps(record)) == expected
+    assert compact.verify_many(["papel 70%", "papel 71.2%"], workers=2)[0].status == ValidationStatus.VERIFIED_TRUE
+
+    content, source_type, metadata = AMPARO_EVIDENCES[0]
+    first_id = next(iter(compact.evidences))
+    compact.duplicate_policy = "merge"
+    compact.add_evidence(Evidence(first_id, content, source_type, 0.0, {"extra": 1}))
+    assert compact.evidences[first_id].metadata == {**metadata, "extra": 1}
+    del compact.evidences[first_id]
+    assert first_id not in compact.evidences and len(compact.evidences) == 4
+
+    # A compactação libera as lápides sem alterar as leituras
+    corpus = compact.evidences
+    assert corpus.tombstones >= 1 and corpus._features_at(1) is corpus._features_at(1)
+    before = {eid: corpus[eid].materialize() for eid in corpus}
+    assert corpus.compact() >= 1
+    assert compact.get_corpus_stats()["tombstones"] == 0 and len(corpus._ids) == 4
+    assert {eid: corpus[eid].materialize() for eid in corpus} == before
+    regular.close()
+    compact.close()
+
+
+def test_audit_query_filters_keyset_pagination_and_rotation(tmp_path):
+    db_path = str(tmp_path / "audit.db")
+    system = build_system(db_path=db_path)
+    target = next(iter(system.evidences))
+    claim = "O projeto Amparo Digital reduziu o uso de papel em 70%"
+    for _ in range(3):
+        system.verify(claim)
+    system.verify("Alguns departamentos ainda reportam uso elevado de papel")
+
+    logger = system.audit_logger
+    plan = " ".join(row[-1] for row in logger.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM audit_log WHERE event_type = ? ORDER BY timestamp DESC, id DESC",
+        ("VERIFICATION",)
+    ))
+    assert "idx_audit_log_event" in plan
+    plan = " ".join(row[-1] for row in logger.conn.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM audit_evidence WHERE log_id IN (SELECT id FROM audit_log WHERE timestamp < ?)",
+        (0,)
+    ))
+    assert "idx_audit_evidence_log" in plan
+
+    assert len(logger.query_logs(event_types=["VERIFICATION"]).entries) == 4
+    assert len(logger.query_logs(claim=claim).entries) == 3
+    assert len(logger.query_logs(claim_contains="departamentos").entries) == 1
+    assert logger.query_logs(claim_contains="em 70_").entries == []  # "_" literal, não curinga
+    cited = logger.query_logs(evidence_id=target).entries
+    assert [log["event_type"] for log in cited] == ["VERIFICATION"] * 3 + ["INGESTION"]
+
+    pages, cursor = [], None
+    while True:
+        page = logger.query_logs(limit=3, cursor=cursor)
+        pages.append(page.entries)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    ids = [log["id"] for entries in pages for log in entries]
+    assert [len(entries) for entries in pages] == [3, 3, 3] and ids == sorted(ids, reverse=True)
+    newest = logger.query_logs(limit=1).entries[0]["timestamp"]
+    assert len(logger.query_logs(since=newest).entries) >= 1
+    assert logger.query_logs(until=0).entries == []
+
+    # Linhas antigas (forçadas no passado) vão para o arquivo morto
+    logger.conn.execute("UPDATE audit_log SET timestamp = timestamp - 86400 WHERE event_type = 'INGESTION'")
+    logger.conn.commit()
+    archive_path = logger.rotate(retention_seconds=3600, archive_dir=str(tmp_path))
+    assert archive_path is not None and logger.rotate(retention_seconds=3600) is None
+    assert len(logger.get_logs(limit=100)) == 4
+    archived = AuditLogger(archive_path)
+    assert [log["event_type"] for log in archived.query_logs(evidence_id=target).entries] == ["INGESTION"]
+    archived.close()
+    system.close()
+
+    # Banco anterior à tabela audit_evidence: vínculos são reconstruídos ao abrir
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("DROP TABLE audit_evidence")
+    legacy.commit()
+    legacy.close()
+    reopened = AuditLogger(db_path)
+    assert len(reopened.query_logs(evidence_id=target).entries) == 3
+    reopened.close()
+
+
+def test_sharded_verify_matches_single_process():
+    single = build_system(content_addressed_ids=True)
+    single.audit_logger.trace_top_k = 1
+    sharded = ShardedVerificationSystem(shards=3, content_addressed_ids=True, batch_size=2)
+    sharded.audit_logger.trace_top_k = 1
+    try:
+        for content, source_type, metadata in AMPARO_EVIDENCES:
+            sharded.add_text_evidence(content, source_type, dict(metadata))
+        sharded.add_evidence(next(iter(single.evidences.values())))  # duplicata: descartada
+        content, source_type, metadata = AMPARO_EVIDENCES[0]
+        sharded.add_text_evidence(content, source_type, dict(metadata))  # idem, sem auditoria
+        assert len(sharded) == 5 and sharded.duplicates_dropped == 2
+        assert len([log for log in sharded.get_audit_logs() if log["event_type"] == "INGESTION"]) == 5
+        assert len({sharded.shard_of(eid) for eid in single.evidences}) > 1
+
+        claims = [
+            "O projeto Amparo Digital reduziu o uso de papel em 70%",
+            "Alguns departamentos ainda reportam uso elevado de papel",
+            "O orçamento aumentou 300%",
+            "Nada relacionado",
+        ]
+        # Padrão (TOP_K do log): shards enviam agregados + a melhor entrada
+        for expected, actual in zip([single.verify(claim) for claim in claims], sharded.verify_many(claims)):
+            assert actual.status == expected.status
+            assert actual.confidence_score == pytest.approx(expected.confidence_score)
+            assert actual.supporting_evidences == expected.supporting_evidences
+            assert len(actual.trace.entries) <= 3
+            for verbosity in ("top_k", "summary"):
+                assert actual.render_trace(verbosity, top_k=1) == expected.render_trace(verbosity, top_k=1)
+        assert sharded.get_audit_logs(1)[0]["reasoning"] == single.get_audit_logs(1)[0]["reasoning"]
+
+        # FULL: todas as entradas, resultado idêntico ao de um processo
+        sharded.trace_verbosity = TraceVerbosity.FULL
+        for expected, actual in zip([single.verify(claim) for claim in claims], sharded.verify_many(claims)):
+            assert (actual.status, actual.confidence_score) == (expected.status, expected.confidence_score)
+            assert actual.reasoning_trace == expected.reasoning_trace
+        assert sharded.verify(claims[0]).status == ValidationStatus.VERIFIED_TRUE
+        assert len([log for log in sharded.get_audit_logs() if log["event_type"] == "VERIFICATION"]) == 9
+
+        # Shard morto: erro claro, inclusive nas chamadas seguintes
+        sharded._processes[1].terminate()
+        sharded._processes[1].join()
+        for _ in range(2):
+            with pytest.raises(ShardUnavailable):
+                sharded.verify(claims[0])
+    finally:
+        sharded.close()
+        single.close()
+
+
+def test_portuguese_tokenizer_folds_stems_and_batches():
+    tokenizer = PortugueseTokenizer()
+    stems = {word: tokenizer.tokenize(word) for word in ("redução", "reduziu", "reduzimos", "reduções")}
+    assert set(map(tuple, stems.values())) == {("reduz",)}
+    assert tokenizer.tokenize("Os papéis do “Projeto”—digitalização!") == ["papel", "projet", "digitaliz"]
+    texts = [content for content, _, _ in AMPARO_EVIDENCES] + [""]
+    assert tokenizer.tokenize_many(texts) == [tokenizer.tokenize(text) for text in texts]
+    assert tokenizer.tokenize_many([]) == []
+    # O separador interno de lotes dentro de um documento não cria documentos extras
+    assert tokenizer.tokenize_many(["papel\x1e projeto", "consumo"]) == [["papel", "projet"], ["consum"]]
+    assert tokenizer.tokenize("papel\x1eprojeto") == ["papel", "projet"]
+    many = [f"documento número {i} sobre papel" for i in range(PortugueseTokenizer.BATCH_SIZE * 2 + 3)]
+    assert tokenizer.tokenize_many(many) == [tokenizer.tokenize(text) for text in many]
+
+    # Cache cheio: recomeça sem perder as palavras já conhecidas da chamada atual
+    tiny = PortugueseTokenizer(cache_size=3)
+    assert tiny.tokenize("papel projeto") == ["papel", "projet"]
+    assert tiny.tokenize("papel reduziu consumo") == ["papel", "reduz", "consum"]
+    assert tiny.tokenize_many(["papel projeto", "digitalização papel"]) == [["papel", "projet"], ["digitaliz", "papel"]]
+
+    simple = SimpleTokenizer()
+    legacy = TruthVerificationSystem().truth_seeker
+    assert all(simple.tokenize(text) == legacy._extract_keywords(text) for text in texts)
+
+    # Com stemming, a claim com "reduções" encontra "redução"/"reduzimos" nas evidências
+    claim = "Reduções no consumo de papel do projeto Amparo Digital"
+    plain = build_system()
+    stemmed = build_system(tokenizer=PortugueseTokenizer())
+    assert max(plain.verify(claim).trace.entries, key=lambda e: e.score).score < \
+        max(stemmed.verify(claim).trace.entries, key=lambda e: e.score).score
+    results = stemmed.verify_many([claim, claim], workers=2)
+    assert results[0].supporting_evidences == stemmed.verify(claim).supporting_evidences
+    plain.close()
+    stemmed.close()
+
+
+def test_portuguese_tokenizer_cache_shared_across_threads():
+    # Cache pequeno recomeça o tempo todo enquanto outras threads o consultam
+    system = TruthVerificationSystem(thread_safe=True, tokenizer=PortugueseTokenizer(cache_size=300))
+    reference = PortugueseTokenizer()
+    texts = [[" ".join(f"termo{t}w{i}x{j} palavra{j}" for j in range(8)) for i in range(400)] for t in range(4)]
+    errors = []
+
+    def ingest(batch):
+        try:
+            for text in batch:
+                system.add_text_evidence(text, EvidenceType.EMAIL)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=ingest, args=(batch,)) for batch in texts]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Trocas de thread frequentes expõem a corrida
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == [] and len(system.evidences) == 1600
+    for evidence in system.evidences.values():
+        assert evidence.features.keywords == frozenset(reference.tokenize(evidence.content))
+    system.close()
+
+
+def test_snapshot_export_mmap_load_and_import(tmp_path):
+    source = build_system(content_addressed_ids=True)
+    path = tmp_path / "corpus.snapshot"
+    assert source.export_snapshot(path) == 5
+
+    served = TruthVerificationSystem.from_snapshot(path)
+    claims = [
+        "O projeto Amparo Digital reduziu o uso de papel em 70%",
+        "Alguns departamentos ainda reportam uso elevado de papel",
+        "O orçamento aumentou 300%",
+        "Nada relacionado",
+    ]
+    for claim in claims:
+        expected, actual = source.verify(claim), served.verify(claim)
+        assert (actual.status, actual.confidence_score) == (expected.status, expected.confidence_score)
+        assert actual.supporting_evidences == expected.supporting_evidences
+        assert actual.reasoning_trace == expected.reasoning_trace
+    assert [r.supporting_evidences for r in served.verify_many(claims[:2], workers=2)] == \
+        [source.verify(claim).supporting_evidences for claim in claims[:2]]
+
+    original = next(iter(source.evidences.values()))
+    assert list(served.evidences) == list(source.evidences)
+    assert served.evidences[original.id].materialize() == original
+    assert "inexistente" not in served.evidences
+    with pytest.raises(TypeError):
+        served.add_text_evidence("nova evidência", EvidenceType.EMAIL)
+    with pytest.raises(ValueError):
+        TruthVerificationSystem.from_snapshot(path, tokenizer=PortugueseTokenizer())
+
+    imported = TruthVerificationSystem(content_addressed_ids=True)
+    assert imported.import_snapshot(path) == 5
+    assert imported.import_snapshot(path) == 0  # duplicatas
+    assert imported.verify(claims[0]).reasoning_trace == source.verify(claims[0]).reasoning_trace
+    for system in (source, served, imported):
+        system.close()
+
+
+def test_thread_safe_concurrent_ingest_and_verify(tmp_path):
+    system = TruthVerificationSystem(
+        str(tmp_path / "audit.db"), thread_safe=True, content_addressed_ids=True, result_cache_size=16
+    )
+    corpus = list(generate_amparo_corpus(400, seed=3))
+    claims = [
+        "O projeto Amparo Digital alcançou redução no consumo de papel de 70%",
+        "O projeto Conecta Cidadão apresentou atendimentos concluídos no prazo segundo a equipe",
+    ]
+    errors = []
+
+    def ingest(items):
+        try:
+            for content, source_type, metadata in items:
+                system.add_text_evidence(content, source_type, metadata)
+        except Exception as e:
+            errors.append(e)
+
+    def verify():
+        try:
+            for i in range(30):
+                result = system.verify(claims[i % 2])
+                assert all(eid in system.evidences for eid in result.supporting_evidences)
+                system.get_audit_logs(5)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=ingest, args=(corpus[i::2],)) for i in range(2)]
+    threads += [threading.Thread(target=verify) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(system.evidences) + system.duplicates_dropped == len(corpus)
+
+    # Visão congelada: só as primeiras evidências publicadas
+    view, _ = system._read_view(3)
+    assert len(view) == 3 and list(view) == list(system.evidences)[:3]
+    assert all(system.index.position(eid) < 3 for eid in view.candidates(["projeto"]))
+
+    # O estado final equivale ao de um sistema serial com a mesma ordem de inserção
+    serial = TruthVerificationSystem()
+    for evidence in system.evidences.values():
+        serial.add_evidence(evidence)
+    for claim in claims:
+        assert system.verify(claim).reasoning_trace == serial.verify(claim).reasoning_trace
+    page = system.query_audit_logs(event_types=["VERIFICATION", "VERIFICATION_CACHED"], limit=500)
+    assert len(page.entries) == 3 * 30 + len(claims)
+
+    # Ouvintes de claims permanentes rodam fora da trava do sistema
+    lock_free = []
+
+    def listener(change):
+        probe = threading.Thread(target=lambda: lock_free.append(system._lock.acquire(timeout=1) and
+                                                                 system._lock.release() is None))
+        probe.start()
+        probe.join()
+
+    system.register_standing_claim("Orçamento executado de 12345%", on_change=listener)
+    system.add_text_evidence("Orçamento executado de 12345% no ano.", EvidenceType.ATTACHMENT)
+    system.add_text_evidence("Relatório: orçamento executado de 12345%.", EvidenceType.EMAIL)
+    assert lock_free == [True, True]  # FALSO -> INCONCLUSIVO -> VERIFICADO
+
+    # Falha do escritor de auditoria reaparece no flush seguinte (uma vez)
+    insert = system.audit_logger._insert
+    system.audit_logger._insert = lambda rows: (_ for _ in ()).throw(sqlite3.OperationalError("disco cheio"))
+    system.verify("Claim que não será auditada")
+    with pytest.raises(sqlite3.DatabaseError, match="disco cheio"):
+        system.audit_logger.flush()
+    system.audit_logger._insert = insert
+    assert system.audit_logger.flush() == 0
+    serial.close()
+    system.close()
+
+
+def test_threshold_pruning_matches_exact_scoring():
+    corpus = [(f"comum filler{i} extra{i} outro{i} mais{i} texto{i}", EvidenceType.EMAIL, {}) for i in range(40)]
+    corpus += [("comum alvo especial", EvidenceType.EMAIL, {}), ("alvo especial raro", EvidenceType.ATTACHMENT, {})]
+    corpus += [(content, source_type, dict(metadata)) for content, source_type, metadata in AMPARO_EVIDENCES]
+    plain = TruthVerificationSystem()
+    pruned = TruthVerificationSystem(threshold_pruning=True)
+    for system in (plain, pruned):
+        for content, source_type, metadata in corpus:
+            system.add_text_evidence(content, source_type, dict(metadata))
+
+    claims = ["comum alvo especial", "comum filler3 extra3", "papel Amparo Digital", "Planilha de horas", "nada disso"]
+    for claim in claims:
+        a, b = plain.verify(claim), pruned.verify(claim)
+        assert (a.status, a.confidence_score) == (b.status, b.confidence_score)
+        assert [plain.index.position(eid) for eid in a.supporting_evidences] == \
+            [pruned.index.position(eid) for eid in b.supporting_evidences]
+        assert a.trace.conclusion == b.trace.conclusion
+
+    # As 40 evidências longas só com 'comum' em comum viram uma nota agregada
+    result = pruned.verify("comum alvo especial")
+    assert len(result.trace.entries) == 2
+    assert any("40 evidência(s) só com 'comum'" in note for note in result.trace.notes)
+
+    # O histograma acompanha inserções posteriores ao primeiro uso
+    for system in (plain, pruned):
+        system.add_text_evidence("comum alvo", EvidenceType.EMAIL, {})
+    a, b = plain.verify("comum alvo especial"), pruned.verify("comum alvo especial")
+    assert (a.status, a.trace.conclusion) == (b.status, b.trace.conclusion)
+
+    with pytest.raises(ValueError):
+        TruthVerificationSystem(threshold_pruning=True, vectorized_scoring=True)
+    plain.close()
+    pruned.close()
+
+
+def test_memory_budget_evicts_spills_and_reloads(tmp_path):
+    claims = ["O projeto Amparo Digital reduziu o papel em 70%", "departamentos reportam uso elevado de papel"]
+    plain = build_system(content_addressed_ids=True)
+    budget = MemoryBudget(max_evidences=2, type_quotas={EvidenceType.EMAIL: 1})
+    system = build_system(content_addressed_ids=True, memory_budget=budget, spill_dir=str(tmp_path))
+    corpus = system.evidences
+    assert len(corpus.hot) == 2 and len(corpus._usage[EvidenceType.EMAIL]) == 1
+    assert list(system.evidences) == list(plain.evidences)
+
+    for claim in claims:
+        expected, result = plain.verify(claim), system.verify(claim)
+        assert (result.status, result.confidence_score, result.supporting_evidences, result.reasoning_trace) == \
+            (expected.status, expected.confidence_score, expected.supporting_evidences, expected.reasoning_trace)
+    stats = system.get_corpus_stats()
+    assert stats["evidences"] == 5 and stats["resident"] <= 2 and stats["spilled"] == 3
+    assert stats["reloads"] > 0 and stats["evictions"] >= 3
+    assert system.get_metrics()["counters"]["corpus_reloads_total"] == stats["reloads"]
+    assert [e.content for e in system.evidences.values()] == [e.content for e in plain.evidences.values()]
+
+    # LRU por uso: a evidência lida por último fica residente
+    last = list(system.evidences)[2]
+    system.evidences[last]
+    assert last in corpus.hot
+
+    # Janela de tempo: evidência antiga vai direto para o disco e não volta ao cache
+    windowed = TruthVerificationSystem(memory_budget=MemoryBudget(max_age_seconds=3600), spill_dir=str(tmp_path))
+    old = Evidence("antiga", "Relatório antigo sobre papel", EvidenceType.EMAIL, time.time() - 7200, {})
+    windowed.add_evidence(old)
+    windowed.add_text_evidence("Relatório novo sobre papel", EvidenceType.EMAIL)
+    assert "antiga" not in windowed.evidences.hot and len(windowed.evidences.hot) == 1
+    assert windowed.evidences["antiga"].content == old.content
+    assert "antiga" not in windowed.evidences.hot
+
+    spill_files = list(tmp_path.iterdir())
+    assert len(spill_files) == 2
+    for s in (plain, system, windowed):
+        s.close()
+    assert list(tmp_path.iterdir()) == []
+
+    # Com persist_evidence o disco é o próprio banco: reabrir mantém o orçamento
+    db_path = str(tmp_path / "vdp.db")
+    persisted = build_system(db_path=db_path, persist_evidence=True, memory_budget=MemoryBudget(max_evidences=1))
+    ids = list(persisted.evidences)
+    persisted.close()
+    reopened = TruthVerificationSystem(db_path=db_path, persist_evidence=True, memory_budget=MemoryBudget(max_evidences=1))
+    assert list(reopened.evidences) == ids and not reopened.evidences.hot
+    assert reopened.verify(claims[0]).status == ValidationStatus.VERIFIED_TRUE
+    assert len(reopened.evidences.hot) <= 1 and reopened.get_corpus_stats()["reloads"] > 0
+    reopened.close()
+
+    with pytest.raises(ValueError):
+        TruthVerificationSystem(memory_budget=budget, thread_safe=True)
+
+
+def test_fast_verdict_stops_numeric_scan_once_saturated():
+    claim = "O projeto Amparo Digital reduziu o papel em 70%"
+    extra = [
+        ("Auditoria confirma 70% de redução de papel.", EvidenceType.ATTACHMENT, {"confidence": "0.99"}),
+        ("Boletim interno cita 69% menos papel.", EvidenceType.EMAIL, {"confidence": 0.2}),
+    ]
+    systems = {}
+    for mode in (None, "confidence", "recency"):
+        system = build_system(fast_verdict=mode, result_cache_size=8)
+        for content, source_type, metadata in extra:
+            system.add_text_evidence(content, source_type, metadata)
+        systems[mode] = system
+    full = systems[None].verify(claim)
+    assert not full.early_terminated and len(full.supporting_evidences) == 5
+
+    by_confidence = systems["confidence"]
+    fast = by_confidence.verify(claim)
+    assert (fast.status, fast.confidence_score) == (full.status, full.confidence_score)
+    assert fast.early_terminated and len(fast.supporting_evidences) == TruthSeeker.NUMERIC_SATURATION
+    # metadata['confidence'] decrescente; sem confiança por último
+    contents = [by_confidence.evidences[eid].content for eid in fast.supporting_evidences]
+    assert contents[0].startswith("Auditoria") and "71.2" in contents[1]
+    assert "2 candidata(s) não avaliada(s)" in fast.reasoning_trace
+    assert json.loads(by_confidence.get_audit_logs(1)[0]["metadata"]) == {"early_terminated": True}
+    # Acerto de cache com auditoria completa mantém a marca de parada antecipada
+    by_confidence.cache_hit_audit = "full"
+    assert by_confidence.verify(claim).early_terminated
+    assert json.loads(by_confidence.get_audit_logs(1)[0]["metadata"]) == {"cache": "hit", "early_terminated": True}
+
+    recent = systems["recency"].verify(claim)
+    assert [systems["recency"].index.position(eid) for eid in recent.supporting_evidences] == [6, 5, 2]
+
+    # Auditoria: varredura completa, sem reaproveitar o resultado interrompido do cache
+    audited = by_confidence.verify(claim, full_scan=True)
+    assert not audited.early_terminated and len(audited.supporting_evidences) == 5
+
+    with pytest.raises(ValueError):
+        TruthVerificationSystem(fast_verdict="random")
+    for system in systems.values():
+        system.close()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Serviço HTTP/JSON (asyncio, apenas biblioteca padrão) do Sistema de
+Verificação de Veracidade.
+
+Endpoints:
+    GET  /health   -> {"status": "ok", "evidences": N}
+    GET  /stats    -> contadores do serviço, do cache de resultados e do corpus
+    POST /ingest   -> {"content", "source_type", "metadata"} ou {"evidences": [...]}
+    POST /verify   -> {"claim", "verbosity"?: "summary" | "top_k" | "full"}
+
+Todo acesso ao TruthVerificationSystem (e à sua conexão SQLite) acontece
+numa única thread de trabalho, alimentada por uma fila limitada: o event
+loop só faz I/O, claims idênticas simultâneas são calculadas uma única vez
+e, com a fila cheia, novas requisições recebem 503 imediatamente. As
+leituras de /health e /stats também passam pela thread de trabalho, fora
+da fila (não são rejeitadas com ela cheia).
+"""
+
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from truth_verification_system import (
+    EvidenceType,
+    ResultCache,
+    TraceVerbosity,
+    TruthVerificationSystem,
+)
+
+
+class ServiceOverloaded(Exception):
+    """A fila de requisições está cheia."""
+
+
+class BadRequest(Exception):
+    """Corpo ou parâmetros inválidos."""
+
+
+class VerificationService:
+    """Fila limitada + thread única de verificação + coalescência de claims."""
+
+    MAX_BODY_BYTES = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        queue_size: int = 256,
+        system_options: Optional[Dict[str, Any]] = None
+    ):
+        self.db_path = db_path
+        self.system_options = system_options or {}
+        self._queue: "asyncio.Queue[Tuple[Callable[[], Any], asyncio.Future]]" = asyncio.Queue(queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vdp-verifier")
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._system: Optional[TruthVerificationSystem] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.stats = {"requests": 0, "computations": 0, "coalesced": 0, "rejected": 0}
+
+    # -- Ciclo de vida ------------------------------------------------------
+
+    async def start(self) -> None:
+        """Cria o sistema na thread de trabalho e inicia o despachante."""
+        loop = asyncio.get_running_loop()
+        self._system = await loop.run_in_executor(
+            self._executor, lambda: TruthVerificationSystem(self.db_path, **self.system_options)
+        )
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+        if self._system is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._system.close)
+        self._executor.shutdown(wait=True)
+
+    async def _dispatch(self) -> None:
+        """Executa os jobs da fila, um por vez, na thread de trabalho."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self._executor, job)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    def _submit(self, job: Callable[[], Any]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            raise ServiceOverloaded()
+        return future
+
+    # -- Operações ----------------------------------------------------------
+
+    async def verify(self, claim: str, verbosity: str = "summary") -> Dict[str, Any]:
+        """Verifica uma claim; chamadas idênticas em andamento compartilham o cálculo."""
+        self.stats["requests"] += 1
+        try:
+            verbosity = TraceVerbosity(verbosity).value
+        except ValueError:
+            raise BadRequest(f"verbosity inválida: {verbosity!r}")
+        key = (ResultCache.normalize(claim), verbosity)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            # O cálculo é compartilhado, mas cada chamador recebe a própria claim
+            return {**await asyncio.shield(pending), "claim_checked": claim}
+
+        def job() -> Dict[str, Any]:
+            self.stats["computations"] += 1
+            result = self._system.verify(claim)
+            return {
+                "claim_checked": result.claim_checked,
+                "status": result.status.value,
+                "confidence_score": result.confidence_score,
+                "supporting_evidences": result.supporting_evidences,
+                "early_terminated": result.early_terminated,
+                "reasoning_trace": result.render_trace(verbosity),
+            }
+
+        future = self._submit(job)
+        self._inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def ingest(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Adiciona evidências textuais e retorna seus IDs."""
+        self.stats["requests"] += 1
+        parsed = []
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get("content"), str):
+                raise BadRequest("cada evidência precisa de 'content' (string)")
+            try:
+                source_type = EvidenceType(item.get("source_type", EvidenceType.EXTERNAL_API.value))
+            except ValueError:
+                raise BadRequest(f"source_type inválido: {item.get('source_type')!r}")
+            metadata = item.get("metadata") or {}
+            if not isinstance(metadata, dict):
+                raise BadRequest("'metadata' deve ser um objeto JSON")
+            parsed.append((item["content"], source_type, metadata))
+
+        def job() -> List[str]:
+            return [self._system.add_text_evidence(*args) for args in parsed]
+
+        return await self._submit(job)
+
+    async def _read_system(self, read: Callable[[TruthVerificationSystem], Any]) -> Any:
+        """Executa uma leitura do sistema na thread de trabalho, sem passar pela fila."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, read, self._system)
+
+    async def health(self) -> Dict[str, Any]:
+        evidences = await self._read_system(lambda system: len(system.evidences))
+        return {"status": "ok", "evidences": evidences}
+
+    async def snapshot_stats(self) -> Dict[str, Any]:
+        cache, corpus = await self._read_system(
+            lambda system: (system.get_cache_stats(), system.get_corpus_stats())
+        )
+        return {
+            **self.stats,
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "inflight": len(self._inflight),
+            "cache": cache,
+            "corpus": corpus,
+        }
+
+    # -- HTTP ---------------------------------------------------------------
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Inicia o servidor HTTP (porta 0 escolhe uma porta livre)."""
+        if self._dispatcher is None:
+            await self.start()
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if path == "/health" and method == "GET":
+            return 200, await self.health()
+        if path == "/stats" and method == "GET":
+            return 200, await self.snapshot_stats()
+        if path not in ("/verify", "/ingest"):
+            return 404, {"error": "not found"}
+        if method != "POST":
+            return 405, {"error": "method not allowed"}
+
+        try:
+            payload = json.loads(body or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise BadRequest(f"JSON inválido: {e}")
+        if not isinstance(payload, dict):
+            raise BadRequest("o corpo deve ser um objeto JSON")
+
+        if path == "/verify":
+            claim = payload.get("claim")
+            if not isinstance(claim, str) or not claim.strip():
+                raise BadRequest("'claim' é obrigatório")
+            return 200, await self.verify(claim, payload.get("verbosity", "summary"))
+
+        items = payload["evidences"] if "evidences" in payload else [payload]
+        if not isinstance(items, list):
+            raise BadRequest("'evidences' deve ser uma lista")
+        ids = await self.ingest(items)
+        return 200, {"ids": ids, "count": len(ids)}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        headers: Dict[str, str] = {}
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            if len(request_line) != 3:
+                raise BadRequest("linha de requisição inválida")
+            method, path, _ = request_line
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length", "0"))
+            except ValueError:
+                raise BadRequest("Content-Length inválido")
+            if length < 0:
+                raise BadRequest("Content-Length inválido")
+            if length > self.MAX_BODY_BYTES:
+                status, payload = 413, {"error": "corpo muito grande"}
+            else:
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self._route(method.upper(), path.split("?", 1)[0], body)
+        except BadRequest as e:
+            status, payload = 400, {"error": str(e)}
+        except ServiceOverloaded:
+            status, payload = 503, {"error": "fila cheia, tente novamente"}
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        except Exception as e:
+            logging.exception("Falha ao processar requisição")
+            status, payload = 500, {"error": str(e)}
+
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                   413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {reasons[status]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            + ("Retry-After: 1\r\n" if status == 503 else "")
+            + "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+
+async def run_service(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    db_path: str = ":memory:",
+    queue_size: int = 256,
+    system_options: Optional[Dict[str, Any]] = None
+) -> None:
+    """Executa o serviço até ser interrompido."""
+    service = VerificationService(db_path, queue_size, system_options)
+    server = await service.serve(host, port)
+    address = server.sockets[0].getsockname()
+    logging.info(f"Serviço de verificação ouvindo em http://{address[0]}:{address[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
@@ -5,17 +5,45 @@ Implementação completa com tipagem estrita e zero dependências externas.
 """
 
 import json
+import math
 import sqlite3
 import re
 import hashlib
 import logging
+import bisect
+import random
+import zlib
+import itertools
+import time
+import heapq
+import multiprocessing
+import queue
+import threading
+import mmap
+import sys
+import tempfile
+import unicodedata
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict, replace
 from enum import Enum
-from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
+from operator import itemgetter
+from typing import (
+    List, Dict, Any, Optional, Tuple, Set, FrozenSet, Iterable, Iterator, Mapping,
+    Callable, Union, TextIO, NamedTuple
+)
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from array import array
 import os
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: VectorScorer usa bitsets em Python puro
+    np = None
+
 
 # ============================================================================
 # 1. DATA CONTRACTS - A VERDADE DOS DADOS
@@ -33,6 +61,13 @@ class ValidationStatus(Enum):
     INCONCLUSIVE = "inconclusive"
 
 
+@dataclass(frozen=True)
+class EvidenceFeatures:
+    """Atributos pré-computados de uma evidência no momento da ingestão."""
+    keywords: FrozenSet[str]
+    numeric_facts: Tuple[Tuple[str, float], ...]  # Todos os números/percentuais do texto
+
+
 @dataclass
 class Evidence:
     id: str
@@ -40,6 +75,98 @@ class Evidence:
     source_type: EvidenceType
     timestamp: float
     metadata: Dict[str, Any]
+    features: Optional[EvidenceFeatures] = field(default=None, repr=False, compare=False)
+
+
+class TraceVerbosity(Enum):
+    SUMMARY = "summary"  # Cabeçalho, contagens e conclusão
+    TOP_K = "top_k"      # Apenas as k evidências mais relevantes
+    FULL = "full"        # Uma linha por evidência avaliada
+
+
+class TraceEntry(NamedTuple):
+    evidence_id: str
+    score: float   # Relevância (textual) ou valor mais próximo da claim (numérica)
+    matched: bool
+    kind: str = ""  # Tipo do fato numérico
+
+
+@dataclass
+class ReasoningTrace:
+    """
+    Raciocínio estruturado de uma verificação.
+    
+    As entradas por evidência são guardadas como registros e o texto só é
+    montado em `render()`, no nível de detalhe pedido. `omitted_entries` e
+    `omitted_matched` contam as entradas avaliadas que não vieram junto
+    (ex.: agregados dos shards), para que as contagens do resumo fechem.
+    """
+    header: str
+    mode: str = "text"  # "numeric", "textual" ou "text" (apenas cabeçalho)
+    entries: List[TraceEntry] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)  # Linhas após as entradas
+    conclusion: str = ""
+    claim_value: float = 0.0
+    tolerance: float = 0.0
+    omitted_entries: int = 0
+    omitted_matched: int = 0
+    
+    def _render_entry(self, entry: TraceEntry) -> str:
+        if self.mode == "numeric":
+            line = f"  - Evidência {entry.evidence_id[:8]}: {entry.score} ({entry.kind})\n"
+            if entry.matched:
+                return line + f"    ✓ MATCH (dentro da tolerância de {self.tolerance*100}%)\n"
+            return line + f"    ✗ NO MATCH (diferença: {abs(entry.score - self.claim_value)})\n"
+        return f"  - Evidência {entry.evidence_id[:8]}: relevância {entry.score:.2f}\n"
+    
+    def top_entries(self, k: int) -> List[TraceEntry]:
+        """As k entradas que mais pesaram no veredito."""
+        if self.mode == "numeric":
+            key = lambda entry: (not entry.matched, abs(entry.score - self.claim_value))
+        else:
+            key = lambda entry: -entry.score
+        return sorted(self.entries, key=key)[:k]
+    
+    def render(self, verbosity: Union[TraceVerbosity, str] = TraceVerbosity.FULL, top_k: int = 10) -> str:
+        verbosity = TraceVerbosity(verbosity)
+        parts = [self.header]
+        if verbosity is TraceVerbosity.FULL:
+            shown = self.entries
+        elif verbosity is TraceVerbosity.TOP_K:
+            shown = self.top_entries(top_k)
+        else:
+            shown = []
+        parts.extend(self._render_entry(entry) for entry in shown)
+        total = len(self.entries) + self.omitted_entries
+        omitted = total - len(shown)
+        if omitted:
+            matched = sum(entry.matched for entry in self.entries) + self.omitted_matched
+            parts.append(
+                f"  ... {omitted} de {total} evidência(s) avaliada(s) omitida(s)"
+                f" ({matched} concordante(s) no total)\n"
+            )
+        parts.extend(self.notes)
+        parts.append(self.conclusion)
+        return "".join(parts)
+
+
+class _ReasoningTraceField:
+    """
+    Campo `reasoning_trace` de VerificationResult.
+    
+    Aceita o texto pronto (como nas versões anteriores, que é embrulhado num
+    ReasoningTrace só com cabeçalho) ou um ReasoningTrace, guardado em
+    `result.trace`. Lido, devolve o texto completo, montado sob demanda;
+    assim `asdict()` e a comparação continuam vendo uma string.
+    """
+    
+    def __get__(self, instance: Optional["VerificationResult"], owner: type) -> str:
+        if instance is None:
+            raise AttributeError("reasoning_trace")  # Campo sem valor padrão
+        return instance.trace.render(TraceVerbosity.FULL)
+    
+    def __set__(self, instance: "VerificationResult", value: Union[str, ReasoningTrace]) -> None:
+        instance.trace = ReasoningTrace(header=value) if isinstance(value, str) else value
 
 
 @dataclass
@@ -48,108 +175,853 @@ class VerificationResult:
     status: ValidationStatus
     confidence_score: float  # 0.0 to 1.0
     supporting_evidences: List[str]  # IDs das evidências
-    reasoning_trace: str
+    reasoning_trace: Union[str, ReasoningTrace] = _ReasoningTraceField()  # type: ignore[assignment]
+    # Varredura interrompida com o veredito já saturado (modo fast_verdict)
+    early_terminated: bool = False
+    
+    def render_trace(
+        self,
+        verbosity: Union[TraceVerbosity, str] = TraceVerbosity.SUMMARY,
+        top_k: int = 10
+    ) -> str:
+        return self.trace.render(verbosity, top_k)
+
+
+# ============================================================================
+# 2. METRICS - INSTRUMENTAÇÃO DO PIPELINE
+# ============================================================================
+
+# Limites (inclusivos) dos buckets dos histogramas, no estilo Prometheus
+LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+COUNT_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+class Histogram:
+    """Histograma de buckets fixos (contagem, soma e contagem por bucket)."""
+    
+    __slots__ = ("bounds", "bucket_counts", "count", "sum")
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)  # Último bucket: +Inf
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Pares (le, contagem acumulada), terminando em "+Inf"."""
+        labels = [f"{bound:g}" for bound in self.bounds] + ["+Inf"]
+        return list(zip(labels, itertools.accumulate(self.bucket_counts)))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class Metrics:
+    """
+    Contadores e histogramas do pipeline de verificação.
+    
+    - `inc(nome)`: contadores monotônicos (ex.: evidências ingeridas)
+    - `observe_stage(etapa, segundos)`: latência por etapa, num único
+      histograma `stage_duration_seconds` rotulado por `stage`
+    - `observe(nome, valor)`: distribuições de contagem por claim
+      (evidências varridas, candidatos pontuados)
+    
+    Os componentes recebem `metrics=None` quando a coleta está desligada e
+    apenas testam `is not None` no caminho quente. As atualizações são
+    protegidas por uma trava (verificações em várias threads).
+    """
+    
+    STAGE_FAMILY = "stage_duration_seconds"
+    
+    def __init__(self, namespace: str = "vdp"):
+        self.namespace = namespace
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def _histogram(self, family: str, stage: str, bounds: Tuple[float, ...]) -> Histogram:
+        key = (family, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(bounds)
+        return histogram
+    
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(self.STAGE_FAMILY, stage, LATENCY_BUCKETS).observe(seconds)
+    
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            self._histogram(name, "", COUNT_BUCKETS).observe(value)
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Cópia serializável: counters, stages (por etapa) e histograms."""
+        stages = {}
+        histograms = {}
+        with self._lock:
+            for (family, stage), histogram in sorted(self.histograms.items()):
+                if family == self.STAGE_FAMILY:
+                    stages[stage] = histogram.snapshot()
+                else:
+                    histograms[family] = histogram.snapshot()
+            counters = dict(sorted(self.counters.items()))
+        return {"counters": counters, "stages": stages, "histograms": histograms}
+    
+    def to_prometheus(self) -> str:
+        """Exposição no formato texto do Prometheus (versão 0.0.4)."""
+        with self._lock:
+            return self._render_prometheus()
+    
+    def _render_prometheus(self) -> str:
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        
+        families: Dict[str, List[Tuple[str, Histogram]]] = {}
+        for (family, stage), histogram in sorted(self.histograms.items()):
+            families.setdefault(family, []).append((stage, histogram))
+        for family, series in families.items():
+            metric = f"{self.namespace}_{family}"
+            lines.append(f"# TYPE {metric} histogram")
+            for stage, histogram in series:
+                label = f'stage="{stage}",' if stage else ""
+                for le, count in histogram.cumulative():
+                    lines.append(f'{metric}_bucket{{{label}le="{le}"}} {count}')
+                suffix = f"{{{label.rstrip(',')}}}" if label else ""
+                lines.append(f"{metric}_sum{suffix} {histogram.sum!r}")
+                lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class _StageClock:
+    """
+    Cronômetro das etapas de uma operação: `lap` registra a duração desde
+    a marca anterior e `finish` o total desde o início. Com `metrics=None`
+    nada é medido.
+    """
+    
+    __slots__ = ("metrics", "started", "last")
+    
+    def __init__(self, metrics: Optional[Metrics]):
+        self.metrics = metrics
+        self.started = self.last = time.perf_counter() if metrics is not None else 0.0
+    
+    def lap(self, stage: str) -> None:
+        if self.metrics is not None:
+            now = time.perf_counter()
+            self.metrics.observe_stage(stage, now - self.last)
+            self.last = now
+    
+    def finish(self, stage: str) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_stage(stage, self.last - self.started)
 
 
 # ============================================================================
-# 2. AUDIT LOGGER - RASTREABILIDADE TOTAL
+# 3. AUDIT LOGGER - RASTREABILIDADE TOTAL
 # ============================================================================
 
+# DDL da auditoria; `{schema}` permite criar as mesmas tabelas num banco de
+# arquivo anexado (ATTACH) durante a rotação
+_AUDIT_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS {schema}audit_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp REAL NOT NULL,
+        event_type TEXT NOT NULL,
+        claim TEXT,
+        evidence_ids TEXT,
+        result_status TEXT,
+        confidence REAL,
+        reasoning TEXT,
+        metadata TEXT
+    )
+    """,
+    # Evidência -> linhas de auditoria que a citam (filtro por evidence_id)
+    """
+    CREATE TABLE IF NOT EXISTS {schema}audit_evidence (
+        evidence_id TEXT NOT NULL,
+        log_id INTEGER NOT NULL,
+        PRIMARY KEY (evidence_id, log_id)
+    ) WITHOUT ROWID
+    """,
+    # O rowid (id) entra implicitamente nos índices: (timestamp, id) ordenado
+    "CREATE INDEX IF NOT EXISTS {schema}idx_audit_log_timestamp ON audit_log (timestamp)",
+    "CREATE INDEX IF NOT EXISTS {schema}idx_audit_log_event ON audit_log (event_type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS {schema}idx_audit_log_claim ON audit_log (claim, timestamp)",
+    # Linha -> vínculos (remoção e cópia dos vínculos na rotação)
+    "CREATE INDEX IF NOT EXISTS {schema}idx_audit_evidence_log ON audit_evidence (log_id)",
+)
+
+
+class AuditPage(NamedTuple):
+    """Página de `query_logs`; `next_cursor` é None na última página."""
+    entries: List[Dict[str, Any]]
+    next_cursor: Optional[Tuple[float, int]]
+
+
 class AuditLogger:
-    """Registra cada decisão do sistema em formato estruturado."""
+    """
+    Registra cada decisão do sistema em formato estruturado.
+    
+    No modo `buffered`, as linhas são enfileiradas e gravadas em lote
+    (executemany numa única transação) quando a fila atinge `flush_size`
+    linhas, em `flush()`, em `close()` e, por uma thread temporizadora,
+    quando `flush_interval` segundos se passaram desde a última gravação:
+    nenhuma linha espera mais que isso, mesmo sem novos registros. Falhas
+    dessa thread são relançadas no próximo `flush()`/`close()`. Bancos em
+    arquivo passam a operar em modo WAL.
+    
+    Consultas (`query_logs`) usam índices por timestamp, tipo de evento,
+    claim e evidência, com paginação por cursor (timestamp, id); `rotate`
+    move linhas antigas para bancos de arquivo morto.
+    
+    O raciocínio das verificações é gravado no nível `trace_verbosity`
+    (por padrão, apenas as `trace_top_k` evidências mais relevantes mais
+    os agregados), e não o trace completo.
+    
+    No modo `thread_safe`, qualquer thread pode registrar e consultar: as
+    linhas vão para uma fila consumida por um único escritor (thread
+    própria, que agrupa o que houver na fila numa transação) e, em bancos
+    de arquivo (WAL), cada thread lê pela sua própria conexão.
+    """
     
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        buffered: bool = False,
+        flush_size: int = 500,
+        flush_interval: float = 1.0,
+        trace_verbosity: Union[TraceVerbosity, str] = TraceVerbosity.TOP_K,
+        trace_top_k: int = 10,
+        metrics: Optional[Metrics] = None,
+        thread_safe: bool = False
+    ):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.metrics = metrics
+        self.trace_verbosity = TraceVerbosity(trace_verbosity)
+        self.trace_top_k = trace_top_k
+        self.buffered = buffered
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.thread_safe = thread_safe
+        self.conn = sqlite3.connect(db_path, check_same_thread=not (thread_safe or buffered))
+        self._pending: List[Tuple[Any, ...]] = []
+        self._last_flush = time.monotonic()
+        if (buffered or thread_safe) and db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
+        # Serializa o uso de `conn` (escritor, rotação e leituras em memória)
+        self._lock = threading.RLock()
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._queue: Optional["queue.Queue[Optional[List[Tuple[Any, ...]]]]"] = None
+        # Primeira falha do escritor (thread_safe) ou da thread temporizadora
+        # (buffered), relançada no próximo flush()/close()
+        self._write_error: Optional[Exception] = None
+        self._lost_rows = 0
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if thread_safe:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._write_loop, name="vdp-audit-writer", daemon=True)
+            self._writer.start()
+        elif buffered:
+            self._flusher = threading.Thread(target=self._flush_loop, name="vdp-audit-flusher", daemon=True)
+            self._flusher.start()
+    
+    @property
+    def lock(self) -> "threading.RLock":
+        """Trava que serializa o uso de `conn` (a compartilhar com quem usa a mesma conexão)."""
+        return self._lock
     
     def _init_db(self) -> None:
-        """Cria tabela de auditoria se não existir."""
+        """Cria tabelas e índices de auditoria se não existirem."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS audit_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp REAL NOT NULL,
-                event_type TEXT NOT NULL,
-                claim TEXT,
-                evidence_ids TEXT,
-                result_status TEXT,
-                confidence REAL,
-                reasoning TEXT,
-                metadata TEXT
+        backfill = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'audit_log'"
+        ).fetchone() is not None and cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'audit_evidence'"
+        ).fetchone() is None
+        for statement in _AUDIT_DDL:
+            cursor.execute(statement.format(schema=""))
+        if backfill:
+            # Banco criado antes de audit_evidence: indexa as linhas existentes
+            cursor.executemany(
+                "INSERT OR IGNORE INTO audit_evidence (evidence_id, log_id) VALUES (?, ?)",
+                self._evidence_links(cursor.execute(
+                    "SELECT id, evidence_ids FROM audit_log WHERE evidence_ids IS NOT NULL"
+                ).fetchall())
             )
-        """)
         self.conn.commit()
     
+    @staticmethod
+    def _evidence_links(rows: Iterable[Tuple[int, Optional[str]]]) -> List[Tuple[str, int]]:
+        """Pares (evidence_id, log_id) a partir de (log_id, evidence_ids JSON)."""
+        return [
+            (evidence_id, log_id)
+            for log_id, evidence_ids in rows if evidence_ids
+            for evidence_id in json.loads(evidence_ids)
+        ]
+    
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Grava linhas imediatamente ou as enfileira (modos buffered e thread_safe)."""
+        if self._queue is not None:
+            self._queue.put(rows)
+            return
+        if not self.buffered:
+            self._insert(rows)
+            return
+        with self._lock:
+            self._pending.extend(rows)
+            if len(self._pending) >= self.flush_size:
+                self.flush()
+    
+    def _insert(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Insere as linhas numa única transação."""
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO audit_log 
+                (timestamp, event_type, claim, evidence_ids, result_status, confidence, reasoning, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            # AUTOINCREMENT numa única transação da conexão escritora:
+            # as linhas recebem ids consecutivos, terminando no maior id da tabela
+            last_id = self.conn.execute("SELECT max(id) FROM audit_log").fetchone()[0]
+            first_id = last_id - len(rows) + 1
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO audit_evidence (evidence_id, log_id) VALUES (?, ?)",
+                self._evidence_links((first_id + offset, row[3]) for offset, row in enumerate(rows))
+            )
+        if self.metrics is not None:
+            self.metrics.observe_stage("audit.insert", time.perf_counter() - start)
+            self.metrics.inc("audit_rows_written_total", len(rows))
+    
+    def _write_loop(self) -> None:
+        """Escritor do modo thread_safe: cada transação leva o que estiver na fila."""
+        while True:
+            batch = self._queue.get()
+            taken, stop = 1, batch is None
+            rows = list(batch or ())
+            while not stop and len(rows) < self.flush_size:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if batch is None:
+                    stop = True
+                else:
+                    rows.extend(batch)
+            try:
+                if rows:
+                    with self._lock:
+                        self._insert(rows)
+            except Exception as e:
+                logging.exception(f"Falha ao gravar {len(rows)} linhas de auditoria")
+                if self._write_error is None:
+                    self._write_error = e
+                self._lost_rows += len(rows)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+            if stop:
+                return
+    
+    def _flush_loop(self) -> None:
+        """
+        Thread temporizadora do modo buffered: grava as pendências assim que
+        `flush_interval` segundos se passam desde a última gravação.
+        """
+        timeout = self.flush_interval
+        while not self._stop_flusher.wait(timeout):
+            with self._lock:
+                age = time.monotonic() - self._last_flush
+                if age < self.flush_interval:
+                    timeout = self.flush_interval - age
+                    continue
+                timeout = self.flush_interval
+                rows, self._pending = self._pending, []
+                self._last_flush = time.monotonic()
+                try:
+                    if rows:
+                        self._insert(rows)
+                except Exception as e:
+                    logging.exception(f"Falha ao gravar {len(rows)} linhas de auditoria")
+                    if self._write_error is None:
+                        self._write_error = e
+                    self._lost_rows += len(rows)
+    
+    def _raise_write_error(self) -> None:
+        """Relança (uma vez) a primeira falha de gravação em segundo plano."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            lost, self._lost_rows = self._lost_rows, 0
+            raise sqlite3.DatabaseError(f"{lost} linha(s) de auditoria não gravada(s): {error}") from error
+    
+    def flush(self) -> int:
+        """
+        Grava as linhas pendentes e retorna quantas foram persistidas. No
+        modo thread_safe, espera o escritor esvaziar a fila (e retorna 0).
+        Relança a primeira falha de gravação em segundo plano (escritor ou
+        thread temporizadora) desde o flush anterior.
+        """
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_write_error()
+            return 0
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if rows:
+                self._insert(rows)
+            self._raise_write_error()
+        return len(rows)
+    
     def log_verification(
         self, 
         claim: str, 
         result: VerificationResult,
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Registra uma verificação completa."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO audit_log 
-            (timestamp, event_type, claim, evidence_ids, result_status, confidence, reasoning, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+        Registra uma verificação completa (`early_terminated` do resultado
+        entra no metadata, inclusive quando servido pelo cache).
+        """
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        if result.early_terminated:
+            metadata = {**(metadata or {}), "early_terminated": True}
+        self._write([(
             datetime.now().timestamp(),
             "VERIFICATION",
             claim,
             json.dumps(result.supporting_evidences),
             result.status.value,
             result.confidence_score,
-            result.reasoning_trace,
+            result.render_trace(self.trace_verbosity, self.trace_top_k),
             json.dumps(metadata or {})
-        ))
-        self.conn.commit()
+        )])
+        if self.metrics is not None:
+            # Inclui a renderização do trace e, sem buffer, o INSERT
+            self.metrics.observe_stage("audit.log_verification", time.perf_counter() - start)
     
-    def log_ingestion(self, evidence: Evidence) -> None:
-        """Registra ingestão de evidência."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO audit_log 
-            (timestamp, event_type, evidence_ids, metadata)
-            VALUES (?, ?, ?, ?)
-        """, (
+    def log_verifications(self, results: List[VerificationResult]) -> None:
+        """Registra várias verificações numa única transação (ou no buffer)."""
+        now = datetime.now().timestamp()
+        self._write([
+            (
+                now,
+                "VERIFICATION",
+                result.claim_checked,
+                json.dumps(result.supporting_evidences),
+                result.status.value,
+                result.confidence_score,
+                result.render_trace(self.trace_verbosity, self.trace_top_k),
+                json.dumps({"early_terminated": True} if result.early_terminated else {})
+            )
+            for result in results
+        ])
+    
+    def log_cache_hit(self, claim: str, result: VerificationResult) -> None:
+        """Registro compacto de uma verificação servida pelo cache (sem raciocínio)."""
+        metadata = {"cache": "hit", "early_terminated": True} if result.early_terminated else {"cache": "hit"}
+        self._write([(
+            datetime.now().timestamp(),
+            "VERIFICATION_CACHED",
+            claim,
+            json.dumps(result.supporting_evidences),
+            result.status.value,
+            result.confidence_score,
+            None,
+            json.dumps(metadata)
+        )])
+    
+    def _ingestion_row(self, evidence: Evidence) -> Tuple[Any, ...]:
+        return (
             evidence.timestamp,
             "INGESTION",
+            None,
             json.dumps([evidence.id]),
+            None,
+            None,
+            None,
             json.dumps(evidence.metadata)
-        ))
-        self.conn.commit()
+        )
+    
+    def log_ingestion(self, evidence: Evidence) -> None:
+        """Registra ingestão de evidência."""
+        self._write([self._ingestion_row(evidence)])
+    
+    def log_ingestions(self, evidences: List[Evidence]) -> None:
+        """Registra várias ingestões numa única transação (ou no buffer)."""
+        self._write([self._ingestion_row(evidence) for evidence in evidences])
+    
+    def _reader(self) -> sqlite3.Connection:
+        """Conexão de leitura da thread (banco em arquivo no modo thread_safe) ou `conn`."""
+        if not self.thread_safe or self.db_path == ":memory:":
+            return self.conn
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._readers.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            with self._lock:
+                self._reader_conns.append(conn)
+        return conn
+    
+    def _read(self, sql: str, params: Tuple[Any, ...]) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Executa uma consulta e retorna (colunas, linhas)."""
+        conn = self._reader()
+        with (self._lock if conn is self.conn else nullcontext()):
+            result = conn.execute(sql, params)
+            return [desc[0] for desc in result.description], result.fetchall()
     
     def get_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Recupera logs mais recentes."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM audit_log 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        """, (limit,))
+        return self.query_logs(limit=limit).entries
+    
+    def query_logs(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        claim: Optional[str] = None,
+        claim_contains: Optional[str] = None,
+        evidence_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> AuditPage:
+        """
+        Consulta logs do mais recente ao mais antigo, com filtros combináveis.
+        
+        Args:
+            event_types: tipos de evento aceitos (ex.: ["VERIFICATION"])
+            claim: texto exato da claim (indexado)
+            claim_contains: trecho da claim (LIKE, sem índice)
+            evidence_id: apenas linhas que citam a evidência
+            since / until: intervalo [since, until) de timestamp
+            limit: tamanho da página
+            cursor: `next_cursor` da página anterior (paginação por chave,
+                estável mesmo com novas linhas sendo gravadas)
+        """
+        self.flush()
+        clauses: List[str] = []
+        params: List[Any] = []
+        if event_types is not None:
+            event_types = list(event_types)
+            clauses.append(f"event_type IN ({', '.join('?' * len(event_types))})")
+            params.extend(event_types)
+        if claim is not None:
+            clauses.append("claim = ?")
+            params.append(claim)
+        if claim_contains is not None:
+            escaped = re.sub(r"([\\%_])", r"\\\1", claim_contains)
+            clauses.append("claim LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if evidence_id is not None:
+            clauses.append("id IN (SELECT log_id FROM audit_evidence WHERE evidence_id = ?)")
+            params.append(evidence_id)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if cursor is not None:
+            clauses.append("(timestamp, id) < (?, ?)")
+            params.extend(cursor)
         
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns, rows = self._read(
+            f"SELECT * FROM audit_log {where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (*params, limit + 1)
+        )
+        entries = [dict(zip(columns, row)) for row in rows]
+        next_cursor = None
+        if len(entries) > limit:
+            entries.pop()
+            next_cursor = (entries[-1]["timestamp"], entries[-1]["id"])
+        return AuditPage(entries, next_cursor)
+    
+    def archive_logs(self, before: float, archive_path: str) -> int:
+        """
+        Move as linhas com timestamp < `before` (e seus vínculos de
+        evidência) para o banco `archive_path`, criado com o mesmo esquema
+        se necessário. Retorna quantas linhas foram movidas.
+        """
+        self.flush()
+        with self._lock:
+            return self._archive(before, archive_path)
+    
+    def _archive(self, before: float, archive_path: str) -> int:
+        self.conn.commit()  # ATTACH não pode ocorrer dentro de uma transação
+        self.conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+        try:
+            for statement in _AUDIT_DDL:
+                self.conn.execute(statement.format(schema="archive."))
+            with self.conn:
+                moved = self.conn.execute(
+                    "INSERT INTO archive.audit_log SELECT * FROM main.audit_log WHERE timestamp < ?",
+                    (before,)
+                ).rowcount
+                self.conn.execute("""
+                    INSERT OR IGNORE INTO archive.audit_evidence
+                    SELECT e.evidence_id, e.log_id FROM main.audit_evidence e
+                    JOIN main.audit_log l ON l.id = e.log_id WHERE l.timestamp < ?
+                """, (before,))
+                self.conn.execute("""
+                    DELETE FROM main.audit_evidence WHERE log_id IN
+                    (SELECT id FROM main.audit_log WHERE timestamp < ?)
+                """, (before,))
+                self.conn.execute("DELETE FROM main.audit_log WHERE timestamp < ?", (before,))
+        finally:
+            self.conn.execute("DETACH DATABASE archive")
+        return moved
+    
+    def rotate(self, retention_seconds: float, archive_dir: Optional[str] = None) -> Optional[str]:
+        """
+        Retenção: move para um novo arquivo morto as linhas mais antigas que
+        `retention_seconds`. O arquivo fica em `archive_dir` (padrão: pasta
+        do banco) e é nomeado pelo instante de corte. Retorna o caminho do
+        arquivo criado, ou None se não havia linhas a mover.
+        """
+        self.flush()
+        before = time.time() - retention_seconds
+        if not self._read("SELECT 1 FROM audit_log WHERE timestamp < ? LIMIT 1", (before,))[1]:
+            return None
+        if archive_dir is None:
+            if self.db_path == ":memory:":
+                raise ValueError("archive_dir é obrigatório para bancos em memória")
+            archive_dir = os.path.dirname(os.path.abspath(self.db_path))
+        stem = "audit" if self.db_path == ":memory:" else os.path.splitext(os.path.basename(self.db_path))[0]
+        archive_path = os.path.join(
+            archive_dir, f"{stem}-archive-{datetime.fromtimestamp(before):%Y%m%d-%H%M%S-%f}.db"
+        )
+        self.archive_logs(before, archive_path)
+        return archive_path
     
     def close(self) -> None:
-        """Fecha conexão com banco de dados."""
-        self.conn.close()
+        """Grava pendências e fecha conexão com banco de dados (relançando falhas de gravação)."""
+        try:
+            self.flush()
+        finally:
+            if self._queue is not None:
+                self._queue.put(None)
+                self._writer.join()
+            if self._flusher is not None:
+                self._stop_flusher.set()
+                self._flusher.join()
+            for conn in self._reader_conns:
+                conn.close()
+            self.conn.close()
 
 
 # ============================================================================
-# 3. INGESTION ENGINE - CONVERSÃO DE DADOS
+# 4. INGESTION ENGINE - CONVERSÃO DE DADOS
 # ============================================================================
 
+@dataclass
+class StreamStats:
+    """Contadores de uma ingestão em streaming."""
+    records: int = 0
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+    
+    def finish(self) -> None:
+        self.finished_at = time.monotonic()
+    
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+    
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# Delimitadores estruturais de JSON (fora de strings) e caracteres especiais dentro delas
+_JSON_STRUCTURE = re.compile(r'["\[\]{},]')
+_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+# Um elemento de array maior que isto (ex.: '{' nunca fechado) encerra a leitura
+MAX_JSON_RECORD_CHARS = 64 * 1024 * 1024
+
+
+def _iter_json_records(handle: TextIO, chunk_size: int, stats: StreamStats) -> Iterator[Any]:
+    """
+    Decodifica registros de um arquivo NDJSON ou de um array JSON de topo.
+    
+    O formato é detectado pelo primeiro caractere não-branco ('[' = array).
+    Linhas NDJSON e elementos de array inválidos são registrados em log,
+    contados em `stats.errors` e pulados (a leitura do array recomeça na
+    próxima fronteira de elemento); a memória fica limitada ao maior
+    elemento (até MAX_JSON_RECORD_CHARS).
+    """
+    first = handle.read(1)
+    while first and first.isspace():
+        first = handle.read(1)
+    if not first:
+        return
+    
+    if first != "[":
+        for number, line in enumerate(itertools.chain([first + handle.readline()], handle), 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                stats.errors += 1
+                logging.error(f"Falha ao parsear linha NDJSON {number}: {e}")
+        return
+    
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    # Um elemento incompleto só é decodificado de novo com o buffer ao menos
+    # duas vezes maior (leituras geométricas: custo linear no tamanho dele)
+    wanted = 0
+    number = 0
+    while True:
+        # Descarta separadores entre elementos
+        while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+            pos += 1
+        if buffer.startswith("]", pos):
+            return
+        if pos < len(buffer) and (eof or len(buffer) - pos >= wanted):
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                boundary = _json_element_end(buffer, pos)
+                if boundary >= 0 or eof:
+                    # Elemento completo porém inválido: conta e segue da próxima fronteira
+                    number += 1
+                    stats.errors += 1
+                    logging.error(f"Falha ao parsear elemento {number} do array JSON: {e}")
+                    if boundary < 0:
+                        return
+                    pos = boundary
+                    continue
+                wanted = 2 * (len(buffer) - pos)
+                end = -1
+            # Um valor que termina no fim do buffer (ex.: número) pode continuar no próximo chunk
+            if end > 0 and (end < len(buffer) or eof):
+                number += 1
+                wanted = 0
+                yield item
+                pos = end
+                continue
+        elif eof:
+            return
+        if len(buffer) - pos > MAX_JSON_RECORD_CHARS:
+            stats.errors += 1
+            logging.error(
+                f"Elemento {number + 1} do array JSON passa de {MAX_JSON_RECORD_CHARS} "
+                "caracteres sem fechar; leitura interrompida"
+            )
+            return
+        chunk = handle.read(max(chunk_size, wanted - (len(buffer) - pos)))
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def _json_element_end(buffer: str, pos: int) -> int:
+    """
+    Posição da ',' ou ']' que encerra o elemento de array iniciado em `pos`
+    (fora de strings e de objetos/arrays aninhados), ou -1 se ainda não chegou.
+    """
+    depth = 0
+    scan = pos
+    while True:
+        match = _JSON_STRUCTURE.search(buffer, scan)
+        if match is None:
+            return -1
+        char = match.group()
+        scan = match.end()
+        if char == '"':
+            # Pula a string, respeitando escapes
+            while True:
+                special = _JSON_STRING_SPECIAL.search(buffer, scan)
+                if special is None:
+                    return -1
+                scan = special.end()
+                if special.group() == '"':
+                    break
+                scan += 1
+        elif char in "[{":
+            depth += 1
+        elif depth > 0:
+            if char in "]}":
+                depth -= 1
+        elif char != "}":
+            return match.start()
+
+
 class IngestionEngine:
     """Converte dados brutos em objetos Evidence."""
     
-    def __init__(self, audit_logger: AuditLogger):
+    def __init__(
+        self,
+        audit_logger: AuditLogger,
+        feature_extractor: Optional[Callable[[str], EvidenceFeatures]] = None,
+        content_addressed: bool = False,
+        id_metadata_keys: Iterable[str] = (),
+        metrics: Optional[Metrics] = None
+    ):
         self.audit_logger = audit_logger
+        self.metrics = metrics
+        self.feature_extractor = feature_extractor
+        self.content_addressed = content_addressed
+        self.id_metadata_keys = tuple(id_metadata_keys)
+        self.stream_stats = StreamStats()
     
-    def _generate_id(self, content: str, source_type: EvidenceType) -> str:
-        """Gera ID único baseado no conteúdo."""
-        hash_input = f"{content}{source_type.value}{datetime.now().timestamp()}"
+    def _generate_id(
+        self,
+        content: str,
+        source_type: EvidenceType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Gera ID único baseado no conteúdo.
+        
+        Com `content_addressed`, o ID é determinístico: depende apenas do
+        conteúdo, do tipo de fonte e das chaves `id_metadata_keys` do
+        metadata, de modo que reingerir o mesmo item gera o mesmo ID.
+        """
+        if self.content_addressed:
+            metadata = metadata or {}
+            selected = {key: metadata[key] for key in self.id_metadata_keys if key in metadata}
+            hash_input = "\x1f".join([
+                content,
+                source_type.value,
+                json.dumps(selected, sort_keys=True, default=str)
+            ])
+        else:
+            hash_input = f"{content}{source_type.value}{datetime.now().timestamp()}"
         return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
     
     def ingest_text(
@@ -159,15 +1031,53 @@ class IngestionEngine:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Evidence:
         """Ingere texto simples."""
-        evidence = Evidence(
-            id=self._generate_id(content, source_type),
+        evidence = self._build_evidence(content, source_type, metadata)
+        self.audit_logger.log_ingestion(evidence)
+        return evidence
+    
+    def _build_evidence(
+        self,
+        content: str,
+        source_type: EvidenceType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Evidence:
+        """Monta a Evidence (com atributos pré-computados) sem auditar."""
+        if self.metrics is None:
+            return Evidence(
+                id=self._generate_id(content, source_type, metadata),
+                content=content,
+                source_type=source_type,
+                timestamp=datetime.now().timestamp(),
+                metadata=metadata or {},
+                features=self.feature_extractor(content) if self.feature_extractor else None
+            )
+        
+        start = time.perf_counter()
+        evidence_id = self._generate_id(content, source_type, metadata)
+        features_start = time.perf_counter()
+        features = self.feature_extractor(content) if self.feature_extractor else None
+        end = time.perf_counter()
+        self.metrics.observe_stage("ingest.features", end - features_start)
+        self.metrics.observe_stage("ingest.build", end - start)
+        self.metrics.inc("evidences_built_total")
+        return Evidence(
+            id=evidence_id,
             content=content,
             source_type=source_type,
             timestamp=datetime.now().timestamp(),
-            metadata=metadata or {}
+            metadata=metadata or {},
+            features=features
+        )
+    
+    def _evidence_from_item(self, item: Any) -> Evidence:
+        """Converte um registro JSON em Evidence, como em ingest_json."""
+        if not isinstance(item, dict):
+            return self._build_evidence(json.dumps(item), EvidenceType.EXTERNAL_API)
+        return self._build_evidence(
+            content=json.dumps(item.get('content', item)),
+            source_type=EvidenceType.EXTERNAL_API,
+            metadata=item.get('metadata', {})
         )
-        self.audit_logger.log_ingestion(evidence)
-        return evidence
     
     def ingest_json(self, json_str: str) -> List[Evidence]:
         """Ingere JSON e extrai múltiplas evidências."""
@@ -192,6 +1102,42 @@ class IngestionEngine:
             logging.error(f"Falha ao parsear JSON: {e}")
             return []
     
+    def iter_json_stream(
+        self,
+        source: Union[str, "os.PathLike[str]", TextIO],
+        batch_size: int = 500,
+        chunk_size: int = 1 << 16
+    ) -> Iterator[Evidence]:
+        """
+        Ingere NDJSON ou um array JSON de topo, um registro por vez.
+        
+        Aceita caminho de arquivo ou objeto de arquivo texto. A memória fica
+        limitada a um chunk de leitura mais o lote de auditoria pendente; os
+        registros de ingestão são gravados em lotes de `batch_size` (e o
+        restante quando o gerador termina ou é fechado). O progresso fica
+        disponível em `self.stream_stats`.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as handle:
+                yield from self.iter_json_stream(handle, batch_size, chunk_size)
+            return
+        
+        stats = self.stream_stats = StreamStats()
+        pending: List[Evidence] = []
+        try:
+            for item in _iter_json_records(source, chunk_size, stats):
+                evidence = self._evidence_from_item(item)
+                pending.append(evidence)
+                stats.records += 1
+                if len(pending) >= batch_size:
+                    self.audit_logger.log_ingestions(pending)
+                    pending = []
+                yield evidence
+        finally:
+            if pending:
+                self.audit_logger.log_ingestions(pending)
+            stats.finish()
+    
     def ingest_email_mock(
         self, 
         subject: str, 
@@ -213,32 +1159,269 @@ class IngestionEngine:
 
 
 # ============================================================================
-# 4. TRUTH SEEKER - MOTOR DE VERIFICAÇÃO
+# 5. TOKENIZER - EXTRAÇÃO DE PALAVRAS-CHAVE
+# ============================================================================
+
+class Tokenizer(ABC):
+    """
+    Converte texto em palavras-chave. A mesma instância é usada na ingestão
+    (atributos das evidências) e na verificação (claims), e deve ser
+    serializável (pickle) para os processos de verify_many e dos shards.
+    """
+    
+    name = "base"
+    
+    @abstractmethod
+    def tokenize(self, text: str) -> List[str]:
+        """Palavras-chave do texto, em ordem de ocorrência."""
+    
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Tokeniza vários documentos de uma vez."""
+        return [self.tokenize(text) for text in texts]
+
+
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+_SIMPLE_STOPWORDS = frozenset({'o', 'a', 'de', 'em', 'para', 'com', 'por', 'que', 'e', 'do', 'da'})
+
+
+class SimpleTokenizer(Tokenizer):
+    """
+    Tokenizador original: minúsculas, pontuação vira espaço, 11 stopwords e
+    palavras com mais de 3 caracteres. É o padrão, para não alterar
+    vereditos nem atributos já persistidos.
+    """
+    
+    name = "simple"
+    
+    def tokenize(self, text: str) -> List[str]:
+        stopwords = _SIMPLE_STOPWORDS
+        return [
+            word for word in _NON_WORD_PATTERN.sub(' ', text.lower()).split()
+            if len(word) > 3 and word not in stopwords
+        ]
+
+
+# Stopwords do português já sem acentos (comparadas após o accent folding)
+PORTUGUESE_STOPWORDS = frozenset("""
+    a ao aos aquela aquelas aquele aqueles aquilo as ate com como da das de dela delas dele
+    deles depois do dos e ela elas ele eles em entre era eram essa essas esse esses esta
+    estao estas estava estavam este estes estou eu foi fomos for foram fosse fossem fui ha
+    isso isto ja la lhe lhes mais mas me mesmo meu meus minha minhas muito na nao nas nem
+    no nos nossa nossas nosso nossos num numa o os ou para pela pelas pelo pelos por qual
+    quando que quem se sem ser sera seu seus so sua suas tambem te tem tinha tinham um uma
+    umas uns voce voces vos ser sao seja sejam tenho temos tiver toda todas todo todos
+    sobre ainda apenas aqui ali cada onde porque pois entao assim tal tao
+""".split())
+
+# Stemmer leve: plural -> singular e, depois, um sufixo nominal ou verbal.
+# Formas verbais terminadas em "s" (reduzimos) são testadas antes do plural.
+_PORTUGUESE_PLURALS = (("ns", "m"), ("oes", "ao"), ("aes", "ao"), ("eis", "el"), ("ais", "al"))
+_PORTUGUESE_SUFFIXES = sorted([
+    ("amento", ""), ("imento", ""), ("ucao", "uz"), ("acao", ""), ("icao", ""),
+    ("mente", ""), ("idade", ""), ("ismo", ""), ("ista", ""), ("avel", ""), ("ivel", ""),
+    ("encia", ""), ("ancia", ""), ("eza", ""), ("oso", ""), ("osa", ""), ("ivo", ""), ("iva", ""),
+    ("aremos", ""), ("eremos", ""), ("iremos", ""), ("ariam", ""), ("eriam", ""), ("iriam", ""),
+    ("avam", ""), ("aram", ""), ("eram", ""), ("iram", ""), ("amos", ""), ("emos", ""), ("imos", ""),
+    ("ando", ""), ("endo", ""), ("indo", ""), ("ado", ""), ("ada", ""), ("ido", ""), ("ida", ""),
+    ("ar", ""), ("er", ""), ("ir", ""), ("ou", ""), ("eu", ""), ("iu", ""), ("am", ""), ("em", ""),
+], key=lambda rule: -len(rule[0]))
+
+
+# Tabela de bytes (ASCII): todo caractere que não é letra, dígito ou o
+# separador de documentos (0x1E) vira espaço
+_FOLD_SEPARATOR = b"\x1e"
+_FOLD_PUNCTUATION = bytes(
+    code for code in range(128)
+    if not chr(code).isalnum() and code != _FOLD_SEPARATOR[0]
+)
+_FOLD_TABLE = bytes.maketrans(_FOLD_PUNCTUATION, b" " * len(_FOLD_PUNCTUATION))
+# Pontuação/símbolos fora do ASCII (aspas curvas, travessões, º, €...), que
+# de outro modo seriam descartados sem separar as palavras vizinhas
+_UNICODE_SEPARATORS = re.compile(r"[\u00a0-\u00bf\u00d7\u00f7\u2000-\u206f\u20a0-\u20cf\u2100-\u2bff]")
+
+
+def fold_text(text: str) -> bytes:
+    """
+    Minúsculas, sem acentos (NFKD + ASCII) e com pontuação trocada por
+    espaço, em operações de C: pronto para `split()`.
+    """
+    decomposed = unicodedata.normalize("NFKD", _UNICODE_SEPARATORS.sub(" ", text.lower()))
+    return decomposed.encode("ascii", "ignore").translate(_FOLD_TABLE)
+
+
+class PortugueseTokenizer(Tokenizer):
+    """
+    Tokenizador para português: accent folding e pontuação numa passada
+    (`fold_text`), stopwords reais e stemmer leve por sufixos, de modo que
+    "redução", "reduziu" e "reduzimos" viram o mesmo termo ("reduz").
+    
+    O termo de cada palavra distinta é memorizado (até `cache_size`
+    palavras; ao encher, o cache recomeça só com as palavras da chamada
+    atual), com segurança para várias threads. `tokenize_many` normaliza
+    os documentos em lotes de `BATCH_SIZE`, numa passada por lote.
+    """
+    
+    name = "portuguese"
+    
+    # Documentos por passada de fold_text em tokenize_many
+    BATCH_SIZE = 256
+    
+    def __init__(
+        self,
+        stopwords: Iterable[str] = PORTUGUESE_STOPWORDS,
+        stem: bool = True,
+        min_length: int = 3,
+        cache_size: int = 100000
+    ):
+        self.stopwords = frozenset(stopwords)
+        self.stem = stem
+        self.min_length = min_length
+        self.cache_size = cache_size
+        self._cache: Dict[bytes, str] = {}
+    
+    @staticmethod
+    def _strip_suffix(word: str) -> Optional[str]:
+        for suffix, replacement in _PORTUGUESE_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= 3:
+                return word[:-len(suffix)] + replacement
+        return None
+    
+    def stem_word(self, word: str) -> str:
+        """Radical de uma palavra já em minúsculas e sem acentos."""
+        stemmed = self._strip_suffix(word)
+        if stemmed is not None:
+            return stemmed
+        for suffix, replacement in _PORTUGUESE_PLURALS:
+            if word.endswith(suffix) and len(word) > len(suffix) + 2:
+                word = word[:-len(suffix)] + replacement
+                break
+        else:
+            if word.endswith("s") and len(word) > 4:
+                word = word[:-1]
+        stemmed = self._strip_suffix(word)
+        if stemmed is not None:
+            return stemmed
+        if word[-1] in "aeo" and len(word) > 4:
+            word = word[:-1]
+        return word
+    
+    def _normalize(self, raw: bytes) -> str:
+        """Palavra (bytes ASCII) -> termo ("" se descartada)."""
+        word = raw.decode("ascii")
+        if len(word) < self.min_length or word in self.stopwords:
+            return ""
+        return self.stem_word(word) if self.stem and not word.isdigit() else word
+    
+    def _learn(self, words: Iterable[bytes]) -> Dict[bytes, str]:
+        """
+        Garante no cache o termo de cada palavra distinta e devolve o cache.
+        
+        Um cache nunca perde entradas: ao encher, é substituído por outro,
+        de modo que o dict devolvido a uma thread continua completo mesmo
+        que outra recomece o cache em seguida.
+        """
+        cache = self._cache
+        distinct = set(words)
+        unseen = distinct.difference(cache)
+        if unseen:
+            if len(cache) + len(unseen) > self.cache_size:
+                # Recomeça com todas as palavras desta chamada (inclusive as já
+                # conhecidas), que o chamador vai consultar em seguida
+                cache = {word: cache[word] for word in distinct if word in cache}
+                self._cache = cache
+            normalize = self._normalize
+            for word in unseen:
+                cache[word] = normalize(word)
+        return cache
+    
+    def tokenize(self, text: str) -> List[str]:
+        words = fold_text(text).replace(_FOLD_SEPARATOR, b" ").split()
+        return [term for term in map(self._learn(words).__getitem__, words) if term]
+    
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[str]]:
+        texts = list(texts)
+        results: List[List[str]] = []
+        separator = _FOLD_SEPARATOR.decode()
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            # O separador dentro de um documento é só um espaço
+            batch = [text.replace(separator, " ") for text in texts[start:start + self.BATCH_SIZE]]
+            folded = fold_text(separator.join(batch))
+            documents = [document.split() for document in folded.split(_FOLD_SEPARATOR)]
+            if len(documents) != len(batch):
+                raise ValueError(f"tokenize_many: {len(documents)} documentos para {len(batch)} textos")
+            lookup = self._learn(itertools.chain.from_iterable(documents)).__getitem__
+            results.extend([term for term in map(lookup, words) if term] for words in documents)
+        return results
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # O cache não viaja para os processos de verificação
+        return {**self.__dict__, "_cache": {}}
+
+
+# ============================================================================
+# 6. TRUTH SEEKER - MOTOR DE VERIFICAÇÃO
 # ============================================================================
 
+_PERCENTAGE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(?:%|por\s*cento)', re.IGNORECASE)
+_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+
 class TruthSeeker:
     """Núcleo lógico de verificação de afirmações."""
     
-    def __init__(self, audit_logger: AuditLogger):
+    # Tolerância relativa para comparação de valores numéricos
+    NUMERIC_TOLERANCE = 0.05
+    # Relevância (Jaccard) acima da qual uma evidência apoia a claim textual
+    TEXTUAL_MATCH_THRESHOLD = 0.3
+    # Concordantes a partir das quais o veredito numérico não muda mais:
+    # min(0.9, 0.6 + 0.1·m) satura em m = 3
+    NUMERIC_SATURATION = 3
+    # Ordens de varredura do modo fast_verdict
+    FAST_VERDICT_PRIORITIES = ("confidence", "recency")
+    
+    def __init__(
+        self,
+        audit_logger: Optional[AuditLogger],
+        metrics: Optional[Metrics] = None,
+        tokenizer: Optional[Tokenizer] = None
+    ):
+        # audit_logger pode ser None quando apenas evaluate_claim é usado
+        # (ex.: processos de verify_many, que não compartilham a conexão SQLite)
         self.audit_logger = audit_logger
+        self.metrics = metrics
+        self.tokenizer = tokenizer if tokenizer is not None else SimpleTokenizer()
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extrai palavras-chave importantes."""
-        # Remove pontuação e converte para minúsculas
-        cleaned = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = cleaned.split()
-        
-        # Remove stopwords comuns
-        stopwords = {'o', 'a', 'de', 'em', 'para', 'com', 'por', 'que', 'e', 'do', 'da'}
-        keywords = [w for w in words if w not in stopwords and len(w) > 3]
-        
-        return keywords
+        return self.tokenizer.tokenize(text)
+    
+    def extract_features(self, content: str) -> EvidenceFeatures:
+        """Calcula os atributos de uma evidência (palavras-chave e números)."""
+        return EvidenceFeatures(
+            keywords=frozenset(self._extract_keywords(content)),
+            numeric_facts=self._extract_numeric_facts(content)
+        )
+    
+    def extract_features_many(self, contents: List[str]) -> List[EvidenceFeatures]:
+        """extract_features em lote (tokenização de todos os textos de uma vez)."""
+        return [
+            EvidenceFeatures(keywords=frozenset(keywords), numeric_facts=self._extract_numeric_facts(content))
+            for content, keywords in zip(contents, self.tokenizer.tokenize_many(contents))
+        ]
+    
+    def _features_of(self, evidence: Evidence) -> EvidenceFeatures:
+        """Retorna os atributos da evidência, calculando-os se ausentes."""
+        features = evidence.features
+        if features is None:
+            features = evidence.features = self.extract_features(evidence.content)
+        return features
     
     def _calculate_relevance(self, claim: str, evidence: Evidence) -> float:
         """Calcula relevância entre claim e evidência."""
-        claim_keywords = set(self._extract_keywords(claim))
-        evidence_keywords = set(self._extract_keywords(evidence.content))
-        
+        return self._jaccard(set(self._extract_keywords(claim)), self._features_of(evidence).keywords)
+    
+    def _jaccard(self, claim_keywords: Set[str], evidence_keywords: FrozenSet[str]) -> float:
+        """Similaridade de Jaccard entre os conjuntos de palavras-chave."""
         if not claim_keywords:
             return 0.0
         
@@ -270,179 +1453,3382 @@ class TruthSeeker:
         
         return None
     
+    def _extract_numeric_facts(self, text: str) -> Tuple[Tuple[str, float], ...]:
+        """Extrai todos os percentuais e números de um texto, em ordem de ocorrência."""
+        facts: List[Tuple[int, str, float]] = []
+        percentage_starts = set()
+        for match in _PERCENTAGE_PATTERN.finditer(text):
+            percentage_starts.add(match.start(1))
+            facts.append((match.start(1), "percentage", float(match.group(1))))
+        for match in _NUMBER_PATTERN.finditer(text):
+            if match.start() not in percentage_starts:
+                facts.append((match.start(), "number", float(match.group())))
+        facts.sort()
+        return tuple((kind, value) for _, kind, value in facts)
+    
+    def _numeric_range(self, claim_num: float) -> Tuple[float, float]:
+        """Faixa [v·0.95, v·1.05] aceita pela tolerância numérica."""
+        margin = abs(claim_num) * self.NUMERIC_TOLERANCE
+        return claim_num - margin, claim_num + margin
+    
+    def _within_tolerance(self, ev_num: float, claim_num: float) -> bool:
+        if claim_num == 0:
+            return ev_num == 0
+        return abs(ev_num - claim_num) / claim_num <= self.NUMERIC_TOLERANCE
+    
     def _verify_numeric_claim(
         self, 
         claim_value: Tuple[str, float], 
-        evidences: List[Evidence]
-    ) -> Tuple[ValidationStatus, float, List[str], str]:
-        """Verifica claims numéricas contra evidências."""
-        claim_type, claim_num = claim_value
-        supporting = []
-        total_evidence_score = 0.0
-        matching_count = 0
+        evidences: Iterable[Evidence],
+        corpus_size: Optional[int] = None
+    ) -> Tuple[ValidationStatus, float, List[str], ReasoningTrace]:
+        """
+        Verifica claims numéricas contra evidências.
         
-        reasoning = f"Verificando claim numérica: {claim_num} ({claim_type})\n"
+        Cada evidência é comparada pelo seu valor mais próximo da claim. Se
+        `corpus_size` for informado, `evidences` contém apenas os candidatos
+        devolvidos pela busca por faixa do índice numérico.
+        """
+        entries, scanned = self._numeric_entries(claim_value[1], evidences)
+        return self._numeric_outcome(claim_value, entries, scanned, corpus_size)
+    
+    def _numeric_entries(
+        self,
+        claim_num: float,
+        evidences: Iterable[Evidence],
+        stop_after: Optional[int] = None
+    ) -> Tuple[List[TraceEntry], int]:
+        """
+        Compara cada evidência pelo seu fato mais próximo; retorna (entradas, varridas).
         
+        Com `stop_after`, para assim que houver essa quantidade de concordantes.
+        """
+        entries = []
+        scanned = 0
+        matches = 0
         for evidence in evidences:
-            evidence_value = self._extract_numeric_claim(evidence.content)
-            if evidence_value:
-                ev_type, ev_num = evidence_value
-                reasoning += f"  - Evidência {evidence.id[:8]}: {ev_num} ({ev_type})\n"
-                
+            scanned += 1
+            facts = self._features_of(evidence).numeric_facts
+            if facts:
+                ev_type, ev_num = min(facts, key=lambda fact: abs(fact[1] - claim_num))
                 # Tolerância de 5% para comparação
-                tolerance = 0.05
-                if abs(ev_num - claim_num) / claim_num <= tolerance:
-                    supporting.append(evidence.id)
-                    total_evidence_score += 1.0
-                    matching_count += 1
-                    reasoning += f"    ✓ MATCH (dentro da tolerância de {tolerance*100}%)\n"
-                else:
-                    reasoning += f"    ✗ NO MATCH (diferença: {abs(ev_num - claim_num)})\n"
-        
-        if matching_count >= 2:
-            status = ValidationStatus.VERIFIED_TRUE
-            confidence = min(0.9, 0.6 + (matching_count * 0.1))
-            reasoning += f"\nCONCLUSÃO: VERIFICADO (>= 2 evidências concordantes)\n"
-        elif matching_count == 1:
-            status = ValidationStatus.INCONCLUSIVE
-            confidence = 0.5
-            reasoning += f"\nCONCLUSÃO: INCONCLUSIVO (apenas 1 evidência)\n"
-        else:
-            status = ValidationStatus.VERIFIED_FALSE
-            confidence = 0.7
-            reasoning += f"\nCONCLUSÃO: FALSO (nenhuma evidência concordante)\n"
+                matched = self._within_tolerance(ev_num, claim_num)
+                entries.append(TraceEntry(evidence.id, ev_num, matched, ev_type))
+                matches += matched
+                if matches == stop_after:
+                    break
+        return entries, scanned
+    
+    @staticmethod
+    def _parse_confidence(value: Any) -> Optional[float]:
+        """Valor de metadata['confidence'] como número (aceita "0.9"); None se inválido."""
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                return None
+        if isinstance(value, (int, float)) and math.isfinite(value):
+            return float(value)
+        return None
+    
+    @classmethod
+    def _metadata_confidence(cls, evidence: Evidence) -> float:
+        """metadata['confidence'] numérico (0.0 quando ausente ou inválido)."""
+        return cls._parse_confidence(evidence.metadata.get("confidence")) or 0.0
+    
+    def _prioritized(
+        self,
+        evidences: Mapping[str, Evidence],
+        candidate_ids: List[str],
+        priority: str,
+        index: Optional[Any] = None
+    ) -> Iterator[Evidence]:
+        """
+        Candidatos na ordem de varredura do modo fast_verdict, buscados em
+        lotes pequenos (a varredura curta não carrega os demais).
+        
+        "recency": os inseridos por último primeiro; "confidence":
+        metadata['confidence'] decrescente, empates pelos mais recentes. A
+        confiança vem do índice (`index.confidence`); índices sem ela
+        (persist_evidence, snapshot) exigem buscar todos os candidatos antes.
+        """
+        if priority == "recency":
+            ordered_ids = candidate_ids[::-1]
+            for start in range(0, len(ordered_ids), 64):
+                yield from self._fetch(evidences, ordered_ids[start:start + 64])
+            return
+        # Heap em vez de ordenação: a varredura costuma parar nos primeiros
+        confidence = getattr(index, "confidence", None)
+        if confidence is not None:
+            id_heap = [
+                (-confidence(evidence_id), -position, evidence_id)
+                for position, evidence_id in enumerate(candidate_ids)
+            ]
+            heapq.heapify(id_heap)
+            while id_heap:
+                batch = [heapq.heappop(id_heap)[2] for _ in range(min(64, len(id_heap)))]
+                yield from self._fetch(evidences, batch)
+            return
+        heap = [
+            (-self._metadata_confidence(evidence), -position, evidence)
+            for position, evidence in enumerate(self._fetch(evidences, candidate_ids))
+        ]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[2]
+    
+    def _numeric_outcome(
+        self,
+        claim_value: Tuple[str, float],
+        entries: List[TraceEntry],
+        scanned: int,
+        corpus_size: Optional[int] = None,
+        unscanned: int = 0,
+        supporting: Optional[List[str]] = None,
+        evaluated: Optional[int] = None
+    ) -> Tuple[ValidationStatus, float, List[str], ReasoningTrace]:
+        """
+        Agrega entradas numéricas já calculadas no veredito.
+        
+        `unscanned` conta os candidatos deixados de lado por uma parada
+        antecipada. Com `supporting` e `evaluated` (totais vindos dos
+        shards), `entries` pode trazer só parte das entradas avaliadas.
+        """
+        claim_type, claim_num = claim_value
+        trace = ReasoningTrace(
+            header=f"Verificando claim numérica: {claim_num} ({claim_type})\n",
+            mode="numeric",
+            entries=entries,
+            claim_value=claim_num,
+            tolerance=self.NUMERIC_TOLERANCE
+        )
+        shown_supporting = [entry.evidence_id for entry in entries if entry.matched]
+        if supporting is None:
+            supporting = shown_supporting
+        trace.omitted_entries = (len(entries) if evaluated is None else evaluated) - len(entries)
+        trace.omitted_matched = len(supporting) - len(shown_supporting)
+        matching_count = len(supporting)
+        
+        if unscanned:
+            trace.notes.append(
+                f"  - Varredura encerrada com {matching_count} evidências concordantes "
+                f"(veredito saturado): {unscanned} candidata(s) não avaliada(s)\n"
+            )
+        if corpus_size is not None and corpus_size > scanned + unscanned:
+            low, high = self._numeric_range(claim_num)
+            trace.notes.append(
+                f"  - {corpus_size - scanned - unscanned} evidência(s) sem valores na faixa "
+                f"[{low:g}, {high:g}]\n"
+            )
+        
+        status, confidence, trace.conclusion = self._numeric_verdict(matching_count)
         
-        return status, confidence, supporting, reasoning
+        return status, confidence, supporting, trace
+    
+    def _numeric_verdict(self, matching_count: int) -> Tuple[ValidationStatus, float, str]:
+        """Veredito de uma claim numérica a partir do número de evidências concordantes."""
+        if matching_count >= 2:
+            return (
+                ValidationStatus.VERIFIED_TRUE,
+                min(0.9, 0.6 + (matching_count * 0.1)),
+                "\nCONCLUSÃO: VERIFICADO (>= 2 evidências concordantes)\n"
+            )
+        if matching_count == 1:
+            return (
+                ValidationStatus.INCONCLUSIVE,
+                0.5,
+                "\nCONCLUSÃO: INCONCLUSIVO (apenas 1 evidência)\n"
+            )
+        return (
+            ValidationStatus.VERIFIED_FALSE,
+            0.7,
+            "\nCONCLUSÃO: FALSO (nenhuma evidência concordante)\n"
+        )
     
     def _verify_textual_claim(
         self, 
         claim: str, 
-        evidences: List[Evidence]
-    ) -> Tuple[ValidationStatus, float, List[str], str]:
-        """Verifica claims textuais usando relevância semântica."""
-        relevance_scores = []
+        evidences: List[Evidence],
+        corpus_size: Optional[int] = None,
+        claim_keywords: Optional[Set[str]] = None
+    ) -> Tuple[ValidationStatus, float, List[str], ReasoningTrace]:
+        """
+        Verifica claims textuais usando relevância semântica.
+        
+        Se `corpus_size` for informado, `evidences` contém apenas os candidatos
+        (evidências com ao menos uma palavra-chave em comum) e as demais
+        contam como relevância 0.0 na média.
+        """
+        if claim_keywords is None:
+            claim_keywords = set(self._extract_keywords(claim))
+        relevance_scores = [
+            (evidence.id, self._jaccard(claim_keywords, self._features_of(evidence).keywords))
+            for evidence in evidences
+        ]
+        return self._textual_outcome(claim, relevance_scores, corpus_size)
+    
+    def _textual_outcome(
+        self,
+        claim: str,
+        relevance_scores: List[Tuple[str, float]],
+        corpus_size: Optional[int] = None,
+        pruned: Optional["PrunedScores"] = None,
+        totals: Optional["ShardTotals"] = None
+    ) -> Tuple[ValidationStatus, float, List[str], ReasoningTrace]:
+        """
+        Agrega relevâncias (ID, score) já calculadas no veredito textual.
+        
+        Com `pruned`, o grupo resumido pelo histograma entra na média e no
+        máximo (e numa nota do trace), sem entradas individuais. Com
+        `totals` (agregados dos shards), `relevance_scores` pode trazer só
+        parte das relevâncias; média, máximo e suporte vêm dos totais.
+        """
         supporting = []
-        reasoning = f"Verificando claim textual: '{claim}'\n"
+        trace = ReasoningTrace(header=f"Verificando claim textual: '{claim}'\n", mode="textual")
         
-        for evidence in evidences:
-            relevance = self._calculate_relevance(claim, evidence)
-            relevance_scores.append((evidence.id, relevance))
-            reasoning += f"  - Evidência {evidence.id[:8]}: relevância {relevance:.2f}\n"
-            
-            if relevance > 0.3:  # Threshold de relevância
-                supporting.append(evidence.id)
+        for evidence_id, relevance in relevance_scores:
+            matched = relevance > self.TEXTUAL_MATCH_THRESHOLD
+            trace.entries.append(TraceEntry(evidence_id, relevance, matched))
+            if matched:
+                supporting.append(evidence_id)
+        evaluated = len(relevance_scores)
+        if totals is not None:
+            evaluated = totals.evaluated
+            trace.omitted_entries = evaluated - len(relevance_scores)
+            trace.omitted_matched = len(totals.supporting) - len(supporting)
+            supporting = totals.supporting
         
-        if not relevance_scores:
-            return ValidationStatus.INCONCLUSIVE, 0.0, [], reasoning + "\nSem evidências.\n"
+        total = evaluated if corpus_size is None else corpus_size
+        if not total:
+            trace.conclusion = "\nSem evidências.\n"
+            return ValidationStatus.INCONCLUSIVE, 0.0, [], trace
         
-        avg_relevance = sum(r for _, r in relevance_scores) / len(relevance_scores)
-        max_relevance = max(r for _, r in relevance_scores)
+        aggregated = pruned.aggregated if pruned is not None else 0
+        skipped = total - evaluated - aggregated
+        if skipped:
+            trace.notes.append(
+                f"  - {skipped} evidência(s) sem palavras-chave em comum: relevância 0.00\n"
+            )
         
-        if max_relevance > 0.5 and avg_relevance > 0.3:
-            status = ValidationStatus.VERIFIED_TRUE
-            confidence = min(0.85, avg_relevance + 0.3)
-        elif max_relevance > 0.3:
-            status = ValidationStatus.INCONCLUSIVE
-            confidence = 0.5
+        if totals is not None:
+            avg_relevance = totals.score_sum / total
+            max_relevance = totals.score_max
+        elif not aggregated:
+            avg_relevance = sum(r for _, r in relevance_scores) / total
+            max_relevance = max((r for _, r in relevance_scores), default=0.0)
         else:
-            status = ValidationStatus.VERIFIED_FALSE
-            confidence = 0.6
+            trace.notes.append(
+                f"  - {aggregated} evidência(s) só com '{pruned.aggregated_token}' em comum: "
+                f"relevância até {pruned.aggregated_max:.2f}, somadas pelo histograma de tamanhos\n"
+            )
+            avg_relevance = math.fsum(
+                itertools.chain((r for _, r in relevance_scores), (pruned.aggregated_sum,))
+            ) / total
+            max_relevance = max(max((r for _, r in relevance_scores), default=0.0), pruned.aggregated_max)
         
-        reasoning += f"\nRelevância média: {avg_relevance:.2f}, máxima: {max_relevance:.2f}\n"
-        reasoning += f"CONCLUSÃO: {status.value}\n"
+        status, confidence = self._textual_verdict(avg_relevance, max_relevance)
         
-        return status, confidence, supporting, reasoning
+        trace.conclusion = (
+            f"\nRelevância média: {avg_relevance:.2f}, máxima: {max_relevance:.2f}\n"
+            f"CONCLUSÃO: {status.value}\n"
+        )
+        
+        return status, confidence, supporting, trace
+    
+    def _textual_verdict(
+        self,
+        avg_relevance: float,
+        max_relevance: float
+    ) -> Tuple[ValidationStatus, float]:
+        """Veredito de uma claim textual a partir das relevâncias média e máxima."""
+        if max_relevance > 0.5 and avg_relevance > 0.3:
+            return ValidationStatus.VERIFIED_TRUE, min(0.85, avg_relevance + 0.3)
+        if max_relevance > 0.3:
+            return ValidationStatus.INCONCLUSIVE, 0.5
+        return ValidationStatus.VERIFIED_FALSE, 0.6
     
-    def verify_claim(self, claim: str, evidences: List[Evidence]) -> VerificationResult:
+    def _numeric_candidates(self, index: "EvidenceIndex", claim_num: float) -> List[str]:
+        """IDs com algum fato na faixa de tolerância, pelo índice numérico."""
+        low, high = self._numeric_range(claim_num)
+        # Margem mínima para que arredondamentos não excluam valores da borda;
+        # a tolerância exata é reaplicada em _numeric_entries
+        slack = max(abs(high), 1.0) * 1e-9
+        return index.numeric_range(low - slack, high + slack)
+    
+    def _fetch(self, evidences: Mapping[str, Evidence], evidence_ids: List[str]) -> List[Evidence]:
+        """Busca os candidatos no corpus (em lote, se o corpus suportar)."""
+        get_many = getattr(evidences, "get_many", None)
+        if get_many is not None:
+            return get_many(evidence_ids)
+        return [evidences[eid] for eid in evidence_ids]
+    
+    def evaluate_claim(
+        self,
+        claim: str,
+        evidences: List[Evidence],
+        index: Optional["EvidenceIndex"] = None,
+        scorer: Optional["VectorScorer"] = None,
+        retriever: Optional["MinHashLSH"] = None,
+        threshold_pruning: bool = False,
+        fast_verdict: Optional[str] = None
+    ) -> VerificationResult:
         """
-        Verifica uma afirmação contra um conjunto de evidências.
+        Avalia uma afirmação sem registrar auditoria.
         
         Args:
             claim: A afirmação a ser verificada
-            evidences: Lista de evidências disponíveis
+            evidences: Lista de evidências disponíveis (ou, quando `index`
+                é informado, o mapeamento ID -> Evidence do corpus)
+            index: Índice invertido opcional; claims textuais passam a
+                pontuar apenas evidências com palavras-chave em comum
+            scorer: VectorScorer opcional; claims textuais são pontuadas
+                contra todo o corpus numa única operação vetorizada
+            retriever: MinHashLSH opcional; claims textuais pontuam apenas os
+                candidatos aproximados do LSH (evidências abaixo do limiar
+                tendem a ficar de fora, então a média é subestimada)
+            threshold_pruning: com `index`, claims textuais são pontuadas por
+                `index.threshold_scores` (filtros de tamanho e de prefixo);
+                veredito, média e máximo são os mesmos, mas evidências que só
+                têm o termo mais frequente da claim em comum aparecem no
+                trace apenas como nota agregada
+            fast_verdict: ordem de varredura ("confidence" ou "recency")
+                para claims numéricas pararem ao atingir NUMERIC_SATURATION
+                concordantes, quando status e confiança já não mudam; o
+                resultado sai com `early_terminated` e lista apenas as
+                concordantes encontradas até ali. None varre tudo.
             
         Returns:
             VerificationResult com status, confiança e raciocínio
         """
+        if fast_verdict is not None and fast_verdict not in self.FAST_VERDICT_PRIORITIES:
+            raise ValueError(f"fast_verdict inválido: {fast_verdict!r}")
         if not evidences:
-            result = VerificationResult(
+            return VerificationResult(
                 claim_checked=claim,
                 status=ValidationStatus.INCONCLUSIVE,
                 confidence_score=0.0,
                 supporting_evidences=[],
-                reasoning_trace="Nenhuma evidência disponível para verificação."
+                reasoning_trace=ReasoningTrace(header="Nenhuma evidência disponível para verificação.")
             )
-            self.audit_logger.log_verification(claim, result)
-            return result
+        
+        clock = _StageClock(self.metrics)
+        early_terminated = False
+        summarized = 0
         
         # Tenta extrair valor numérico da claim
         numeric_claim = self._extract_numeric_claim(claim)
+        clock.lap("seeker.numeric_claim")
         
         if numeric_claim:
-            status, confidence, supporting, reasoning = self._verify_numeric_claim(
-                numeric_claim, evidences
-            )
+            if fast_verdict is not None:
+                if index is not None:
+                    candidate_ids = self._numeric_candidates(index, numeric_claim[1])
+                    source, corpus_size = evidences, len(evidences)
+                else:
+                    source = {evidence.id: evidence for evidence in evidences}
+                    candidate_ids, corpus_size = list(source), None
+                clock.lap("seeker.retrieval")
+                entries, scanned = self._numeric_entries(
+                    numeric_claim[1],
+                    self._prioritized(source, candidate_ids, fast_verdict, index),
+                    stop_after=self.NUMERIC_SATURATION
+                )
+                unscanned = len(candidate_ids) - scanned
+                early_terminated = unscanned > 0
+                status, confidence, supporting, trace = self._numeric_outcome(
+                    numeric_claim, entries, scanned, corpus_size, unscanned
+                )
+            else:
+                if index is not None:
+                    candidate_ids = self._numeric_candidates(index, numeric_claim[1])
+                    clock.lap("seeker.retrieval")
+                    candidates = self._fetch(evidences, candidate_ids)
+                    clock.lap("seeker.fetch")
+                    corpus_size = len(evidences)
+                else:
+                    candidates, corpus_size = evidences, None
+                status, confidence, supporting, trace = self._verify_numeric_claim(
+                    numeric_claim, candidates, corpus_size=corpus_size
+                )
+                scanned = len(candidates)
+            clock.lap("seeker.numeric_scoring")
         else:
-            status, confidence, supporting, reasoning = self._verify_textual_claim(
-                claim, evidences
-            )
+            keywords = self._extract_keywords(claim)
+            clock.lap("seeker.keywords")
+            
+            if scorer is not None and retriever is None:
+                relevance_scores = scorer.score(set(keywords))
+                status, confidence, supporting, trace = self._textual_outcome(
+                    claim, relevance_scores, corpus_size=len(evidences)
+                )
+                scanned = len(relevance_scores)
+            elif threshold_pruning and retriever is None and index is not None:
+                pruned = index.threshold_scores(keywords, self.TEXTUAL_MATCH_THRESHOLD)
+                clock.lap("seeker.retrieval")
+                status, confidence, supporting, trace = self._textual_outcome(
+                    claim, pruned.scores, corpus_size=len(evidences), pruned=pruned
+                )
+                summarized = pruned.aggregated
+                scanned = len(pruned.scores) + summarized
+            else:
+                if retriever is not None or index is not None:
+                    source = retriever if retriever is not None else index
+                    candidate_ids = source.candidates(keywords)
+                    clock.lap("seeker.retrieval")
+                    candidates = self._fetch(evidences, candidate_ids)
+                    clock.lap("seeker.fetch")
+                    corpus_size: Optional[int] = len(evidences)
+                else:
+                    candidates, corpus_size = evidences, None
+                status, confidence, supporting, trace = self._verify_textual_claim(
+                    claim, candidates, corpus_size=corpus_size, claim_keywords=set(keywords)
+                )
+                if retriever is not None:
+                    trace.header = "[Recuperação aproximada via MinHash/LSH]\n" + trace.header
+                scanned = len(candidates)
+            clock.lap("seeker.textual_scoring")
+        
+        metrics = self.metrics
+        if metrics is not None:
+            # Varridas: evidências comparadas com a claim. Pontuadas: as que
+            # renderam comparação útil (com fato numérico, ou relevância > 0).
+            if numeric_claim:
+                scored = len(trace.entries)
+            else:
+                scored = summarized + sum(1 for entry in trace.entries if entry.score > 0)
+            clock.finish("seeker.evaluate")
+            metrics.inc("claims_numeric_total" if numeric_claim else "claims_textual_total")
+            if early_terminated:
+                metrics.inc("claims_early_terminated_total")
+            metrics.inc("evidences_scanned_total", scanned)
+            metrics.inc("candidates_scored_total", scored)
+            metrics.observe("evidences_scanned_per_claim", scanned)
+            metrics.observe("candidates_scored_per_claim", scored)
         
-        result = VerificationResult(
+        return VerificationResult(
             claim_checked=claim,
             status=status,
             confidence_score=confidence,
             supporting_evidences=supporting,
-            reasoning_trace=reasoning
+            reasoning_trace=trace,
+            early_terminated=early_terminated
         )
+    
+    def verify_claim(
+        self,
+        claim: str,
+        evidences: List[Evidence],
+        index: Optional["EvidenceIndex"] = None,
+        scorer: Optional["VectorScorer"] = None,
+        retriever: Optional["MinHashLSH"] = None,
+        threshold_pruning: bool = False,
+        fast_verdict: Optional[str] = None
+    ) -> VerificationResult:
+        """
+        Verifica uma afirmação contra um conjunto de evidências.
         
+        Mesmos argumentos de `evaluate_claim`; o resultado é registrado
+        no log de auditoria (com `early_terminated` no metadata, se for o caso).
+        """
+        result = self.evaluate_claim(
+            claim, evidences, index, scorer, retriever, threshold_pruning, fast_verdict
+        )
         self.audit_logger.log_verification(claim, result)
         return result
 
 
 # ============================================================================
-# 5. SISTEMA INTEGRADO
+# 7. EVIDENCE INDEX - ÍNDICE INVERTIDO
 # ============================================================================
 
-class TruthVerificationSystem:
-    """Sistema completo de verificação de veracidade."""
+class PrunedScores(NamedTuple):
+    """
+    Resultado de `EvidenceIndex.threshold_scores`: relevâncias calculadas
+    uma a uma (em ordem de inserção) mais o grupo de evidências que só têm
+    `aggregated_token` em comum com a claim, resumido por contagem, soma e
+    máximo das relevâncias.
+    """
+    scores: List[Tuple[str, float]]
+    aggregated: int = 0
+    aggregated_sum: float = 0.0
+    aggregated_max: float = 0.0
+    aggregated_token: Optional[str] = None
+
+
+class EvidenceIndex:
+    """
+    Índice invertido token -> IDs de evidências, mais um índice numérico
+    com os valores de cada tipo de fato em arrays ordenados (busca por
+    faixa via bisect).
     
-    def __init__(self, db_path: str = ":memory:"):
-        self.audit_logger = AuditLogger(db_path)
-        self.ingestion_engine = IngestionEngine(self.audit_logger)
-        self.truth_seeker = TruthSeeker(self.audit_logger)
-        self.evidences: Dict[str, Evidence] = {}
+    Mantém também a ordem de inserção de cada evidência, para que os
+    candidatos sejam devolvidos na mesma ordem da varredura completa; com
+    `visible`, as consultas ignoram o que foi inserido além das `visible`
+    primeiras evidências (leituras consistentes durante a ingestão).
+    """
     
-    def add_evidence(self, evidence: Evidence) -> None:
-        """Adiciona evidência ao sistema."""
-        self.evidences[evidence.id] = evidence
+    # Acima deste volume de inserções pendentes, reordena tudo de uma vez
+    _INSORT_LIMIT = 64
     
-    def add_text_evidence(
-        self, 
-        content: str, 
-        source_type: EvidenceType,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """Adiciona evidência textual e retorna o ID."""
-        evidence = self.ingestion_engine.ingest_text(content, source_type, metadata)
-        self.add_evidence(evidence)
-        return evidence.id
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._values: Dict[str, List[float]] = {}
+        self._seqs: Dict[str, List[int]] = {}
+        self._pending: Dict[str, List[Tuple[float, int]]] = {}
+        # Nº de palavras-chave por posição de inserção e, para os termos já
+        # usados em threshold_scores, histograma tamanho -> nº de evidências
+        self._sizes = array("I")
+        self._size_histograms: Dict[str, Counter] = {}
+        # metadata['confidence'] não nulo (ordem do fast_verdict="confidence")
+        self._confidences: Dict[str, float] = {}
     
-    def verify(self, claim: str) -> VerificationResult:
-        """Verifica uma afirmação contra todas as evidências."""
-        evidence_list = list(self.evidences.values())
-        return self.truth_seeker.verify_claim(claim, evidence_list)
+    def add(
+        self,
+        evidence_id: str,
+        keywords: Iterable[str],
+        numeric_facts: Iterable[Tuple[str, float]] = ()
+    ) -> None:
+        """Indexa as palavras-chave e os fatos numéricos de uma evidência."""
+        tokens = set(keywords)
+        seq = self._order.get(evidence_id)
+        if seq is None:
+            seq = self._order[evidence_id] = len(self._ids)
+            self._ids.append(evidence_id)
+            self._sizes.append(len(tokens))
+        histograms = self._size_histograms
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(evidence_id)
+            if token in histograms:
+                histograms[token][len(tokens)] += 1
+        for kind, value in set(numeric_facts):
+            self._pending.setdefault(kind, []).append((value, seq))
     
-    def get_audit_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Recupera logs de auditoria."""
-        return self.audit_logger.get_logs(limit)
+    def candidates(self, keywords: Iterable[str], visible: Optional[int] = None) -> List[str]:
+        """Retorna IDs que compartilham ao menos um token, em ordem de inserção."""
+        found: Set[str] = set()
+        for token in set(keywords):
+            found.update(self._postings.get(token, ()))
+        ids = sorted(found, key=self._order.__getitem__)
+        if visible is not None:
+            # Inserções posteriores ao limite ficam todas no fim
+            while ids and self._order[ids[-1]] >= visible:
+                ids.pop()
+        return ids
     
-    def close(self) -> None:
-        """Fecha conexões e libera recursos."""
+    def _size_histogram(self, token: str) -> Counter:
+        """Histograma de tamanhos das evidências com o termo (montado no primeiro uso)."""
+        histogram = self._size_histograms.get(token)
+        if histogram is None:
+            order, sizes = self._order, self._sizes
+            histogram = self._size_histograms[token] = Counter(
+                sizes[order[evidence_id]] for evidence_id in self._postings[token]
+            )
+        return histogram
+    
+    def threshold_scores(self, keywords: Iterable[str], threshold: float) -> PrunedScores:
+        """
+        Jaccard exato da claim contra o corpus, sem percorrer a lista
+        invertida do termo mais frequente da claim quando os limites de
+        tamanho garantem que ele, sozinho, não leva ninguém acima de
+        `threshold` (filtro de prefixo no estilo AllPairs/PPJoin).
+        
+        Com os termos em ordem crescente de frequência, quem tem em comum
+        apenas o último termo tem interseção 1 e relevância 1 / (a + b - 1),
+        que só depende do seu tamanho b. Se nem o menor b do histograma do
+        termo passa do limiar, esse grupo fica fora dos candidatos: soma e
+        máximo saem do histograma (descontadas as evidências que também têm
+        outros termos), e as demais interseções são contadas pelas listas
+        dos outros termos, como no ScanCount.
+        """
+        claim = set(keywords)
+        claim_size = len(claim)
+        postings = self._postings
+        present = sorted((token for token in claim if token in postings), key=lambda t: len(postings[t]))
+        histogram: Optional[Counter] = None
+        if present:
+            candidate = self._size_histogram(present[-1])
+            if 1 / (claim_size + min(candidate) - 1) <= threshold:
+                histogram = Counter(candidate)
+                aggregated_token = present.pop()
+        
+        counts: Counter = Counter()
+        for token in present:
+            counts.update(postings[token])
+        order, sizes = self._order, self._sizes
+        group = postings[aggregated_token] if histogram is not None else ()
+        scores = []
+        for evidence_id in sorted(counts, key=order.__getitem__):
+            shared = counts[evidence_id]
+            size = sizes[order[evidence_id]]
+            if evidence_id in group:
+                shared += 1
+                histogram[size] -= 1
+            scores.append((evidence_id, shared / (size + claim_size - shared)))
+        if histogram is None:
+            return PrunedScores(scores)
+        
+        remaining = {size: count for size, count in histogram.items() if count > 0}
+        if not remaining:
+            return PrunedScores(scores)
+        return PrunedScores(
+            scores,
+            aggregated=sum(remaining.values()),
+            aggregated_sum=math.fsum(count / (claim_size + size - 1) for size, count in remaining.items()),
+            aggregated_max=1 / (claim_size + min(remaining) - 1),
+            aggregated_token=aggregated_token
+        )
+    
+    def position(self, evidence_id: str) -> Optional[int]:
+        """Posição de inserção da evidência (None se não indexada)."""
+        return self._order.get(evidence_id)
+    
+    def set_confidence(self, evidence_id: str, confidence: float) -> None:
+        if confidence:
+            self._confidences[evidence_id] = confidence
+        else:
+            self._confidences.pop(evidence_id, None)
+    
+    def confidence(self, evidence_id: str) -> float:
+        """metadata['confidence'] da evidência (0.0 se ausente)."""
+        return self._confidences.get(evidence_id, 0.0)
+    
+    def ids(self, visible: Optional[int] = None) -> List[str]:
+        """IDs indexados em ordem de inserção (apenas os `visible` primeiros, se informado)."""
+        return self._ids[:visible]
+    
+    def _settle(self, kind: str) -> None:
+        """Incorpora as inserções pendentes ao array ordenado do tipo."""
+        pending = self._pending.pop(kind, None)
+        if not pending:
+            return
+        values = self._values.setdefault(kind, [])
+        seqs = self._seqs.setdefault(kind, [])
+        if len(pending) <= self._INSORT_LIMIT:
+            for value, seq in pending:
+                position = bisect.bisect_right(values, value)
+                values.insert(position, value)
+                seqs.insert(position, seq)
+            return
+        merged = sorted(list(zip(values, seqs)) + pending)
+        self._values[kind] = [value for value, _ in merged]
+        self._seqs[kind] = [seq for _, seq in merged]
+    
+    def numeric_range(
+        self,
+        low: float,
+        high: float,
+        kinds: Optional[Iterable[str]] = None,
+        visible: Optional[int] = None
+    ) -> List[str]:
+        """IDs com algum valor em [low, high] (todos os tipos por padrão), em ordem de inserção."""
+        if kinds is None:
+            kinds = set(self._values) | set(self._pending)
+        found: Set[int] = set()
+        for kind in kinds:
+            self._settle(kind)
+            values = self._values.get(kind, [])
+            start = bisect.bisect_left(values, low)
+            stop = bisect.bisect_right(values, high)
+            found.update(self._seqs[kind][start:stop])
+        if visible is not None:
+            found = {seq for seq in found if seq < visible}
+        return [self._ids[seq] for seq in sorted(found)]
+    
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+# ============================================================================
+# 8. VECTOR SCORER - JACCARD VETORIZADO
+# ============================================================================
+
+class VectorScorer:
+    """
+    Calcula o Jaccard de uma claim contra todo o corpus de uma só vez.
+    
+    Cada evidência vira uma linha de IDs de tokens (vocabulário interno).
+    Com NumPy, as linhas formam uma matriz esparsa CSR (`indices` +
+    `row_of`) e interseções/uniões de todas as linhas saem de um único
+    `isin` + `bincount`. Sem NumPy, as interseções são contadas somando as
+    listas de linhas (array('I')) de cada token da claim num Counter.
+    
+    `score()` devolve (ID, relevância) das evidências com relevância > 0, em
+    ordem de inserção; a divisão inteira->float é a mesma do caminho com
+    sets, então médias e máximos são idênticos.
+    """
+    
+    def __init__(self, backend: Optional[str] = None):
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+        if backend == "numpy" and np is None:
+            raise ImportError("backend 'numpy' requer o pacote numpy")
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"backend inválido: {backend!r}")
+        self.backend = backend
+        self._vocab: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._sizes = array("I")
+        # Backend python: token ID -> linhas que o contêm
+        self._postings: Dict[int, array] = {}
+        # Backend numpy: linhas pendentes e matriz CSR consolidada
+        self._pending_indices = array("I")
+        self._pending_rows = array("I")
+        self._indices = None
+        self._row_of = None
+        self._size_array = None
+    
+    def _token_ids(self, keywords: Iterable[str]) -> List[int]:
+        vocab = self._vocab
+        return [vocab.setdefault(token, len(vocab)) for token in keywords]
+    
+    def add(self, evidence_id: str, keywords: Iterable[str]) -> None:
+        """Acrescenta a linha de uma evidência."""
+        token_ids = self._token_ids(set(keywords))
+        row = len(self._ids)
+        self._ids.append(evidence_id)
+        self._sizes.append(len(token_ids))
+        if self.backend == "python":
+            for token_id in token_ids:
+                self._postings.setdefault(token_id, array("I")).append(row)
+        else:
+            self._pending_indices.extend(token_ids)
+            self._pending_rows.extend([row] * len(token_ids))
+    
+    def _consolidate(self) -> None:
+        """Incorpora as linhas pendentes à matriz CSR (backend numpy)."""
+        if self._indices is not None and not self._pending_indices:
+            return
+        pending_indices = np.frombuffer(self._pending_indices, dtype=np.uint32)
+        pending_rows = np.frombuffer(self._pending_rows, dtype=np.uint32)
+        if self._indices is None:
+            self._indices = pending_indices.copy()
+            self._row_of = pending_rows.copy()
+        else:
+            self._indices = np.concatenate([self._indices, pending_indices])
+            self._row_of = np.concatenate([self._row_of, pending_rows])
+        self._size_array = np.frombuffer(self._sizes, dtype=np.uint32).astype(np.int64)
+        self._pending_indices = array("I")
+        self._pending_rows = array("I")
+    
+    def score(self, claim_keywords: Set[str]) -> List[Tuple[str, float]]:
+        """Relevâncias > 0 da claim contra todas as evidências, em ordem de inserção."""
+        if not claim_keywords or not self._ids:
+            return []
+        claim_ids = [self._vocab[token] for token in claim_keywords if token in self._vocab]
+        if not claim_ids:
+            return []
+        claim_size = len(claim_keywords)
+        
+        if self.backend == "python":
+            counts: Counter = Counter()
+            for token_id in claim_ids:
+                counts.update(self._postings[token_id])
+            return [
+                (self._ids[row], shared / (self._sizes[row] + claim_size - shared))
+                for row, shared in sorted(counts.items())
+            ]
+        
+        self._consolidate()
+        hits = np.isin(self._indices, np.asarray(claim_ids, dtype=np.uint32))
+        shared = np.bincount(self._row_of[hits], minlength=len(self._ids))
+        rows = np.flatnonzero(shared)
+        shared_rows = shared[rows]
+        unions = self._size_array[rows] + claim_size - shared_rows
+        relevances = shared_rows / unions
+        return [(self._ids[row], relevance) for row, relevance in zip(rows.tolist(), relevances.tolist())]
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+# ============================================================================
+# 9. MINHASH LSH - RECUPERAÇÃO APROXIMADA
+# ============================================================================
+
+class MinHashLSH:
+    """
+    Recuperação aproximada de candidatos por MinHash + LSH em bandas.
+    
+    Cada evidência recebe uma assinatura de `bands * rows` min-hashes e é
+    colocada num bucket por banda. Uma claim recupera as evidências que
+    colidem em ao menos uma banda; a probabilidade disso para Jaccard `s`
+    é 1 - (1 - s^rows)^bands, com limiar aproximado (1/bands)^(1/rows).
+    O padrão (48 bandas x 3 linhas) fica em ~0.275, logo abaixo do limiar
+    de suporte de 0.3 usado em _verify_textual_claim, favorecendo o recall.
+    
+    Os hashes são estáveis entre processos (crc32 + permutações com
+    semente fixa) e o NumPy, quando instalado, só acelera o cálculo.
+    """
+    
+    # Primo maior que 2^32: (a * h + b) cabe em 64 bits com a < 2^31
+    _PRIME = 4294967311
+    
+    def __init__(self, bands: int = 48, rows: int = 3, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, 1 << 31) for _ in range(bands * rows)]
+        self._b = [rng.randrange(0, 1 << 31) for _ in range(bands * rows)]
+        if np is not None:
+            self._a_array = np.asarray(self._a, dtype=np.uint64)[:, None]
+            self._b_array = np.asarray(self._b, dtype=np.uint64)[:, None]
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(bands)]
+        self._order: Dict[str, int] = {}
+    
+    @property
+    def threshold(self) -> float:
+        """Jaccard a partir do qual a recuperação passa a ser provável."""
+        return (1 / self.bands) ** (1 / self.rows)
+    
+    def signature(self, keywords: Iterable[str]) -> List[int]:
+        """Assinatura MinHash de um conjunto de palavras-chave (não vazio)."""
+        hashes = [zlib.crc32(token.encode()) for token in set(keywords)]
+        if np is not None:
+            values = np.asarray(hashes, dtype=np.uint64)[None, :]
+            return ((self._a_array * values + self._b_array) % self._PRIME).min(axis=1).tolist()
+        prime = self._PRIME
+        return [min((a * h + b) % prime for h in hashes) for a, b in zip(self._a, self._b)]
+    
+    def _band_keys(self, keywords: Iterable[str]) -> List[Tuple[int, ...]]:
+        signature = self.signature(keywords)
+        rows = self.rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+    
+    def add(self, evidence_id: str, keywords: Iterable[str]) -> None:
+        """Assina a evidência e a coloca num bucket por banda."""
+        keywords = set(keywords)
+        if evidence_id in self._order or not keywords:
+            return
+        self._order[evidence_id] = len(self._order)
+        for buckets, key in zip(self._buckets, self._band_keys(keywords)):
+            buckets.setdefault(key, []).append(evidence_id)
+    
+    def candidates(self, keywords: Iterable[str]) -> List[str]:
+        """IDs que colidem com a claim em ao menos uma banda, em ordem de inserção."""
+        keywords = set(keywords)
+        if not keywords:
+            return []
+        found: Set[str] = set()
+        for buckets, key in zip(self._buckets, self._band_keys(keywords)):
+            found.update(buckets.get(key, ()))
+        return sorted(found, key=self._order.__getitem__)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+# ============================================================================
+# 10. EVIDENCE STORE - PERSISTÊNCIA E CACHE QUENTE
+# ============================================================================
+
+def _features_to_json(features: EvidenceFeatures) -> str:
+    return json.dumps({
+        "keywords": sorted(features.keywords),
+        "numeric_facts": [list(fact) for fact in features.numeric_facts]
+    }, ensure_ascii=False)
+
+
+def _features_from_json(raw: str) -> EvidenceFeatures:
+    data = json.loads(raw)
+    return EvidenceFeatures(
+        keywords=frozenset(data["keywords"]),
+        numeric_facts=tuple((kind, float(value)) for kind, value in data["numeric_facts"])
+    )
+
+
+class EvidenceStore:
+    """
+    Persiste evidências (e seus atributos pré-computados) no mesmo banco
+    SQLite do log de auditoria.
+    
+    Também implementa a interface de EvidenceIndex (`add`/`candidates`)
+    sobre a tabela `evidence_terms`, de modo que um banco existente é
+    reaberto sem recarregar nem reindexar o corpus.
+    
+    Todo uso de `conn` acontece sob `lock`; quem compartilha a conexão
+    (o AuditLogger com sua thread temporizadora) passa a própria trava, e
+    `transaction()` a mantém pelo bloco inteiro, para que nenhum commit de
+    outra thread grave uma evidência sem seus termos.
+    """
+    
+    # Limite de parâmetros por consulta IN (...) do SQLite
+    _BATCH = 500
+    
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        deferred_commit: bool = False,
+        lock: Optional["threading.RLock"] = None
+    ):
+        self.conn = conn
+        self.deferred_commit = deferred_commit
+        self.lock = lock if lock is not None else threading.RLock()
+        with self.lock:
+            self._init_db()
+            self._count = self.conn.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
+    
+    def _init_db(self) -> None:
+        """Cria tabelas de evidências se não existirem."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS evidence (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                content TEXT NOT NULL,
+                source_type TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                metadata TEXT NOT NULL,
+                features TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS evidence_terms (
+                token TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (token, seq)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS evidence_numbers (
+                kind TEXT NOT NULL,
+                value REAL NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (kind, value, seq)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+    
+    def _commit(self) -> None:
+        if not self.deferred_commit:
+            self.conn.commit()
+    
+    def commit(self) -> None:
+        """Confirma gravações pendentes (modo deferred_commit)."""
+        with self.lock:
+            self.conn.commit()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Agrupa as gravações do bloco (ex.: `save` + `add`) num único commit;
+        com erro, desfaz o que estiver pendente. No modo deferred_commit
+        apenas segura `lock` (o commit já é adiado).
+        """
+        with self.lock:
+            if self.deferred_commit:
+                yield
+                return
+            self.deferred_commit = True
+            try:
+                yield
+            except BaseException:
+                self.conn.rollback()
+                raise
+            finally:
+                self.deferred_commit = False
+            self.conn.commit()
+    
+    def save(self, evidence: Evidence) -> None:
+        """Grava a evidência (precisa ter `features`)."""
+        assert evidence.features is not None
+        with self.lock:
+            self.conn.execute("""
+                INSERT INTO evidence (id, content, source_type, timestamp, metadata, features)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                evidence.id,
+                evidence.content,
+                evidence.source_type.value,
+                evidence.timestamp,
+                json.dumps(evidence.metadata, default=str),
+                _features_to_json(evidence.features)
+            ))
+            self._count += 1
+            self._commit()
+    
+    def update_metadata(self, evidence_id: str, metadata: Dict[str, Any]) -> None:
+        with self.lock:
+            self.conn.execute(
+                "UPDATE evidence SET metadata = ? WHERE id = ?",
+                (json.dumps(metadata, default=str), evidence_id)
+            )
+            self._commit()
+    
+    def delete(self, evidence_id: str) -> None:
+        """Remove a evidência e seus termos."""
+        with self.lock:
+            for table in ("evidence_terms", "evidence_numbers"):
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE seq = (SELECT seq FROM evidence WHERE id = ?)",
+                    (evidence_id,)
+                )
+            if self.conn.execute("DELETE FROM evidence WHERE id = ?", (evidence_id,)).rowcount:
+                self._count -= 1
+            self._commit()
+    
+    def _row_to_evidence(self, row: Tuple[Any, ...]) -> Evidence:
+        evidence_id, content, source_type, timestamp, metadata, features = row
+        return Evidence(
+            id=evidence_id,
+            content=content,
+            source_type=EvidenceType(source_type),
+            timestamp=timestamp,
+            metadata=json.loads(metadata),
+            features=_features_from_json(features)
+        )
+    
+    def load(self, evidence_id: str) -> Optional[Evidence]:
+        with self.lock:
+            row = self.conn.execute("""
+                SELECT id, content, source_type, timestamp, metadata, features
+                FROM evidence WHERE id = ?
+            """, (evidence_id,)).fetchone()
+        return self._row_to_evidence(row) if row else None
+    
+    def load_many(self, evidence_ids: List[str]) -> Dict[str, Evidence]:
+        found: Dict[str, Evidence] = {}
+        for start in range(0, len(evidence_ids), self._BATCH):
+            batch = evidence_ids[start:start + self._BATCH]
+            placeholders = ",".join("?" * len(batch))
+            with self.lock:
+                rows = self.conn.execute(f"""
+                    SELECT id, content, source_type, timestamp, metadata, features
+                    FROM evidence WHERE id IN ({placeholders})
+                """, batch).fetchall()
+            for row in rows:
+                found[row[0]] = self._row_to_evidence(row)
+        return found
+    
+    def _scan(self, columns: str) -> Iterator[Tuple[Any, ...]]:
+        """
+        Percorre `columns` de todas as evidências em ordem de inserção, em
+        lotes lidos sob `lock` (a trava não fica presa entre os lotes).
+        """
+        last = 0
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT seq, {columns} FROM evidence WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last, self._BATCH)
+                ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            for row in rows:
+                yield row[1:]
+    
+    def iter_all(self) -> Iterator[Evidence]:
+        """Percorre todas as evidências em ordem de inserção."""
+        for row in self._scan("id, content, source_type, timestamp, metadata, features"):
+            yield self._row_to_evidence(row)
+    
+    def iter_features(self) -> Iterator[Tuple[str, EvidenceFeatures]]:
+        """Percorre (ID, atributos) sem carregar o conteúdo, em ordem de inserção."""
+        for evidence_id, features in self._scan("id, features"):
+            yield evidence_id, _features_from_json(features)
+    
+    def iter_ids(self) -> Iterator[str]:
+        for (evidence_id,) in self._scan("id"):
+            yield evidence_id
+    
+    def __contains__(self, evidence_id: object) -> bool:
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM evidence WHERE id = ?", (evidence_id,)
+            ).fetchone() is not None
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    # -- Interface de índice ------------------------------------------------
+    
+    def add(
+        self,
+        evidence_id: str,
+        keywords: Iterable[str],
+        numeric_facts: Iterable[Tuple[str, float]] = ()
+    ) -> None:
+        """Indexa palavras-chave e fatos numéricos de uma evidência já gravada."""
+        with self.lock:
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO evidence_terms (token, seq)
+                SELECT ?, seq FROM evidence WHERE id = ?
+            """, [(token, evidence_id) for token in set(keywords)])
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO evidence_numbers (kind, value, seq)
+                SELECT ?, ?, seq FROM evidence WHERE id = ?
+            """, [(kind, value, evidence_id) for kind, value in set(numeric_facts)])
+            self._commit()
+    
+    def candidates(self, keywords: Iterable[str]) -> List[str]:
+        """Retorna IDs que compartilham ao menos um token, em ordem de inserção."""
+        tokens = list(set(keywords))
+        seqs: Set[int] = set()
+        for start in range(0, len(tokens), self._BATCH):
+            batch = tokens[start:start + self._BATCH]
+            placeholders = ",".join("?" * len(batch))
+            with self.lock:
+                seqs.update(seq for (seq,) in self.conn.execute(
+                    f"SELECT seq FROM evidence_terms WHERE token IN ({placeholders})", batch
+                ))
+        return self._ids_for(seqs)
+    
+    def numeric_range(
+        self,
+        low: float,
+        high: float,
+        kinds: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """IDs com algum valor em [low, high], via índice B-tree (kind, value)."""
+        seqs: Set[int] = set()
+        with self.lock:
+            if kinds is None:
+                kinds = [kind for (kind,) in self.conn.execute(
+                    "SELECT DISTINCT kind FROM evidence_numbers"
+                )]
+            for kind in kinds:
+                seqs.update(seq for (seq,) in self.conn.execute(
+                    "SELECT seq FROM evidence_numbers WHERE kind = ? AND value BETWEEN ? AND ?",
+                    (kind, low, high)
+                ))
+        return self._ids_for(seqs)
+    
+    def _ids_for(self, seqs: Set[int]) -> List[str]:
+        """Converte seqs em IDs, em ordem de inserção."""
+        ordered = sorted(seqs)
+        ids: List[str] = []
+        for start in range(0, len(ordered), self._BATCH):
+            batch = ordered[start:start + self._BATCH]
+            placeholders = ",".join("?" * len(batch))
+            with self.lock:
+                ids.extend(evidence_id for (evidence_id,) in self.conn.execute(
+                    f"SELECT id FROM evidence WHERE seq IN ({placeholders}) ORDER BY seq", batch
+                ))
+        return ids
+
+
+class EvidenceCorpus(MutableMapping):
+    """
+    Mapeamento ID -> Evidence com cache quente em memória sobre um
+    EvidenceStore opcional.
+    
+    Sem store, comporta-se como um dict comum. Com store, as evidências são
+    carregadas do SQLite sob demanda e mantidas no cache quente, um LRU de
+    até `hot_cache_size` evidências (None: sem limite).
+    """
+    
+    HOT_CACHE_SIZE = 10_000
+    
+    def __init__(self, store: Optional[EvidenceStore] = None, hot_cache_size: Optional[int] = HOT_CACHE_SIZE):
+        self.store = store
+        self.hot_cache_size = hot_cache_size if store is not None else None
+        self.hot: Dict[str, Evidence] = OrderedDict() if self.hot_cache_size is not None else {}
+    
+    def _cache(self, evidence_id: str, evidence: Evidence) -> None:
+        """Guarda no cache quente, despejando as menos usadas além do limite."""
+        hot = self.hot
+        hot[evidence_id] = evidence
+        if self.hot_cache_size is not None:
+            hot.move_to_end(evidence_id)
+            while len(hot) > self.hot_cache_size:
+                hot.popitem(last=False)
+    
+    def __getitem__(self, evidence_id: str) -> Evidence:
+        evidence = self.hot.get(evidence_id)
+        if evidence is not None:
+            if self.hot_cache_size is not None:
+                self.hot.move_to_end(evidence_id)
+            return evidence
+        if self.store is not None:
+            evidence = self.store.load(evidence_id)
+            if evidence is not None:
+                self._cache(evidence_id, evidence)
+                return evidence
+        raise KeyError(evidence_id)
+    
+    def get_many(self, evidence_ids: List[str]) -> List[Evidence]:
+        """Busca várias evidências, carregando as ausentes numa só consulta."""
+        hot = self.hot
+        if self.store is None:
+            return [hot[eid] for eid in evidence_ids]
+        missing = [eid for eid in evidence_ids if eid not in hot]
+        loaded = self.store.load_many(missing) if missing else {}
+        found = [hot[eid] if eid in hot else loaded[eid] for eid in evidence_ids]
+        if self.hot_cache_size is not None:
+            for eid in evidence_ids:
+                if eid in hot:
+                    hot.move_to_end(eid)
+        for eid, evidence in loaded.items():
+            self._cache(eid, evidence)
+        return found
+    
+    def __setitem__(self, evidence_id: str, evidence: Evidence) -> None:
+        if self.store is not None:
+            with self.store.transaction():
+                if evidence_id in self.store:
+                    self.store.delete(evidence_id)
+                self.store.save(evidence)
+        self._cache(evidence_id, evidence)
+    
+    def update_metadata(self, evidence_id: str, metadata: Dict[str, Any]) -> None:
+        """Substitui o metadata de uma evidência (e o persiste, com store)."""
+        self[evidence_id].metadata = metadata
+        if self.store is not None:
+            self.store.update_metadata(evidence_id, metadata)
+    
+    def __delitem__(self, evidence_id: str) -> None:
+        found = self.hot.pop(evidence_id, None) is not None
+        if self.store is not None and evidence_id in self.store:
+            self.store.delete(evidence_id)
+            found = True
+        if not found:
+            raise KeyError(evidence_id)
+    
+    def __contains__(self, evidence_id: object) -> bool:
+        if evidence_id in self.hot:
+            return True
+        return self.store is not None and evidence_id in self.store
+    
+    def __iter__(self) -> Iterator[str]:
+        if self.store is None:
+            return iter(self.hot)
+        return self.store.iter_ids()
+    
+    def __len__(self) -> int:
+        return len(self.store) if self.store is not None else len(self.hot)
+    
+    def values(self) -> Iterable[Evidence]:  # type: ignore[override]
+        """Percorre o corpus sem encher o cache quente com evidências frias."""
+        if self.store is None:
+            return self.hot.values()
+        return (self.hot.get(evidence.id, evidence) for evidence in self.store.iter_all())
+
+
+@dataclass
+class MemoryBudget:
+    """
+    Limites do corpus residente em memória (BudgetedEvidenceCorpus).
+    
+    Todos são opcionais e valem ao mesmo tempo:
+    - max_evidences / max_bytes: total residente; ao estourar, sai a
+      evidência usada há mais tempo (LRU por uso em verify())
+    - max_age_seconds: janela sobre Evidence.timestamp; as mais antigas
+      ficam só em disco e, quando uma claim as pede, são recarregadas sem
+      voltar ao cache
+    - type_quotas: máximo residente por EvidenceType (LRU dentro do tipo)
+    
+    `max_bytes` compara com uma estimativa (conteúdo, palavras-chave e uma
+    parcela fixa por evidência), não com a medição exata do interpretador.
+    
+    Limitação: o orçamento cobre apenas os objetos Evidence residentes. Não
+    entram nele, e crescem com o corpus inteiro, o mapa de IDs do próprio
+    corpus (~100 bytes por evidência) e as estruturas de busca do sistema:
+    o EvidenceIndex em memória (postings, fatos numéricos, ordem de
+    inserção), o VectorScorer e o MinHash LSH, quando ativos. Com
+    `persist_evidence` o índice invertido fica no SQLite e resta em memória
+    só o mapa de IDs (e scorer/LSH, se ativos).
+    """
+    max_evidences: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_age_seconds: Optional[float] = None
+    type_quotas: Dict[EvidenceType, int] = field(default_factory=dict)
+
+
+class BudgetedEvidenceCorpus(EvidenceCorpus):
+    """
+    EvidenceCorpus cujo cache quente respeita um MemoryBudget.
+    
+    Evidências despejadas vão para o EvidenceStore (gravadas no despejo ou,
+    com `write_through`, já na inserção) e voltam dele de forma transparente
+    em `__getitem__`/`get_many`. Os IDs de todo o corpus, em ordem de
+    inserção, ficam sempre em memória (fora do orçamento; ver MemoryBudget).
+    `evictions` e `reloads` contam despejos e recargas.
+    """
+    
+    # Parcela fixa estimada por evidência residente (dataclass, dicts, frozenset)
+    _OVERHEAD_BYTES = 512
+    
+    def __init__(
+        self,
+        store: EvidenceStore,
+        budget: MemoryBudget,
+        write_through: bool = False,
+        metrics: Optional[Metrics] = None
+    ):
+        super().__init__(store, hot_cache_size=None)  # O orçamento cuida do despejo
+        self.budget = budget
+        self.write_through = write_through
+        self.metrics = metrics
+        self.evictions = 0
+        self.reloads = 0
+        self.resident_bytes = 0
+        # ID -> já gravada no store, para todo o corpus (em ordem de inserção)
+        self._ids: Dict[str, bool] = dict.fromkeys(store.iter_ids(), True)
+        # Por tipo, ID residente -> tique do último uso (do menos ao mais recente)
+        self._usage: Dict[EvidenceType, "OrderedDict[str, int]"] = {}
+        self._tick = 0
+        # (timestamp, ID) das residentes, para a janela de tempo (remoção preguiçosa)
+        self._by_age: List[Tuple[float, str]] = []
+    
+    def _size_of(self, evidence: Evidence) -> int:
+        keywords = evidence.features.keywords if evidence.features is not None else ()
+        return (
+            self._OVERHEAD_BYTES + sys.getsizeof(evidence.content)
+            + sum(sys.getsizeof(keyword) for keyword in keywords)
+        )
+    
+    def _expired(self, evidence: Evidence) -> bool:
+        max_age = self.budget.max_age_seconds
+        return max_age is not None and evidence.timestamp < time.time() - max_age
+    
+    def _admit(self, evidence: Evidence) -> None:
+        """Torna a evidência residente, como a usada mais recentemente."""
+        self.hot[evidence.id] = evidence
+        self._tick += 1
+        self._usage.setdefault(evidence.source_type, OrderedDict())[evidence.id] = self._tick
+        self.resident_bytes += self._size_of(evidence)
+        if self.budget.max_age_seconds is not None:
+            heapq.heappush(self._by_age, (evidence.timestamp, evidence.id))
+    
+    def _touch(self, evidence: Evidence) -> None:
+        usage = self._usage[evidence.source_type]
+        self._tick += 1
+        usage[evidence.id] = self._tick
+        usage.move_to_end(evidence.id)
+    
+    def _spill(self, evidence: Evidence) -> None:
+        if not self._ids[evidence.id]:
+            self.store.save(evidence)
+            self._ids[evidence.id] = True
+        self.evictions += 1
+        if self.metrics is not None:
+            self.metrics.inc("corpus_evictions_total")
+    
+    def _evict(self, evidence_id: str) -> None:
+        """Tira a evidência da memória (gravando-a no store, se preciso)."""
+        evidence = self.hot.pop(evidence_id)
+        del self._usage[evidence.source_type][evidence_id]
+        self.resident_bytes -= self._size_of(evidence)
+        self._spill(evidence)
+    
+    def _least_recent(self) -> str:
+        oldest = min(
+            (next(iter(usage.items())) for usage in self._usage.values() if usage),
+            key=itemgetter(1)
+        )
+        return oldest[0]
+    
+    def _enforce(self) -> None:
+        """Despeja até que todos os limites do orçamento sejam respeitados."""
+        budget = self.budget
+        if budget.max_age_seconds is not None:
+            cutoff = time.time() - budget.max_age_seconds
+            heap = self._by_age
+            while heap and heap[0][0] < cutoff:
+                timestamp, evidence_id = heapq.heappop(heap)
+                evidence = self.hot.get(evidence_id)
+                if evidence is not None and evidence.timestamp == timestamp:
+                    self._evict(evidence_id)
+            if len(heap) > 2 * len(self.hot) + 64:
+                # Entradas repetidas de recargas: reconstrói com as residentes
+                self._by_age = [(evidence.timestamp, eid) for eid, evidence in self.hot.items()]
+                heapq.heapify(self._by_age)
+        for source_type, quota in budget.type_quotas.items():
+            usage = self._usage.get(source_type)
+            while usage and len(usage) > quota:
+                self._evict(next(iter(usage)))
+        while self.hot and (
+            (budget.max_evidences is not None and len(self.hot) > budget.max_evidences)
+            or (budget.max_bytes is not None and self.resident_bytes > budget.max_bytes)
+        ):
+            self._evict(self._least_recent())
+    
+    def _reloaded(self, evidences: List[Evidence]) -> None:
+        """
+        Conta recargas e readmite as que estão dentro da janela de tempo.
+        
+        Um lote maior que `max_evidences` (varredura de um termo comum) é
+        servido sem readmissão: só despejaria o conjunto quente inteiro.
+        """
+        self.reloads += len(evidences)
+        if self.metrics is not None:
+            self.metrics.inc("corpus_reloads_total", len(evidences))
+        limit = self.budget.max_evidences
+        if limit is not None and len(evidences) > limit:
+            return
+        for evidence in evidences:
+            if not self._expired(evidence):
+                self._admit(evidence)
+        self._enforce()
+    
+    def __getitem__(self, evidence_id: str) -> Evidence:
+        evidence = self.hot.get(evidence_id)
+        if evidence is not None:
+            self._touch(evidence)
+            return evidence
+        if evidence_id not in self._ids:
+            raise KeyError(evidence_id)
+        evidence = self.store.load(evidence_id)
+        self._reloaded([evidence])
+        return evidence
+    
+    def get_many(self, evidence_ids: List[str]) -> List[Evidence]:
+        """Busca várias evidências; as despejadas voltam numa só consulta."""
+        hot = self.hot
+        missing = []
+        for evidence_id in evidence_ids:
+            evidence = hot.get(evidence_id)
+            if evidence is not None:
+                self._touch(evidence)
+            else:
+                missing.append(evidence_id)
+        if not missing:
+            return [hot[evidence_id] for evidence_id in evidence_ids]
+        loaded = self.store.load_many(missing)
+        found = [hot[evidence_id] if evidence_id in hot else loaded[evidence_id] for evidence_id in evidence_ids]
+        self._reloaded(list(loaded.values()))
+        return found
+    
+    def __setitem__(self, evidence_id: str, evidence: Evidence) -> None:
+        if evidence_id in self._ids:
+            del self[evidence_id]
+        if self.write_through:
+            self.store.save(evidence)
+        self._ids[evidence_id] = self.write_through
+        if self._expired(evidence):
+            self._spill(evidence)
+        else:
+            self._admit(evidence)
+        self._enforce()
+    
+    def update_metadata(self, evidence_id: str, metadata: Dict[str, Any]) -> None:
+        self[evidence_id].metadata = metadata
+        if self._ids[evidence_id]:
+            self.store.update_metadata(evidence_id, metadata)
+    
+    def __delitem__(self, evidence_id: str) -> None:
+        on_disk = self._ids.pop(evidence_id)
+        evidence = self.hot.pop(evidence_id, None)
+        if evidence is not None:
+            del self._usage[evidence.source_type][evidence_id]
+            self.resident_bytes -= self._size_of(evidence)
+        if on_disk:
+            self.store.delete(evidence_id)
+    
+    def __contains__(self, evidence_id: object) -> bool:
+        return evidence_id in self._ids
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def values(self) -> Iterable[Evidence]:  # type: ignore[override]
+        """Percorre o corpus em ordem de inserção; as despejadas são lidas em lote, sem voltar ao cache."""
+        return self._iter_values()
+    
+    def _iter_values(self) -> Iterator[Evidence]:
+        ids = list(self._ids)
+        for start in range(0, len(ids), EvidenceStore._BATCH):
+            batch = ids[start:start + EvidenceStore._BATCH]
+            loaded = self.store.load_many([eid for eid in batch if eid not in self.hot])
+            for evidence_id in batch:
+                yield self.hot.get(evidence_id) or loaded.get(evidence_id) or self.store.load(evidence_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "evidences": len(self._ids),
+            "resident": len(self.hot),
+            "resident_bytes": self.resident_bytes,
+            "spilled": len(self._ids) - len(self.hot),
+            "evictions": self.evictions,
+            "reloads": self.reloads
+        }
+
+
+# ============================================================================
+# 11. COMPACT CORPUS - REPRESENTAÇÃO COLUNAR EM MEMÓRIA
+# ============================================================================
+
+class EvidenceRecord:
+    """
+    Visão somente leitura de uma linha de um corpus colunar
+    (CompactEvidenceCorpus ou EvidenceSnapshot), com a mesma interface de
+    leitura de Evidence. Os campos são montados a partir das colunas a cada
+    acesso; o conteúdo só é descomprimido (ou decodificado) quando lido.
+    """
+    
+    __slots__ = ("_corpus", "_row")
+    
+    def __init__(self, corpus: Union["CompactEvidenceCorpus", "EvidenceSnapshot"], row: int):
+        self._corpus = corpus
+        self._row = row
+    
+    @property
+    def id(self) -> str:
+        return self._corpus._id_at(self._row)
+    
+    @property
+    def content(self) -> str:
+        return self._corpus._content_at(self._row)
+    
+    @property
+    def source_type(self) -> EvidenceType:
+        return self._corpus._TYPES[self._corpus._types[self._row]]
+    
+    @property
+    def timestamp(self) -> float:
+        return self._corpus._timestamps[self._row]
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Cópia do metadata; alterações devem passar por `update_metadata`."""
+        return self._corpus._metadata_at(self._row)
+    
+    @property
+    def features(self) -> EvidenceFeatures:
+        return self._corpus._features_at(self._row)
+    
+    def materialize(self) -> Evidence:
+        """Converte a linha numa Evidence comum (independente do corpus)."""
+        return Evidence(self.id, self.content, self.source_type, self.timestamp, self.metadata, self.features)
+    
+    def __reduce__(self):
+        # Ao serializar (ex.: para processos de verify_many) envia a Evidence, não o corpus
+        return (Evidence, (self.id, self.content, self.source_type, self.timestamp,
+                           self.metadata, self.features))
+    
+    def __repr__(self) -> str:
+        return f"EvidenceRecord(id={self.id!r}, source_type={self.source_type})"
+
+
+class CompactEvidenceCorpus(MutableMapping):
+    """
+    Mapeamento ID -> EvidenceRecord com armazenamento colunar.
+    
+    - palavras-chave como IDs de um vocabulário internado, num único
+      array('I') com offsets por linha (formato CSR);
+    - fatos numéricos em arrays de tipo ('B') e valor ('d');
+    - metadata como tupla de valores + ID de uma tabela compartilhada de
+      tuplas de chaves (strings repetidas nos valores são compartilhadas);
+    - conteúdo opcionalmente comprimido com zlib (`compress_content`).
+    
+    Removidas (ou substituídas), as linhas ficam como lápides; `__len__`, a
+    iteração e a ordem de inserção consideram apenas as linhas vivas. As
+    lápides, o vocabulário e as strings de metadata sem uso só são
+    liberados por `compact()`. As features montadas ficam num cache LRU
+    limitado a FEATURE_CACHE_SIZE linhas.
+    """
+    
+    _TYPES = list(EvidenceType)
+    _TYPE_CODES = {source_type: code for code, source_type in enumerate(_TYPES)}
+    _FACT_KINDS = ["percentage", "number"]
+    _FACT_CODES = {kind: code for code, kind in enumerate(_FACT_KINDS)}
+    FEATURE_CACHE_SIZE = 4096
+    
+    def __init__(self, compress_content: bool = False):
+        self.compress_content = compress_content
+        self._rows: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._contents: List[Union[str, bytes, None]] = []
+        self._types = array("B")
+        self._timestamps = array("d")
+        # Palavras-chave: vocabulário internado + CSR
+        self._vocabulary: Dict[str, int] = {}
+        self._tokens: List[str] = []
+        self._token_ids = array("I")
+        self._token_offsets = array("Q", [0])
+        # Fatos numéricos: CSR de (tipo, valor)
+        self._fact_kinds = array("B")
+        self._fact_values = array("d")
+        self._fact_offsets = array("Q", [0])
+        # Metadata: tabela de tuplas de chaves + valores por linha
+        self._schemas: Dict[Tuple[str, ...], int] = {}
+        self._schema_keys: List[Tuple[str, ...]] = []
+        self._schema_ids = array("I")
+        self._metadata_values: List[Optional[Tuple[Any, ...]]] = []
+        self._strings: Dict[str, str] = {}
+        self._feature_cache: "OrderedDict[int, EvidenceFeatures]" = OrderedDict()
+    
+    # -- Escrita ------------------------------------------------------------
+    
+    def _share(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self._strings.setdefault(value, value)
+        return value
+    
+    def _encode_metadata(self, metadata: Dict[str, Any]) -> Tuple[int, Optional[Tuple[Any, ...]]]:
+        keys = tuple(metadata)
+        schema_id = self._schemas.get(keys)
+        if schema_id is None:
+            schema_id = self._schemas[keys] = len(self._schema_keys)
+            self._schema_keys.append(tuple(self._share(key) for key in keys))
+        values = tuple(self._share(value) for value in metadata.values()) if keys else None
+        return schema_id, values
+    
+    def __setitem__(self, evidence_id: str, evidence: Evidence) -> None:
+        features = evidence.features
+        if features is None:
+            raise ValueError("CompactEvidenceCorpus exige evidence.features pré-computadas")
+        previous = self._rows.get(evidence_id)
+        if previous is not None:
+            self._drop_row(previous)
+        self._append(
+            evidence_id,
+            zlib.compress(evidence.content.encode("utf-8")) if self.compress_content else evidence.content,
+            self._TYPE_CODES[evidence.source_type],
+            evidence.timestamp,
+            features.keywords,
+            [(self._FACT_CODES[kind], value) for kind, value in features.numeric_facts],
+            evidence.metadata
+        )
+    
+    def _append(
+        self,
+        evidence_id: str,
+        content: Union[str, bytes],
+        type_code: int,
+        timestamp: float,
+        keywords: Iterable[str],
+        facts: Iterable[Tuple[int, float]],
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Acrescenta uma linha já codificada (conteúdo no formato armazenado)."""
+        self._rows[evidence_id] = len(self._ids)
+        self._ids.append(evidence_id)
+        self._contents.append(content)
+        self._types.append(type_code)
+        self._timestamps.append(timestamp)
+        
+        for token in keywords:
+            token_id = self._vocabulary.get(token)
+            if token_id is None:
+                token_id = self._vocabulary[token] = len(self._tokens)
+                self._tokens.append(token)
+            self._token_ids.append(token_id)
+        self._token_offsets.append(len(self._token_ids))
+        
+        for kind_code, value in facts:
+            self._fact_kinds.append(kind_code)
+            self._fact_values.append(value)
+        self._fact_offsets.append(len(self._fact_values))
+        
+        schema_id, values = self._encode_metadata(metadata)
+        self._schema_ids.append(schema_id)
+        self._metadata_values.append(values)
+    
+    def update_metadata(self, evidence_id: str, metadata: Dict[str, Any]) -> None:
+        row = self._rows[evidence_id]
+        self._schema_ids[row], self._metadata_values[row] = self._encode_metadata(metadata)
+    
+    def _drop_row(self, row: int) -> None:
+        """Libera o que é por linha; os arrays CSR mantêm a lápide."""
+        self._contents[row] = None
+        self._metadata_values[row] = None
+        self._feature_cache.pop(row, None)
+    
+    def __delitem__(self, evidence_id: str) -> None:
+        self._drop_row(self._rows.pop(evidence_id))
+    
+    @property
+    def tombstones(self) -> int:
+        """Linhas removidas ou substituídas ainda ocupando as colunas."""
+        return len(self._ids) - len(self._rows)
+    
+    def compact(self) -> int:
+        """
+        Reescreve as colunas apenas com as linhas vivas, liberando lápides,
+        palavras do vocabulário e strings de metadata que ficaram sem uso.
+        
+        Retorna o número de lápides liberadas. As linhas são renumeradas:
+        EvidenceRecords obtidos antes da compactação deixam de ser válidos.
+        """
+        dead = self.tombstones
+        if not dead:
+            return 0
+        fresh = CompactEvidenceCorpus(self.compress_content)
+        tokens, token_ids, token_offsets = self._tokens, self._token_ids, self._token_offsets
+        fact_kinds, fact_values, fact_offsets = self._fact_kinds, self._fact_values, self._fact_offsets
+        for evidence_id, row in self._rows.items():
+            fresh._append(
+                evidence_id,
+                self._contents[row],
+                self._types[row],
+                self._timestamps[row],
+                [tokens[token_id] for token_id in token_ids[token_offsets[row]:token_offsets[row + 1]]],
+                [(fact_kinds[i], fact_values[i]) for i in range(fact_offsets[row], fact_offsets[row + 1])],
+                self._metadata_at(row)
+            )
+        self.__dict__.update(fresh.__dict__)
+        return dead
+    
+    def stats(self) -> Dict[str, int]:
+        """Linhas vivas, lápides e tamanho do vocabulário."""
+        return {"live": len(self._rows), "tombstones": self.tombstones, "vocabulary": len(self._tokens)}
+    
+    # -- Leitura ------------------------------------------------------------
+    
+    def _id_at(self, row: int) -> str:
+        return self._ids[row]
+    
+    def _content_at(self, row: int) -> str:
+        content = self._contents[row]
+        if isinstance(content, bytes):
+            return zlib.decompress(content).decode("utf-8")
+        return content
+    
+    def _metadata_at(self, row: int) -> Dict[str, Any]:
+        values = self._metadata_values[row]
+        if values is None:
+            return {}
+        return dict(zip(self._schema_keys[self._schema_ids[row]], values))
+    
+    def _features_at(self, row: int) -> EvidenceFeatures:
+        cache = self._feature_cache
+        features = cache.get(row)
+        if features is not None:
+            cache.move_to_end(row)
+            return features
+        tokens = self._tokens
+        token_ids = self._token_ids[self._token_offsets[row]:self._token_offsets[row + 1]]
+        start, end = self._fact_offsets[row], self._fact_offsets[row + 1]
+        kinds = self._FACT_KINDS
+        features = cache[row] = EvidenceFeatures(
+            keywords=frozenset(tokens[token_id] for token_id in token_ids),
+            numeric_facts=tuple(
+                (kinds[self._fact_kinds[i]], self._fact_values[i]) for i in range(start, end)
+            )
+        )
+        if len(cache) > self.FEATURE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return features
+    
+    def __getitem__(self, evidence_id: str) -> EvidenceRecord:
+        return EvidenceRecord(self, self._rows[evidence_id])
+    
+    def get_many(self, evidence_ids: List[str]) -> List[EvidenceRecord]:
+        rows = self._rows
+        return [EvidenceRecord(self, rows[eid]) for eid in evidence_ids]
+    
+    def __contains__(self, evidence_id: object) -> bool:
+        return evidence_id in self._rows
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def values(self) -> Iterable[EvidenceRecord]:  # type: ignore[override]
+        return (EvidenceRecord(self, row) for row in self._rows.values())
+
+
+# ============================================================================
+# 12. SNAPSHOT - CORPUS BINÁRIO MAPEADO EM MEMÓRIA
+# ============================================================================
+
+def _align8(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _pack_strings(strings: Iterable[str]) -> Tuple[bytes, array]:
+    """Concatena strings UTF-8 num blob com offsets (formato CSR)."""
+    blob = bytearray()
+    offsets = array("Q", [0])
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    return bytes(blob), offsets
+
+
+class _VocabularyStrings(dict):
+    """ID de token -> str, decodificado do snapshot no primeiro acesso."""
+    
+    def __init__(self, blob: memoryview, offsets: memoryview):
+        super().__init__()
+        self._blob = blob
+        self._offsets = offsets
+    
+    def __missing__(self, token_id: int) -> str:
+        token = self[token_id] = str(self._blob[self._offsets[token_id]:self._offsets[token_id + 1]], "utf-8")
+        return token
+
+
+class EvidenceSnapshot(Mapping):
+    """
+    Snapshot binário e somente leitura do corpus: evidências, atributos
+    pré-computados (palavras-chave e fatos numéricos) e as estruturas de
+    busca (listas invertidas por token e valores numéricos ordenados).
+    
+    O arquivo é mapeado com mmap e cada coluna é lida por um memoryview,
+    sem desserialização: abrir custa apenas o cabeçalho e processos que
+    abrem o mesmo arquivo compartilham as páginas do cache do sistema
+    operacional. Serve ao TruthSeeker como corpus (ID -> EvidenceRecord) e
+    como índice (`candidates` / `numeric_range`), com a mesma ordem de
+    inserção do corpus exportado.
+    
+    Layout: MAGIC, tamanho do cabeçalho (u64 little-endian), cabeçalho JSON
+    e as seções, alinhadas em 8 bytes, descritas no cabeçalho como
+    (offset, bytes, typecode). Os arrays usam a ordem de bytes nativa,
+    registrada no cabeçalho.
+    """
+    
+    MAGIC = b"VDPSNAP1"
+    VERSION = 1
+    _TYPES = CompactEvidenceCorpus._TYPES
+    _TYPE_CODES = CompactEvidenceCorpus._TYPE_CODES
+    _FACT_KINDS = CompactEvidenceCorpus._FACT_KINDS
+    _FACT_CODES = CompactEvidenceCorpus._FACT_CODES
+    
+    # Seção -> typecode. IDs ordenados (`id_order`) e vocabulário em ordem
+    # de bytes permitem busca binária direto no arquivo, sem dicionários.
+    _SECTIONS = {
+        "id_blob": "B", "id_offsets": "Q", "id_order": "I",
+        "content_blob": "B", "content_offsets": "Q",
+        "metadata_blob": "B", "metadata_offsets": "Q",
+        "types": "B", "timestamps": "d",
+        "vocabulary_blob": "B", "vocabulary_offsets": "Q",
+        "token_ids": "I", "token_offsets": "Q",
+        "fact_kinds": "B", "fact_values": "d", "fact_offsets": "Q",
+        "postings": "I", "posting_offsets": "Q",
+        **{f"numeric_values_{kind}": "d" for kind in _FACT_KINDS},
+        **{f"numeric_rows_{kind}": "I" for kind in _FACT_KINDS},
+    }
+    
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        try:
+            if bytes(buffer[:8]) != self.MAGIC:
+                raise ValueError(f"{self.path} não é um snapshot de evidências")
+            header_size = int.from_bytes(buffer[8:16], "little")
+            header = json.loads(bytes(buffer[16:16 + header_size]))
+            if header["version"] != self.VERSION:
+                raise ValueError(f"versão de snapshot não suportada: {header['version']}")
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"snapshot gravado em ordem de bytes {header['byteorder']}")
+            base = _align8(16 + header_size)
+            self._views: List[memoryview] = []
+            for name, (offset, size, typecode) in header["sections"].items():
+                view = buffer[base + offset:base + offset + size].cast(typecode)
+                self._views.append(view)
+                setattr(self, "_" + name, view)
+        except Exception:
+            buffer.release()
+            self.close()
+            raise
+        buffer.release()
+        self.tokenizer_name: str = header["tokenizer"]
+        self.created_at: float = header["created_at"]
+        self._count: int = header["count"]
+        self._tokens = _VocabularyStrings(self._vocabulary_blob, self._vocabulary_offsets)
+        # IDs -> linha da última consulta ao índice: o TruthSeeker busca os
+        # candidatos logo em seguida, sem pagar a busca binária por ID
+        self._recent: Dict[str, int] = {}
+    
+    # -- Escrita ------------------------------------------------------------
+    
+    @classmethod
+    def write(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        evidences: Iterable[Evidence],
+        features_of: Callable[[Evidence], EvidenceFeatures],
+        tokenizer_name: str
+    ) -> int:
+        """
+        Grava o snapshot das evidências (na ordem dada) e retorna quantas
+        foram gravadas. O arquivo é escrito ao lado e renomeado no fim:
+        processos com o snapshot anterior aberto continuam lendo a versão
+        antiga.
+        """
+        ids: List[str] = []
+        contents: List[str] = []
+        metadata: List[str] = []
+        types = array("B")
+        timestamps = array("d")
+        vocabulary: Dict[str, int] = {}
+        token_ids = array("I")
+        token_offsets = array("Q", [0])
+        fact_kinds = array("B")
+        fact_values = array("d")
+        fact_offsets = array("Q", [0])
+        numeric: Dict[str, List[Tuple[float, int]]] = {kind: [] for kind in cls._FACT_KINDS}
+        
+        for row, evidence in enumerate(evidences):
+            features = features_of(evidence)
+            ids.append(evidence.id)
+            contents.append(evidence.content)
+            metadata.append(json.dumps(evidence.metadata, default=str) if evidence.metadata else "")
+            types.append(cls._TYPE_CODES[evidence.source_type])
+            timestamps.append(evidence.timestamp)
+            for token in features.keywords:
+                token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+            token_offsets.append(len(token_ids))
+            for kind, value in features.numeric_facts:
+                fact_kinds.append(cls._FACT_CODES[kind])
+                fact_values.append(value)
+            fact_offsets.append(len(fact_values))
+            for kind, value in set(features.numeric_facts):
+                numeric[kind].append((value, row))
+        
+        # Vocabulário em ordem de bytes UTF-8 (a da busca binária na leitura)
+        tokens = sorted(vocabulary, key=lambda token: token.encode("utf-8"))
+        remap = array("I", bytes(4 * len(tokens)))
+        for new_id, token in enumerate(tokens):
+            remap[vocabulary[token]] = new_id
+        token_ids = array("I", (remap[token_id] for token_id in token_ids))
+        
+        postings_by_token: List[List[int]] = [[] for _ in tokens]
+        for row in range(len(ids)):
+            for token_id in token_ids[token_offsets[row]:token_offsets[row + 1]]:
+                postings_by_token[token_id].append(row)
+        postings = array("I")
+        posting_offsets = array("Q", [0])
+        for rows in postings_by_token:
+            postings.extend(rows)
+            posting_offsets.append(len(postings))
+        
+        id_blob, id_offsets = _pack_strings(ids)
+        content_blob, content_offsets = _pack_strings(contents)
+        metadata_blob, metadata_offsets = _pack_strings(metadata)
+        vocabulary_blob, vocabulary_offsets = _pack_strings(tokens)
+        sections: Dict[str, Any] = {
+            "id_blob": id_blob, "id_offsets": id_offsets,
+            "id_order": array("I", sorted(range(len(ids)), key=lambda row: ids[row].encode("utf-8"))),
+            "content_blob": content_blob, "content_offsets": content_offsets,
+            "metadata_blob": metadata_blob, "metadata_offsets": metadata_offsets,
+            "types": types, "timestamps": timestamps,
+            "vocabulary_blob": vocabulary_blob, "vocabulary_offsets": vocabulary_offsets,
+            "token_ids": token_ids, "token_offsets": token_offsets,
+            "fact_kinds": fact_kinds, "fact_values": fact_values, "fact_offsets": fact_offsets,
+            "postings": postings, "posting_offsets": posting_offsets,
+        }
+        for kind, pairs in numeric.items():
+            pairs.sort()
+            sections[f"numeric_values_{kind}"] = array("d", (value for value, _ in pairs))
+            sections[f"numeric_rows_{kind}"] = array("I", (row for _, row in pairs))
+        
+        layout: Dict[str, Tuple[int, int, str]] = {}
+        offset = 0
+        for name, typecode in cls._SECTIONS.items():
+            size = len(memoryview(sections[name]).cast("B"))
+            layout[name] = (offset, size, typecode)
+            offset = _align8(offset + size)
+        header = json.dumps({
+            "version": cls.VERSION,
+            "byteorder": sys.byteorder,
+            "count": len(ids),
+            "tokenizer": tokenizer_name,
+            "created_at": time.time(),
+            "sections": layout,
+        }).encode("utf-8")
+        
+        path = os.fspath(path)
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(cls.MAGIC + len(header).to_bytes(8, "little") + header)
+            base = _align8(16 + len(header))
+            for name in cls._SECTIONS:
+                handle.write(b"\0" * (base + layout[name][0] - handle.tell()))
+                handle.write(sections[name])
+        os.replace(temporary, path)
+        return len(ids)
+    
+    # -- Leitura ------------------------------------------------------------
+    
+    @staticmethod
+    def _string_at(blob: memoryview, offsets: memoryview, position: int) -> str:
+        return str(blob[offsets[position]:offsets[position + 1]], "utf-8")
+    
+    def _id_bytes(self, row: int) -> bytes:
+        return self._id_blob[self._id_offsets[row]:self._id_offsets[row + 1]].tobytes()
+    
+    def _token_bytes(self, token_id: int) -> bytes:
+        offsets = self._vocabulary_offsets
+        return self._vocabulary_blob[offsets[token_id]:offsets[token_id + 1]].tobytes()
+    
+    @staticmethod
+    def _search(size: int, target: bytes, key: Callable[[int], bytes]) -> int:
+        """
+        Primeira posição em [0, size) com key(posição) >= target (busca
+        binária; bisect só aceita `key` a partir do Python 3.10).
+        """
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            if key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def _row_of(self, evidence_id: str) -> Optional[int]:
+        """Linha do ID (busca binária em `id_order`), ou None."""
+        row = self._recent.get(evidence_id)
+        if row is not None:
+            return row
+        target = evidence_id.encode("utf-8")
+        order = self._id_order
+        position = self._search(len(order), target, lambda i: self._id_bytes(order[i]))
+        if position < len(order) and self._id_bytes(order[position]) == target:
+            return order[position]
+        return None
+    
+    def _token_id(self, token: str) -> Optional[int]:
+        target = token.encode("utf-8")
+        size = len(self._vocabulary_offsets) - 1
+        position = self._search(size, target, self._token_bytes)
+        if position < size and self._token_bytes(position) == target:
+            return position
+        return None
+    
+    def _id_at(self, row: int) -> str:
+        return self._string_at(self._id_blob, self._id_offsets, row)
+    
+    def _content_at(self, row: int) -> str:
+        return self._string_at(self._content_blob, self._content_offsets, row)
+    
+    def _metadata_at(self, row: int) -> Dict[str, Any]:
+        raw = self._string_at(self._metadata_blob, self._metadata_offsets, row)
+        return json.loads(raw) if raw else {}
+    
+    def _features_at(self, row: int) -> EvidenceFeatures:
+        token_ids = self._token_ids[self._token_offsets[row]:self._token_offsets[row + 1]]
+        start, end = self._fact_offsets[row], self._fact_offsets[row + 1]
+        kinds = self._FACT_KINDS
+        return EvidenceFeatures(
+            keywords=frozenset(map(self._tokens.__getitem__, token_ids)),
+            numeric_facts=tuple(
+                (kinds[self._fact_kinds[i]], self._fact_values[i]) for i in range(start, end)
+            )
+        )
+    
+    def _ids_for(self, rows: Iterable[int]) -> List[str]:
+        """IDs das linhas em ordem de inserção, lembrados para o `get_many` seguinte."""
+        rows = sorted(rows)
+        ids = [self._id_at(row) for row in rows]
+        self._recent = dict(zip(ids, rows))
+        return ids
+    
+    # -- Índice -------------------------------------------------------------
+    
+    def candidates(self, keywords: Iterable[str]) -> List[str]:
+        """Retorna IDs que compartilham ao menos um token, em ordem de inserção."""
+        found: Set[int] = set()
+        postings, offsets = self._postings, self._posting_offsets
+        for token in set(keywords):
+            token_id = self._token_id(token)
+            if token_id is not None:
+                found.update(postings[offsets[token_id]:offsets[token_id + 1]])
+        return self._ids_for(found)
+    
+    def numeric_range(
+        self,
+        low: float,
+        high: float,
+        kinds: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """IDs com algum valor em [low, high] (todos os tipos por padrão), em ordem de inserção."""
+        found: Set[int] = set()
+        for kind in (self._FACT_KINDS if kinds is None else kinds):
+            values = getattr(self, f"_numeric_values_{kind}", None)
+            if values is None:
+                continue
+            start = bisect.bisect_left(values, low)
+            stop = bisect.bisect_right(values, high)
+            found.update(getattr(self, f"_numeric_rows_{kind}")[start:stop])
+        return self._ids_for(found)
+    
+    def iter_features(self) -> Iterator[Tuple[str, EvidenceFeatures]]:
+        for row in range(self._count):
+            yield self._id_at(row), self._features_at(row)
+    
+    # -- Mapeamento ---------------------------------------------------------
+    
+    def __getitem__(self, evidence_id: str) -> EvidenceRecord:
+        row = self._row_of(evidence_id)
+        if row is None:
+            raise KeyError(evidence_id)
+        return EvidenceRecord(self, row)
+    
+    def get_many(self, evidence_ids: List[str]) -> List[EvidenceRecord]:
+        return [self[eid] for eid in evidence_ids]
+    
+    def __contains__(self, evidence_id: object) -> bool:
+        return isinstance(evidence_id, str) and self._row_of(evidence_id) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        return (self._id_at(row) for row in range(self._count))
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def values(self) -> Iterable[EvidenceRecord]:  # type: ignore[override]
+        return (EvidenceRecord(self, row) for row in range(self._count))
+    
+    def __reduce__(self):
+        # Outro processo reabre (e compartilha) o mesmo arquivo
+        return (EvidenceSnapshot, (self.path,))
+    
+    def close(self) -> None:
+        """Libera as visões e o mapeamento (registros abertos deixam de ser válidos)."""
+        self._tokens = _VocabularyStrings(b"", b"")
+        for view in getattr(self, "_views", ()):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+
+# ============================================================================
+# 13. RESULT CACHE - CACHE DE VERIFICAÇÕES
+# ============================================================================
+
+class ResultCache:
+    """
+    Cache LRU de resultados de verificação com contadores de acertos.
+    
+    As chaves combinam a claim normalizada com a versão do corpus, de modo
+    que qualquer nova evidência invalida implicitamente as entradas antigas
+    (que saem pelo LRU). Pode ser usado por várias threads.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int], VerificationResult]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def normalize(claim: str) -> str:
+        """Normaliza caixa e espaços (não altera palavras-chave nem números)."""
+        return " ".join(claim.lower().split())
+    
+    def get(self, claim: str, version: int) -> Optional[VerificationResult]:
+        key = (self.normalize(claim), version)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+    
+    def put(self, claim: str, version: int, result: VerificationResult) -> None:
+        key = (self.normalize(claim), version)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._entries)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "maxsize": self.maxsize,
+            "hit_rate": hits / lookups if lookups else 0.0
+        }
+
+
+# ============================================================================
+# 14. STANDING CLAIMS - REAVALIAÇÃO INCREMENTAL
+# ============================================================================
+
+@dataclass
+class ClaimStatusChange:
+    """Evento emitido quando o status de uma claim permanente muda."""
+    claim: str
+    previous_status: ValidationStatus
+    result: VerificationResult
+    evidence_id: str  # Evidência cuja chegada provocou a mudança
+
+
+class StandingClaim:
+    """
+    Claim permanente com estado acumulado (contagem de concordâncias,
+    soma e máximo de relevâncias), atualizado a cada nova evidência sem
+    revarrer o corpus. Os vereditos usam as mesmas regras de TruthSeeker.
+    """
+    
+    def __init__(
+        self,
+        claim: str,
+        seeker: TruthSeeker,
+        on_change: Optional[Callable[[ClaimStatusChange], None]] = None
+    ):
+        self.claim = claim
+        self._seeker = seeker
+        # Callback só desta claim (sai junto com ela em unregister)
+        self.on_change = on_change
+        self.numeric_claim = seeker._extract_numeric_claim(claim)
+        self.keywords = set(seeker._extract_keywords(claim))
+        self.corpus_size = 0
+        self.matching_count = 0
+        self.relevance_sum = 0.0
+        self.relevance_max = 0.0
+        self.supporting: List[str] = []
+        self.status = ValidationStatus.INCONCLUSIVE
+    
+    def observe(self, evidence_id: str, features: EvidenceFeatures) -> None:
+        """Incorpora uma nova evidência ao estado da claim."""
+        self.corpus_size += 1
+        if self.numeric_claim:
+            claim_num = self.numeric_claim[1]
+            if features.numeric_facts and self._seeker._within_tolerance(
+                min((value for _, value in features.numeric_facts),
+                    key=lambda value: abs(value - claim_num)),
+                claim_num
+            ):
+                self.matching_count += 1
+                self.supporting.append(evidence_id)
+            return
+        relevance = self._seeker._jaccard(self.keywords, features.keywords)
+        if relevance:
+            self.relevance_sum += relevance
+            self.relevance_max = max(self.relevance_max, relevance)
+            if relevance > self._seeker.TEXTUAL_MATCH_THRESHOLD:
+                self.supporting.append(evidence_id)
+    
+    def result(self) -> VerificationResult:
+        """
+        Resultado atual, derivado apenas do estado acumulado (sem efeitos
+        colaterais: `status` é o último veredito publicado, atualizado pelo
+        sistema sob a sua trava).
+        """
+        if not self.corpus_size:
+            status, confidence = ValidationStatus.INCONCLUSIVE, 0.0
+            trace = ReasoningTrace(header="Nenhuma evidência disponível para verificação.")
+        elif self.numeric_claim:
+            status, confidence, conclusion = self._seeker._numeric_verdict(self.matching_count)
+            trace = ReasoningTrace(
+                header=f"Claim permanente numérica: {self.numeric_claim[1]} ({self.numeric_claim[0]})\n",
+                notes=[f"Evidências concordantes: {self.matching_count} de {self.corpus_size}\n"],
+                conclusion=conclusion
+            )
+        else:
+            avg_relevance = self.relevance_sum / self.corpus_size
+            status, confidence = self._seeker._textual_verdict(avg_relevance, self.relevance_max)
+            trace = ReasoningTrace(
+                header=f"Claim permanente textual: '{self.claim}'\n",
+                conclusion=(
+                    f"Relevância média: {avg_relevance:.2f}, máxima: {self.relevance_max:.2f}\n"
+                    f"CONCLUSÃO: {status.value}\n"
+                )
+            )
+        return VerificationResult(
+            claim_checked=self.claim,
+            status=status,
+            confidence_score=confidence,
+            supporting_evidences=list(self.supporting),
+            reasoning_trace=trace
+        )
+
+
+# ============================================================================
+# 15. CORPUS VIEW - LEITURAS CONSISTENTES DURANTE A INGESTÃO
+# ============================================================================
+
+class CorpusView(Mapping):
+    """
+    Corpus e índice vistos até as `visible` primeiras evidências publicadas
+    (ordem de inserção), para verificações concorrentes com a ingestão.
+    
+    A ingestão só acrescenta: o que entrou no corpus e no índice além do
+    limite é ignorado, então cada verificação enxerga um estado consistente
+    sem copiar nada e sem bloquear os escritores. Apenas a consolidação
+    preguiçosa do índice numérico (`numeric_range`) usa a trava de escrita.
+    Serve ao TruthSeeker como corpus e como índice.
+    """
+    
+    def __init__(
+        self,
+        evidences: Union[EvidenceCorpus, CompactEvidenceCorpus],
+        index: EvidenceIndex,
+        visible: int,
+        lock: Any
+    ):
+        self.evidences = evidences
+        self.index = index
+        self.visible = visible
+        self._lock = lock
+    
+    def candidates(self, keywords: Iterable[str]) -> List[str]:
+        return self.index.candidates(keywords, visible=self.visible)
+    
+    def numeric_range(
+        self,
+        low: float,
+        high: float,
+        kinds: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        with self._lock:
+            return self.index.numeric_range(low, high, kinds, visible=self.visible)
+    
+    def confidence(self, evidence_id: str) -> float:
+        return self.index.confidence(evidence_id)
+    
+    def get_many(self, evidence_ids: List[str]) -> List[Evidence]:
+        return self.evidences.get_many(evidence_ids)
+    
+    def __getitem__(self, evidence_id: str) -> Evidence:
+        position = self.index.position(evidence_id)
+        if position is None or position >= self.visible:
+            raise KeyError(evidence_id)
+        return self.evidences[evidence_id]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.ids(self.visible))
+    
+    def __len__(self) -> int:
+        return self.visible
+    
+    def values(self) -> Iterable[Evidence]:  # type: ignore[override]
+        return self.evidences.get_many(self.index.ids(self.visible))
+
+
+# ============================================================================
+# 16. SISTEMA INTEGRADO
+# ============================================================================
+
+class TruthVerificationSystem:
+    """Sistema completo de verificação de veracidade."""
+    
+    DUPLICATE_POLICIES = ("skip", "merge")
+    CACHE_HIT_AUDIT_POLICIES = ("none", "compact", "full")
+    
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        buffered_audit: bool = False,
+        content_addressed_ids: bool = False,
+        id_metadata_keys: Iterable[str] = (),
+        duplicate_policy: str = "skip",
+        persist_evidence: bool = False,
+        result_cache_size: int = 0,
+        cache_hit_audit: str = "compact",
+        vectorized_scoring: bool = False,
+        approximate_retrieval: bool = False,
+        lsh_bands: int = 48,
+        lsh_rows: int = 3,
+        collect_metrics: bool = True,
+        compact_corpus: bool = False,
+        compress_content: bool = False,
+        tokenizer: Optional[Tokenizer] = None,
+        thread_safe: bool = False,
+        threshold_pruning: bool = False,
+        memory_budget: Optional[MemoryBudget] = None,
+        spill_dir: Optional[str] = None,
+        fast_verdict: Optional[str] = None
+    ):
+        """
+        Args:
+            persist_evidence: grava as evidências (e o índice invertido) no
+                banco `db_path`, ao lado de `audit_log`. Reabrir um banco
+                existente é imediato: as evidências são carregadas sob
+                demanda e `evidences` passa a ser apenas um cache quente.
+            result_cache_size: tamanho do cache LRU de resultados de
+                `verify()` (0 desativa).
+            cache_hit_audit: o que auditar num acerto de cache: "none",
+                "compact" (linha VERIFICATION_CACHED sem raciocínio) ou
+                "full" (mesma linha de uma verificação normal).
+            vectorized_scoring: pontua claims textuais com VectorScorer
+                (NumPy quando instalado, Python puro caso contrário).
+            approximate_retrieval: recupera candidatos de claims textuais
+                por MinHash/LSH (`lsh_bands` x `lsh_rows`) em vez do índice
+                exato; indicado para corpora em que termos comuns devolvem
+                candidatos demais.
+            collect_metrics: coleta contadores e latências por etapa
+                (`get_metrics()`); False remove a instrumentação do caminho
+                quente.
+            compact_corpus: mantém as evidências em memória no formato
+                colunar do CompactEvidenceCorpus (sem `persist_evidence`);
+                `evidences` passa a devolver EvidenceRecord.
+            compress_content: com `compact_corpus`, guarda o conteúdo
+                comprimido com zlib, descomprimido apenas quando lido.
+            tokenizer: extrator de palavras-chave de evidências e claims
+                (padrão: SimpleTokenizer). Atributos persistidos com
+                `persist_evidence` foram calculados pelo tokenizador da
+                ingestão: reabra o banco com o mesmo.
+            thread_safe: permite chamar verify()/verify_many() de várias
+                threads enquanto outras ingerem. Cada verificação lê uma
+                visão do corpus congelada nas evidências publicadas quando
+                começou (CorpusView), sem bloquear a ingestão; a auditoria
+                passa a um escritor único em thread própria, com conexões
+                de leitura por thread em bancos de arquivo. Não se combina
+                com persist_evidence, vectorized_scoring nem
+                approximate_retrieval (estruturas sem visão por versão).
+            threshold_pruning: pontua claims textuais com os filtros de
+                tamanho e de prefixo do índice (EvidenceIndex.threshold_scores):
+                mesmo veredito, média e máximo, sem percorrer a lista do
+                termo mais frequente da claim quando ele sozinho não leva
+                nenhuma evidência ao limiar. Exige o índice em memória (sem
+                persist_evidence, vectorized_scoring, approximate_retrieval
+                nem thread_safe).
+            memory_budget: limita as evidências residentes em memória
+                (BudgetedEvidenceCorpus): as despejadas vão para o SQLite e
+                voltam sob demanda, com contadores em `get_corpus_stats()`.
+                Com persist_evidence o disco é o próprio `db_path`; sem ele,
+                um arquivo temporário em `spill_dir`, apagado em close().
+                O orçamento não cobre o índice nem o mapa de IDs, que
+                continuam proporcionais ao corpus (ver MemoryBudget).
+                Não se combina com compact_corpus nem thread_safe.
+            fast_verdict: "confidence" ou "recency" para que claims numéricas
+                parem de varrer candidatos (nessa ordem de prioridade) assim
+                que o veredito satura; os resultados saem com
+                `early_terminated`. `verify(claim, full_scan=True)` mantém a
+                varredura completa para auditorias.
+        """
+        if duplicate_policy not in self.DUPLICATE_POLICIES:
+            raise ValueError(f"duplicate_policy inválida: {duplicate_policy!r}")
+        if cache_hit_audit not in self.CACHE_HIT_AUDIT_POLICIES:
+            raise ValueError(f"cache_hit_audit inválida: {cache_hit_audit!r}")
+        if compact_corpus and persist_evidence:
+            raise ValueError("compact_corpus não se combina com persist_evidence")
+        if thread_safe and (persist_evidence or vectorized_scoring or approximate_retrieval):
+            raise ValueError(
+                "thread_safe não se combina com persist_evidence, vectorized_scoring "
+                "nem approximate_retrieval"
+            )
+        if threshold_pruning and (
+            persist_evidence or vectorized_scoring or approximate_retrieval or thread_safe
+        ):
+            raise ValueError(
+                "threshold_pruning não se combina com persist_evidence, vectorized_scoring, "
+                "approximate_retrieval nem thread_safe"
+            )
+        if fast_verdict is not None and fast_verdict not in TruthSeeker.FAST_VERDICT_PRIORITIES:
+            raise ValueError(f"fast_verdict inválido: {fast_verdict!r}")
+        if memory_budget is not None and (compact_corpus or thread_safe):
+            raise ValueError("memory_budget não se combina com compact_corpus nem thread_safe")
+        self.thread_safe = thread_safe
+        self.threshold_pruning = threshold_pruning
+        self.fast_verdict = fast_verdict
+        # Serializa os escritores do corpus (leitores usam CorpusView no modo thread_safe)
+        self._lock = threading.RLock()
+        self.metrics = Metrics() if collect_metrics else None
+        self.audit_logger = AuditLogger(
+            db_path, buffered=buffered_audit, metrics=self.metrics, thread_safe=thread_safe
+        )
+        self.truth_seeker = TruthSeeker(self.audit_logger, metrics=self.metrics, tokenizer=tokenizer)
+        self.ingestion_engine = IngestionEngine(
+            self.audit_logger,
+            feature_extractor=self.truth_seeker.extract_features,
+            content_addressed=content_addressed_ids,
+            id_metadata_keys=id_metadata_keys,
+            metrics=self.metrics
+        )
+        self.store = (
+            EvidenceStore(self.audit_logger.conn, deferred_commit=buffered_audit, lock=self.audit_logger.lock)
+            if persist_evidence else None
+        )
+        self._spill_path: Optional[str] = None
+        self.evidences: Union[EvidenceCorpus, CompactEvidenceCorpus, EvidenceSnapshot]
+        if memory_budget is not None:
+            self.evidences = BudgetedEvidenceCorpus(
+                self.store if self.store is not None else self._open_spill_store(spill_dir),
+                memory_budget,
+                write_through=self.store is not None,
+                metrics=self.metrics
+            )
+        elif compact_corpus:
+            self.evidences = CompactEvidenceCorpus(compress_content)
+        else:
+            self.evidences = EvidenceCorpus(self.store)
+        self.index = self.store if self.store is not None else EvidenceIndex()
+        self.snapshot: Optional[EvidenceSnapshot] = None
+        self.duplicate_policy = duplicate_policy
+        self.duplicates_dropped = 0
+        self.corpus_version = 0
+        self.result_cache = ResultCache(result_cache_size) if result_cache_size > 0 else None
+        self.cache_hit_audit = cache_hit_audit
+        self.scorer: Optional[VectorScorer] = None
+        if vectorized_scoring:
+            self.scorer = VectorScorer()
+            if self.store is not None:
+                for evidence_id, features in self.store.iter_features():
+                    self.scorer.add(evidence_id, features.keywords)
+        self.lsh: Optional[MinHashLSH] = None
+        if approximate_retrieval:
+            self.lsh = MinHashLSH(bands=lsh_bands, rows=lsh_rows)
+            if self.store is not None:
+                for evidence_id, features in self.store.iter_features():
+                    self.lsh.add(evidence_id, features.keywords)
+        self.standing_claims: Dict[str, StandingClaim] = {}
+        self._status_listeners: List[Callable[[ClaimStatusChange], None]] = []
+    
+    def _open_spill_store(self, spill_dir: Optional[str]) -> EvidenceStore:
+        """Store descartável (arquivo temporário) para as evidências despejadas."""
+        fd, self._spill_path = tempfile.mkstemp(prefix="vdp-spill-", suffix=".db", dir=spill_dir)
+        os.close(fd)
+        conn = sqlite3.connect(self._spill_path)
+        # Arquivo de rascunho: nunca recuperado após falha, dispensa journal e fsync
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        return EvidenceStore(conn, deferred_commit=True)
+    
+    def add_evidence(self, evidence: Evidence) -> bool:
+        """
+        Adiciona evidência ao sistema.
+        
+        Evidências criadas fora do IngestionEngine (sem `features`) têm seus
+        atributos calculados aqui, uma única vez. Um ID já presente é tratado
+        como duplicata conforme `duplicate_policy` ("skip" descarta, "merge"
+        acrescenta as chaves de metadata ausentes) e contado em
+        `duplicates_dropped`. Retorna True se a evidência foi adicionada.
+        """
+        self._check_writable()
+        self._check_metadata(evidence.metadata)
+        # Atributos fora da trava; duplicatas (não há remoções) não os calculam
+        features = None if evidence.id in self.evidences else self.truth_seeker._features_of(evidence)
+        with self._lock:
+            if evidence.id in self.evidences:
+                self._handle_duplicate(self.evidences[evidence.id], evidence.metadata)
+                return False
+            if features is None:
+                features = self.truth_seeker._features_of(evidence)
+            # Tudo o que pode falhar vem antes de alterar o corpus e o índice
+            confidence = self._confidence_of(evidence) if isinstance(self.index, EvidenceIndex) else 0.0
+            start = time.perf_counter() if self.metrics is not None else 0.0
+            # Com persist_evidence, evidência e termos gravados num único commit
+            with self.store.transaction() if self.store is not None else nullcontext():
+                self.evidences[evidence.id] = evidence
+                self.index.add(evidence.id, features.keywords, features.numeric_facts)
+            if isinstance(self.index, EvidenceIndex):
+                self.index.set_confidence(evidence.id, confidence)
+            if self.scorer is not None:
+                self.scorer.add(evidence.id, features.keywords)
+            if self.lsh is not None:
+                self.lsh.add(evidence.id, features.keywords)
+            if self.metrics is not None:
+                self.metrics.observe_stage("ingest.index", time.perf_counter() - start)
+                self.metrics.inc("evidences_added_total")
+            # Publica a evidência: é também o limite das visões do modo thread_safe
+            self.corpus_version += 1
+            changes = self._update_standing_claims(evidence.id, features) if self.standing_claims else []
+        # Ouvintes fora da trava: podem verificar ou ingerir sem bloquear os demais
+        for on_change, change in changes:
+            if on_change is not None:
+                on_change(change)
+            for listener in list(self._status_listeners):
+                listener(change)
+        return True
+    
+    def register_standing_claim(
+        self,
+        claim: str,
+        on_change: Optional[Callable[[ClaimStatusChange], None]] = None
+    ) -> VerificationResult:
+        """
+        Registra uma claim reavaliada incrementalmente a cada add_evidence.
+        
+        O estado inicial é montado uma vez a partir dos candidatos do índice;
+        depois, cada nova evidência custa O(atributos da evidência) por claim.
+        `on_change` (e os ouvintes de `add_status_listener`) recebem um
+        ClaimStatusChange quando o ValidationStatus da claim muda. Registrar
+        de novo a mesma claim substitui o estado e o `on_change` anteriores.
+        """
+        with self._lock:
+            return self._register_standing_claim(claim, on_change)
+    
+    def _register_standing_claim(
+        self,
+        claim: str,
+        on_change: Optional[Callable[[ClaimStatusChange], None]]
+    ) -> VerificationResult:
+        standing = StandingClaim(claim, self.truth_seeker, on_change)
+        if standing.numeric_claim:
+            low, high = self.truth_seeker._numeric_range(standing.numeric_claim[1])
+            slack = max(abs(high), 1.0) * 1e-9
+            candidate_ids = self.index.numeric_range(low - slack, high + slack)
+        else:
+            candidate_ids = self.index.candidates(standing.keywords)
+        for evidence in self.truth_seeker._fetch(self.evidences, candidate_ids):
+            standing.observe(evidence.id, self.truth_seeker._features_of(evidence))
+        standing.corpus_size = len(self.evidences)
+        
+        result = standing.result()
+        standing.status = result.status
+        self.standing_claims[claim] = standing
+        return result
+    
+    def unregister_standing_claim(self, claim: str) -> None:
+        with self._lock:
+            self.standing_claims.pop(claim, None)
+    
+    def add_status_listener(self, listener: Callable[[ClaimStatusChange], None]) -> None:
+        """Registra um ouvinte para mudanças de status de qualquer claim permanente."""
+        self._status_listeners.append(listener)
+    
+    def get_standing_results(self) -> Dict[str, VerificationResult]:
+        """Resultados atuais de todas as claims permanentes."""
+        with self._lock:
+            return {claim: standing.result() for claim, standing in self.standing_claims.items()}
+    
+    def _update_standing_claims(
+        self,
+        evidence_id: str,
+        features: EvidenceFeatures
+    ) -> List[Tuple[Optional[Callable[[ClaimStatusChange], None]], ClaimStatusChange]]:
+        """
+        Atualiza as claims permanentes com uma nova evidência (sob a trava) e
+        retorna as mudanças de status, com o `on_change` de cada claim, para
+        notificação depois de liberada a trava.
+        """
+        changes = []
+        for claim, standing in self.standing_claims.items():
+            previous = standing.status
+            standing.observe(evidence_id, features)
+            result = standing.result()
+            if result.status == previous:
+                continue
+            standing.status = result.status
+            self.audit_logger.log_verification(
+                claim, result, {"standing": True, "previous_status": previous.value}
+            )
+            changes.append((standing.on_change, ClaimStatusChange(claim, previous, result, evidence_id)))
+        return changes
+    
+    @staticmethod
+    def _confidence_of(evidence: Evidence) -> float:
+        """metadata['confidence'] para o índice (ordem do fast_verdict="confidence"), avisando se inválido."""
+        value = evidence.metadata.get("confidence")
+        if value is not None and TruthSeeker._parse_confidence(value) is None:
+            logging.warning(f"metadata['confidence'] não numérico em {evidence.id}: {value!r} (tratado como 0.0)")
+        return TruthSeeker._metadata_confidence(evidence)
+    
+    def _check_writable(self) -> None:
+        if self.snapshot is not None:
+            raise TypeError("corpus servido de snapshot é somente leitura (use import_snapshot)")
+    
+    @staticmethod
+    def _check_metadata(metadata: Any) -> None:
+        if not isinstance(metadata, dict):
+            raise TypeError(f"metadata deve ser um dict, não {type(metadata).__name__}")
+    
+    def _handle_duplicate(self, existing: Evidence, metadata: Dict[str, Any]) -> None:
+        """Aplica a política de duplicatas a uma evidência já presente."""
+        self.duplicates_dropped += 1
+        if self.duplicate_policy == "merge":
+            merged = existing.metadata
+            for key, value in metadata.items():
+                merged.setdefault(key, value)
+            self.evidences.update_metadata(existing.id, merged)
+            if isinstance(self.index, EvidenceIndex):
+                self.index.set_confidence(existing.id, self._confidence_of(self.evidences[existing.id]))
+    
+    def add_text_evidence(
+        self, 
+        content: str, 
+        source_type: EvidenceType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Adiciona evidência textual e retorna o ID.
+        
+        Com IDs por conteúdo, duplicatas são detectadas antes da extração de
+        atributos e da auditoria de ingestão.
+        """
+        self._check_writable()
+        if metadata is not None:
+            self._check_metadata(metadata)
+        if self.ingestion_engine.content_addressed:
+            evidence_id = self.ingestion_engine._generate_id(content, source_type, metadata)
+            with self._lock:
+                if evidence_id in self.evidences:
+                    self._handle_duplicate(self.evidences[evidence_id], metadata or {})
+                    return evidence_id
+        evidence = self.ingestion_engine.ingest_text(content, source_type, metadata)
+        self.add_evidence(evidence)
+        return evidence.id
+    
+    def add_json_stream(
+        self,
+        source: Union[str, "os.PathLike[str]", TextIO],
+        batch_size: int = 500
+    ) -> int:
+        """Ingere um arquivo NDJSON/array JSON em streaming e retorna quantas foram adicionadas."""
+        count = 0
+        for evidence in self.ingestion_engine.iter_json_stream(source, batch_size=batch_size):
+            count += self.add_evidence(evidence)
+        return count
+    
+    def _read_view(self, version: int) -> Tuple[Mapping[str, Evidence], Any]:
+        """Corpus e índice de uma leitura (no modo thread_safe, congelados em `version`)."""
+        if not self.thread_safe or self.snapshot is not None:
+            return self.evidences, self.index
+        view = CorpusView(self.evidences, self.index, version, self._lock)
+        return view, view
+    
+    def verify(self, claim: str, full_scan: bool = False) -> VerificationResult:
+        """
+        Verifica uma afirmação contra todas as evidências.
+        
+        `full_scan=True` ignora `fast_verdict` (e resultados em cache que
+        pararam antes do fim), para auditorias que precisam de todas as
+        evidências concordantes.
+        """
+        version = self.corpus_version
+        evidences, index = self._read_view(version)
+        fast_verdict = None if full_scan else self.fast_verdict
+        if self.result_cache is None:
+            return self.truth_seeker.verify_claim(
+                claim, evidences, index=index, scorer=self.scorer, retriever=self.lsh,
+                threshold_pruning=self.threshold_pruning, fast_verdict=fast_verdict
+            )
+        
+        cached = self.result_cache.get(claim, version)
+        if cached is not None and not (full_scan and cached.early_terminated):
+            return self._serve_cached(claim, cached)
+        
+        result = self.truth_seeker.verify_claim(
+            claim, evidences, index=index, scorer=self.scorer, retriever=self.lsh,
+            threshold_pruning=self.threshold_pruning, fast_verdict=fast_verdict
+        )
+        self.result_cache.put(claim, version, result)
+        return self._detached(result, claim)
+    
+    def _serve_cached(self, claim: str, cached: VerificationResult) -> VerificationResult:
+        """Resultado de um acerto do cache, auditado conforme `cache_hit_audit`."""
+        if self.metrics is not None:
+            self.metrics.inc("verify_cache_hits_total")
+        result = self._detached(cached, claim)
+        if self.cache_hit_audit == "compact":
+            self.audit_logger.log_cache_hit(claim, result)
+        elif self.cache_hit_audit == "full":
+            self.audit_logger.log_verification(claim, result, {"cache": "hit"})
+        return result
+    
+    @staticmethod
+    def _detached(result: VerificationResult, claim: str) -> VerificationResult:
+        """Cópia de um resultado em cache que o chamador pode alterar sem afetar o cache."""
+        trace = result.trace
+        return replace(
+            result,
+            claim_checked=claim,
+            reasoning_trace=replace(trace, entries=list(trace.entries), notes=list(trace.notes)),
+            supporting_evidences=list(result.supporting_evidences)
+        )
+    
+    def export_snapshot(self, path: Union[str, "os.PathLike[str]"]) -> int:
+        """
+        Grava o corpus (com atributos e estruturas de busca) num snapshot
+        binário, na ordem de inserção, e retorna quantas evidências gravou.
+        """
+        if self.metrics is not None:
+            start = time.perf_counter()
+        count = EvidenceSnapshot.write(
+            path, self.evidences.values(), self.truth_seeker._features_of, self.truth_seeker.tokenizer.name
+        )
+        if self.metrics is not None:
+            self.metrics.observe_stage("snapshot.export", time.perf_counter() - start)
+        return count
+    
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        **options: Any
+    ) -> "TruthVerificationSystem":
+        """
+        Abre um sistema servido diretamente de um snapshot mapeado em memória.
+        
+        Nada é desserializado: corpus e índice leem o arquivo sob demanda, e
+        vários processos com o mesmo snapshot compartilham as páginas. O
+        corpus é somente leitura; para um sistema que continue recebendo
+        evidências, use `import_snapshot`. `options` são os argumentos do
+        construtor (sem `persist_evidence` nem `compact_corpus`), e o
+        tokenizador deve ser o mesmo da exportação.
+        """
+        if any(
+            options.get(name)
+            for name in ("persist_evidence", "compact_corpus", "threshold_pruning", "memory_budget")
+        ):
+            raise ValueError(
+                "from_snapshot não se combina com persist_evidence, compact_corpus, "
+                "threshold_pruning nem memory_budget"
+            )
+        system = cls(**options)
+        start = time.perf_counter()
+        snapshot = EvidenceSnapshot(path)
+        if snapshot.tokenizer_name != system.truth_seeker.tokenizer.name:
+            snapshot.close()
+            system.close()
+            raise ValueError(
+                f"snapshot gerado com o tokenizador {snapshot.tokenizer_name!r}, "
+                f"sistema usa {system.truth_seeker.tokenizer.name!r}"
+            )
+        system.snapshot = system.evidences = system.index = snapshot
+        if system.scorer is not None or system.lsh is not None:
+            for evidence_id, features in snapshot.iter_features():
+                if system.scorer is not None:
+                    system.scorer.add(evidence_id, features.keywords)
+                if system.lsh is not None:
+                    system.lsh.add(evidence_id, features.keywords)
+        if system.metrics is not None:
+            system.metrics.observe_stage("snapshot.open", time.perf_counter() - start)
+        return system
+    
+    def import_snapshot(self, path: Union[str, "os.PathLike[str]"]) -> int:
+        """
+        Adiciona ao corpus as evidências de um snapshot, com os atributos já
+        calculados (sem tokenizar de novo), e retorna quantas foram
+        adicionadas. Duplicatas seguem `duplicate_policy`.
+        """
+        snapshot = EvidenceSnapshot(path)
+        try:
+            if snapshot.tokenizer_name != self.truth_seeker.tokenizer.name:
+                raise ValueError(
+                    f"snapshot gerado com o tokenizador {snapshot.tokenizer_name!r}, "
+                    f"sistema usa {self.truth_seeker.tokenizer.name!r}"
+                )
+            return sum(self.add_evidence(record.materialize()) for record in snapshot.values())
+        finally:
+            snapshot.close()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Contadores do cache de resultados (vazio se desativado)."""
+        return self.result_cache.stats() if self.result_cache is not None else {}
+    
+    def get_corpus_stats(self) -> Dict[str, Any]:
+        """
+        Residentes, despejos e recargas do corpus com memory_budget, ou linhas
+        vivas e lápides com compact_corpus (vazio nos demais casos).
+        """
+        if isinstance(self.evidences, (BudgetedEvidenceCorpus, CompactEvidenceCorpus)):
+            return self.evidences.stats()
+        return {}
+    
+    def verify_many(
+        self,
+        claims: List[str],
+        workers: Optional[int] = None,
+        chunksize: int = 64
+    ) -> List[VerificationResult]:
+        """
+        Verifica várias afirmações em paralelo, preservando a ordem de entrada.
+        
+        O corpus é enviado uma única vez a cada processo (no initializer do
+        pool); servido de um snapshot, cada processo apenas reabre o arquivo
+        mapeado. Os processos apenas pontuam, com a mesma configuração de
+        `verify` (VectorScorer e MinHash LSH do pai, quando ativos). Com
+        cache de resultados, os acertos não vão aos processos e os novos
+        resultados entram no cache. Os registros de auditoria são gravados
+        em lote pelo processo pai, de modo que a conexão SQLite nunca é
+        compartilhada entre processos.
+        """
+        workers = workers or os.cpu_count() or 1
+        version = self.corpus_version
+        evidences, index = self._read_view(version)
+        results: List[Optional[VerificationResult]] = [None] * len(claims)
+        pending: List[int] = []
+        for position, claim in enumerate(claims):
+            cached = self.result_cache.get(claim, version) if self.result_cache is not None else None
+            if cached is not None:
+                results[position] = self._serve_cached(claim, cached)
+            else:
+                pending.append(position)
+        
+        to_compute = [claims[position] for position in pending]
+        if workers <= 1 or len(to_compute) <= 1:
+            computed = [
+                self.truth_seeker.evaluate_claim(
+                    claim, evidences, index=index, scorer=self.scorer, retriever=self.lsh,
+                    threshold_pruning=self.threshold_pruning, fast_verdict=self.fast_verdict
+                )
+                for claim in to_compute
+            ]
+        else:
+            if self.snapshot is not None:
+                initializer = _init_snapshot_worker
+                initargs = (
+                    self.snapshot.path, self.truth_seeker.tokenizer, self.fast_verdict,
+                    self.scorer, self.lsh
+                )
+            else:
+                initializer = _init_verify_worker
+                initargs = (
+                    list(evidences.values()), self.truth_seeker.tokenizer,
+                    self.threshold_pruning, self.fast_verdict, self.scorer, self.lsh
+                )
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=initializer, initargs=initargs
+            ) as pool:
+                computed = list(pool.map(_evaluate_in_worker, to_compute, chunksize=chunksize))
+        
+        self.audit_logger.log_verifications(computed)
+        for position, result in zip(pending, computed):
+            if self.result_cache is not None:
+                self.result_cache.put(claims[position], version, result)
+                result = self._detached(result, claims[position])
+            results[position] = result
+        return results
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Contadores, latências por etapa e histogramas por claim (vazio se desativado)."""
+        return self.metrics.snapshot() if self.metrics is not None else {}
+    
+    def get_metrics_prometheus(self) -> str:
+        """Métricas no formato texto do Prometheus (vazio se desativado)."""
+        return self.metrics.to_prometheus() if self.metrics is not None else ""
+    
+    def get_audit_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Recupera logs de auditoria."""
+        return self.audit_logger.get_logs(limit)
+    
+    def query_audit_logs(self, **filters: Any) -> AuditPage:
+        """Consulta filtrada e paginada da auditoria (ver AuditLogger.query_logs)."""
+        return self.audit_logger.query_logs(**filters)
+    
+    def close(self) -> None:
+        """Fecha conexões e libera recursos."""
+        if self.store is not None:
+            self.store.commit()
+        if self.snapshot is not None:
+            self.snapshot.close()
+        if self._spill_path is not None:
+            self.evidences.store.conn.close()
+            os.remove(self._spill_path)
+            self._spill_path = None
+        self.audit_logger.close()
+
+
+# Estado de cada processo de verify_many (inicializado uma vez por processo)
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_verify_worker(
+    evidences: List[Evidence],
+    tokenizer: Optional[Tokenizer] = None,
+    threshold_pruning: bool = False,
+    fast_verdict: Optional[str] = None,
+    scorer: Optional[VectorScorer] = None,
+    retriever: Optional[MinHashLSH] = None
+) -> None:
+    """Monta corpus e índice locais ao processo de verificação (scorer e LSH vêm prontos do pai)."""
+    seeker = TruthSeeker(audit_logger=None, tokenizer=tokenizer)
+    index = EvidenceIndex()
+    corpus: Dict[str, Evidence] = {}
+    for evidence in evidences:
+        corpus[evidence.id] = evidence
+        features = seeker._features_of(evidence)
+        index.add(evidence.id, features.keywords, features.numeric_facts)
+        index.set_confidence(evidence.id, seeker._metadata_confidence(evidence))
+    _WORKER_STATE.update(
+        seeker=seeker, index=index, corpus=corpus, scorer=scorer, retriever=retriever,
+        threshold_pruning=threshold_pruning, fast_verdict=fast_verdict
+    )
+
+
+def _init_snapshot_worker(
+    path: str,
+    tokenizer: Optional[Tokenizer] = None,
+    fast_verdict: Optional[str] = None,
+    scorer: Optional[VectorScorer] = None,
+    retriever: Optional[MinHashLSH] = None
+) -> None:
+    """Reabre o snapshot no processo de verificação (páginas compartilhadas)."""
+    snapshot = EvidenceSnapshot(path)
+    seeker = TruthSeeker(audit_logger=None, tokenizer=tokenizer)
+    _WORKER_STATE.update(
+        seeker=seeker, index=snapshot, corpus=snapshot, scorer=scorer, retriever=retriever,
+        fast_verdict=fast_verdict
+    )
+
+
+def _evaluate_in_worker(claim: str) -> VerificationResult:
+    """Avalia uma claim no processo de verificação (sem auditoria)."""
+    return _WORKER_STATE["seeker"].evaluate_claim(
+        claim, _WORKER_STATE["corpus"], index=_WORKER_STATE["index"],
+        scorer=_WORKER_STATE.get("scorer"), retriever=_WORKER_STATE.get("retriever"),
+        threshold_pruning=_WORKER_STATE.get("threshold_pruning", False),
+        fast_verdict=_WORKER_STATE.get("fast_verdict")
+    )
+
+
+# ============================================================================
+# 17. SHARDED SYSTEM - CORPUS DISTRIBUÍDO EM PROCESSOS
+# ============================================================================
+
+class ShardUnavailable(RuntimeError):
+    """Um processo shard encerrou (ou sua conexão caiu); o sistema fica inutilizável."""
+
+
+class ShardTotals(NamedTuple):
+    """Agregados de uma claim sobre todos os shards."""
+    evaluated: int             # Entradas pontuadas
+    supporting: List[str]      # IDs concordantes, em ordem de inserção
+    score_sum: float = 0.0     # Soma das relevâncias (claims textuais)
+    score_max: float = 0.0     # Maior relevância (claims textuais)
+
+
+class ShardPartial(NamedTuple):
+    """
+    Resultado parcial de um shard para uma claim: agregados do corpus local
+    mais apenas as entradas do trace que o nível de detalhe pede.
+    """
+    corpus_size: int   # Evidências no shard
+    scanned: int       # Candidatos avaliados
+    evaluated: int     # Entradas pontuadas (numéricas: candidatos com fatos)
+    supporting: List[Tuple[int, str]]  # (sequência global, ID) concordantes, em ordem
+    score_sum: float   # Soma das relevâncias (claims textuais)
+    score_max: float   # Maior relevância (claims textuais)
+    entries: List[Tuple[int, TraceEntry]]  # Todas, as top-k ou nenhuma, em ordem
+
+
+def _shard_partial(
+    seeker: TruthSeeker,
+    corpus: Dict[str, Evidence],
+    index: EvidenceIndex,
+    sequence: Dict[str, int],
+    claim: str,
+    top_k: Optional[int] = None
+) -> ShardPartial:
+    """
+    Pontua a claim contra o corpus local do shard, como evaluate_claim com
+    índice. `top_k` limita as entradas enviadas (None: todas; 0: nenhuma).
+    """
+    numeric_claim = seeker._extract_numeric_claim(claim)
+    score_sum = score_max = 0.0
+    if numeric_claim:
+        candidates = [corpus[eid] for eid in seeker._numeric_candidates(index, numeric_claim[1])]
+        entries, scanned = seeker._numeric_entries(numeric_claim[1], candidates)
+        trace = ReasoningTrace("", "numeric", entries, claim_value=numeric_claim[1])
+    else:
+        keywords = seeker._extract_keywords(claim)
+        claim_keywords = set(keywords)
+        candidates = [corpus[eid] for eid in index.candidates(keywords)]
+        entries = []
+        for evidence in candidates:
+            relevance = seeker._jaccard(claim_keywords, evidence.features.keywords)
+            entries.append(TraceEntry(evidence.id, relevance, relevance > seeker.TEXTUAL_MATCH_THRESHOLD))
+        scanned = len(candidates)
+        score_sum = math.fsum(entry.score for entry in entries)
+        score_max = max((entry.score for entry in entries), default=0.0)
+        trace = ReasoningTrace("", "textual", entries)
+    shipped = entries
+    if top_k is not None:
+        # Mesma seleção de ReasoningTrace.top_entries; as top-k globais estão
+        # entre as top-k de algum shard
+        shipped = sorted(trace.top_entries(top_k), key=lambda entry: sequence[entry.evidence_id])
+    return ShardPartial(
+        len(corpus),
+        scanned,
+        len(entries),
+        [(sequence[entry.evidence_id], entry.evidence_id) for entry in entries if entry.matched],
+        score_sum,
+        score_max,
+        [(sequence[entry.evidence_id], entry) for entry in shipped]
+    )
+
+
+def _shard_worker(conn: Any, tokenizer: Optional[Tokenizer] = None) -> None:
+    """
+    Laço de um processo shard. Mensagens (tuplas):
+        ("add", [(seq, Evidence), ...])     -> [posições descartadas (IDs duplicados)]
+        ("evaluate", [claim, ...], top_k)   -> [ShardPartial, ...]
+        ("size",)                           -> int
+        ("close",)                          -> encerra
+    """
+    seeker = TruthSeeker(audit_logger=None, tokenizer=tokenizer)
+    index = EvidenceIndex()
+    corpus: Dict[str, Evidence] = {}
+    sequence: Dict[str, int] = {}
+    while True:
+        message = conn.recv()
+        command = message[0]
+        if command == "add":
+            batch = [(seq, evidence) for seq, evidence in message[1] if evidence.id not in corpus]
+            missing = [evidence for _, evidence in batch if evidence.features is None]
+            for evidence, features in zip(
+                missing, seeker.extract_features_many([evidence.content for evidence in missing])
+            ):
+                evidence.features = features
+            dropped = []
+            for position, (seq, evidence) in enumerate(message[1]):
+                if evidence.id in corpus:
+                    dropped.append(position)
+                    continue
+                features = evidence.features
+                corpus[evidence.id] = evidence
+                sequence[evidence.id] = seq
+                index.add(evidence.id, features.keywords, features.numeric_facts)
+                index.set_confidence(evidence.id, seeker._metadata_confidence(evidence))
+            conn.send(dropped)
+        elif command == "evaluate":
+            conn.send([
+                _shard_partial(seeker, corpus, index, sequence, claim, message[2]) for claim in message[1]
+            ])
+        elif command == "size":
+            conn.send(len(corpus))
+        elif command == "close":
+            conn.close()
+            return
+
+
+class ShardedVerificationSystem:
+    """
+    Corpus particionado em `shards` processos pelo hash (crc32) do ID.
+    
+    Cada claim é enviada a todos os shards; cada um devolve agregados do
+    seu corpus local (contagens, soma e máximo das relevâncias, IDs
+    concordantes) e só as entradas do trace que `trace_verbosity` exige:
+    todas (FULL), as `trace_top_k` melhores (TOP_K) ou nenhuma (SUMMARY).
+    O coordenador intercala tudo pela sequência global de inserção e aplica
+    os mesmos vereditos de TruthSeeker. Com FULL, o VerificationResult é o
+    mesmo do caminho com um único processo; nos demais níveis, o trace
+    traz só as entradas pedidas (as contagens do resumo fecham) e a média
+    textual, somada por shard com fsum, pode diferir dele no último bit.
+    
+    Os atributos (palavras-chave e números) são calculados nos shards, em
+    paralelo. Duplicatas de ID são descartadas pelo shard dono e contadas
+    em `duplicates_dropped`; a ingestão só é auditada depois que o shard
+    confirma o lote. Se um shard morre, as operações seguintes levantam
+    ShardUnavailable.
+    """
+    
+    def __init__(
+        self,
+        shards: int = 4,
+        db_path: str = ":memory:",
+        buffered_audit: bool = False,
+        content_addressed_ids: bool = False,
+        batch_size: int = 512,
+        tokenizer: Optional[Tokenizer] = None,
+        trace_verbosity: Optional[Union[TraceVerbosity, str]] = None
+    ):
+        """
+        Args:
+            trace_verbosity: entradas do trace pedidas aos shards; por padrão,
+                o nível do log de auditoria (`audit_logger.trace_verbosity`,
+                com `trace_top_k`).
+        """
+        if shards < 1:
+            raise ValueError("shards deve ser >= 1")
+        self.audit_logger = AuditLogger(db_path, buffered=buffered_audit)
+        self.truth_seeker = TruthSeeker(self.audit_logger, tokenizer=tokenizer)
+        self.ingestion_engine = IngestionEngine(self.audit_logger, content_addressed=content_addressed_ids)
+        self.batch_size = batch_size
+        self.trace_verbosity = TraceVerbosity(trace_verbosity or self.audit_logger.trace_verbosity)
+        self.duplicates_dropped = 0
+        self._sequence = 0
+        # Por shard: (seq, evidência, auditar ingestão) ainda não enviadas e o lote aguardando confirmação
+        self._pending: List[List[Tuple[int, Evidence, bool]]] = [[] for _ in range(shards)]
+        self._unconfirmed: List[List[Tuple[int, Evidence, bool]]] = [[] for _ in range(shards)]
+        self._failed: Set[int] = set()
+        self._conns = []
+        self._processes = []
+        for _ in range(shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_worker, args=(child, self.truth_seeker.tokenizer), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+    
+    @property
+    def shards(self) -> int:
+        return len(self._conns)
+    
+    def shard_of(self, evidence_id: str) -> int:
+        return zlib.crc32(evidence_id.encode("utf-8")) % len(self._conns)
+    
+    # -- Comunicação --------------------------------------------------------
+    
+    def _fail(self, shard: int, cause: BaseException) -> None:
+        self._failed.add(shard)
+        process = self._processes[shard]
+        process.join(timeout=0.5)
+        raise ShardUnavailable(
+            f"shard {shard} indisponível (processo {process.pid}, exitcode={process.exitcode})"
+        ) from cause
+    
+    def _send(self, shard: int, message: Tuple[Any, ...]) -> None:
+        if self._failed:
+            # Respostas pendentes dos demais shards dessincronizariam o protocolo
+            raise ShardUnavailable(f"shard(s) {sorted(self._failed)} indisponível(is)")
+        try:
+            self._conns[shard].send(message)
+        except (EOFError, OSError) as e:
+            self._fail(shard, e)
+    
+    def _recv(self, shard: int) -> Any:
+        try:
+            return self._conns[shard].recv()
+        except (EOFError, OSError) as e:
+            self._fail(shard, e)
+    
+    def _confirm(self, shard: int) -> None:
+        """Recebe a confirmação do último lote do shard e audita o que entrou."""
+        batch, self._unconfirmed[shard] = self._unconfirmed[shard], []
+        if not batch:
+            return
+        dropped = set(self._recv(shard))
+        self.duplicates_dropped += len(dropped)
+        ingested = [
+            evidence for position, (_, evidence, audit) in enumerate(batch)
+            if audit and position not in dropped
+        ]
+        if ingested:
+            self.audit_logger.log_ingestions(ingested)
+    
+    # -- Ingestão -----------------------------------------------------------
+    
+    def _enqueue(self, evidence: Evidence, audit: bool) -> None:
+        shard = self.shard_of(evidence.id)
+        self._pending[shard].append((self._sequence, evidence, audit))
+        self._sequence += 1
+        if len(self._pending[shard]) >= self.batch_size:
+            self._send_pending(shard)
+    
+    def add_evidence(self, evidence: Evidence) -> None:
+        """Enfileira a evidência para o shard dono (enviada em lotes de `batch_size`)."""
+        self._enqueue(evidence, audit=False)
+    
+    def add_text_evidence(
+        self,
+        content: str,
+        source_type: EvidenceType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Adiciona evidência textual e retorna o ID. A ingestão é auditada
+        quando o shard confirma o lote (duplicatas não são auditadas).
+        """
+        evidence = self.ingestion_engine._build_evidence(content, source_type, metadata)
+        self._enqueue(evidence, audit=True)
+        return evidence.id
+    
+    def _send_pending(self, shard: int) -> None:
+        if self._pending[shard]:
+            # No máximo um lote sem confirmação por shard: o anterior já foi processado
+            self._confirm(shard)
+            batch, self._pending[shard] = self._pending[shard], []
+            self._send(shard, ("add", [(seq, evidence) for seq, evidence, _ in batch]))
+            self._unconfirmed[shard] = batch
+    
+    def flush(self) -> None:
+        """Envia os lotes pendentes e espera a confirmação de todos os shards."""
+        for shard in range(len(self._conns)):
+            self._send_pending(shard)
+        for shard in range(len(self._conns)):
+            self._confirm(shard)
+    
+    def __len__(self) -> int:
+        self.flush()
+        for shard in range(len(self._conns)):
+            self._send(shard, ("size",))
+        return sum(self._recv(shard) for shard in range(len(self._conns)))
+    
+    # -- Verificação --------------------------------------------------------
+    
+    def _top_k(self) -> Optional[int]:
+        """Entradas do trace pedidas a cada shard (None: todas)."""
+        if self.trace_verbosity is TraceVerbosity.FULL:
+            return None
+        if self.trace_verbosity is TraceVerbosity.TOP_K:
+            return self.audit_logger.trace_top_k
+        return 0
+    
+    def _gather(self, claims: List[str]) -> List[List[ShardPartial]]:
+        """Envia as claims a todos os shards e devolve, por claim, os parciais."""
+        self.flush()
+        top_k = self._top_k()
+        for shard in range(len(self._conns)):
+            self._send(shard, ("evaluate", claims, top_k))
+        per_shard = [self._recv(shard) for shard in range(len(self._conns))]
+        return [list(partials) for partials in zip(*per_shard)]
+    
+    def _merge(self, claim: str, partials: List[ShardPartial]) -> VerificationResult:
+        """Combina os parciais dos shards no resultado do caminho com um processo."""
+        seeker = self.truth_seeker
+        corpus_size = sum(partial.corpus_size for partial in partials)
+        if not corpus_size:
+            return seeker.evaluate_claim(claim, [])
+        entries = [
+            entry for _, entry in heapq.merge(*(partial.entries for partial in partials), key=itemgetter(0))
+        ]
+        complete = self.trace_verbosity is TraceVerbosity.FULL
+        evaluated = sum(partial.evaluated for partial in partials)
+        supporting = [
+            evidence_id for _, evidence_id
+            in heapq.merge(*(partial.supporting for partial in partials), key=itemgetter(0))
+        ]
+        numeric_claim = seeker._extract_numeric_claim(claim)
+        if numeric_claim:
+            scanned = sum(partial.scanned for partial in partials)
+            status, confidence, supporting, trace = seeker._numeric_outcome(
+                numeric_claim, entries, scanned, corpus_size,
+                supporting=None if complete else supporting,
+                evaluated=None if complete else evaluated
+            )
+        else:
+            totals = None if complete else ShardTotals(
+                evaluated,
+                supporting,
+                math.fsum(partial.score_sum for partial in partials),
+                max(partial.score_max for partial in partials)
+            )
+            status, confidence, supporting, trace = seeker._textual_outcome(
+                claim, [(entry.evidence_id, entry.score) for entry in entries], corpus_size, totals=totals
+            )
+        return VerificationResult(
+            claim_checked=claim,
+            status=status,
+            confidence_score=confidence,
+            supporting_evidences=supporting,
+            reasoning_trace=trace
+        )
+    
+    def verify(self, claim: str) -> VerificationResult:
+        """Verifica uma afirmação em todos os shards (scatter-gather) e audita."""
+        result = self._merge(claim, self._gather([claim])[0])
+        self.audit_logger.log_verification(claim, result)
+        return result
+    
+    def verify_many(self, claims: List[str]) -> List[VerificationResult]:
+        """Verifica várias afirmações numa única rodada de mensagens por shard."""
+        results = [self._merge(claim, partials) for claim, partials in zip(claims, self._gather(claims))]
+        self.audit_logger.log_verifications(results)
+        return results
+    
+    def get_audit_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Recupera logs de auditoria."""
+        return self.audit_logger.get_logs(limit)
+    
+    def close(self) -> None:
+        """Encerra os shards (auditando lotes já confirmáveis) e fecha a auditoria."""
+        for shard, conn in enumerate(self._conns):
+            try:
+                if not self._failed:
+                    self._confirm(shard)
+                conn.send(("close",))
+            except (ShardUnavailable, BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._conns = []
+        self._processes = []
         self.audit_logger.close()
 
 
 # ============================================================================
-# 6. FUNÇÃO MAIN - SIMULAÇÃO REAL
+# 18. FUNÇÃO MAIN - SIMULAÇÃO REAL
 # ============================================================================
 
 def main() -> None: